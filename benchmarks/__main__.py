@@ -0,0 +1,297 @@
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import platform
+import socket
+import sys
+import time
+import tracemalloc
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+
+import binance4py
+from benchmarks.server import MockBinance, serve
+from binance4py import Binance
+from binance4py.dispatch import Dispatcher, InlineDispatcher, TaskDispatcher
+from binance4py.fixedpoint import ExchangeFixed, fixed_type
+from binance4py.signing import HmacSigner
+from binance4py.utils import Quantizer, number_to_string
+from binance4py.websocket import Websocket
+
+API_KEY = "vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A"
+API_SECRET = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+
+DISPATCHERS: Dict[str, Callable[[], Dispatcher]] = {
+    "inline": InlineDispatcher,
+    "task": TaskDispatcher,
+}
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    result = {}
+    for p in (50, 90, 99, 99.9):
+        index = min(len(samples) - 1, int(len(samples) * p / 100))
+        result[f"p{p:g}"] = samples[index]
+    result["max"] = samples[-1]
+    result["mean"] = sum(samples) / len(samples)
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_port(port: int, timeout: float = 10) -> None:
+    deadline = time.time() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            return
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+async def bench_rest(
+    call: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    # Warm up the connection pool
+    await asyncio.gather(*(call() for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "requests_per_second": requests / elapsed,
+        "latency_ms": percentiles(latencies),
+    }
+
+
+def bench_signing(client: Binance, iterations: int) -> Dict[str, Any]:
+    signer = HmacSigner(API_SECRET)
+    payload = (
+        b"symbol=BTCUSDT&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1"
+        b"&price=0.1&recvWindow=5000&timestamp=1499827319559"
+    )
+    url = client._api_url + client._endpoints.create_order
+    params = {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": 1,
+        "price": 0.1,
+    }
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        signer.sign(payload)
+    sign = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client._build_url(url, True, params)
+    build_url = (time.perf_counter() - start) / iterations
+
+    return {
+        "iterations": iterations,
+        "hmac_sign_us": sign * 1e6,
+        "signed_url_us": build_url * 1e6,
+    }
+
+
+def bench_fixedpoint(iterations: int) -> Dict[str, Any]:
+    # ExchangeFixed against Decimal on the same exchange strings
+    price = "20000.12345678"
+    other = "19999.87654321"
+    tick_size = "0.01000000"
+    price_type = fixed_type(tick_size)
+    quantizer = Quantizer(tick_size)
+    a, b = ExchangeFixed(price), ExchangeFixed(other)
+    x, y = Decimal(price), Decimal(other)
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "fixed_parse": lambda: ExchangeFixed(price),
+        "decimal_parse": lambda: Decimal(price),
+        "fixed_round_format": lambda: str(price_type(price, ROUND_DOWN)),
+        "decimal_round_format": lambda: number_to_string(quantizer(price, ROUND_DOWN)),
+        "fixed_add_compare": lambda: a + b > a,
+        "decimal_add_compare": lambda: x + y > x,
+        "fixed_hash": lambda: hash(a),
+        "decimal_hash": lambda: hash(x),
+    }
+    results: Dict[str, Any] = {"iterations": iterations}
+    for name, case in cases.items():
+        start = time.perf_counter()
+        for _ in range(iterations):
+            case()
+        results[f"{name}_us"] = (time.perf_counter() - start) / iterations * 1e6
+    return results
+
+
+async def bench_websocket(
+    client: Binance, url: str, messages: int, dispatcher: str
+) -> Dict[str, Any]:
+    ws = Websocket(client, dispatcher=DISPATCHERS[dispatcher]())
+    ws._websocket_url = url
+    await ws.start()
+
+    done = asyncio.Event()
+    received = 0
+
+    async def callback(data: Any) -> None:
+        nonlocal received
+        received += 1
+        if received == messages:
+            done.set()
+
+    start = time.perf_counter()
+    await ws.subscribe_callback(f"{MockBinance.FLOOD_PREFIX}@trade", callback)
+    await asyncio.wait_for(done.wait(), 600)
+    elapsed = time.perf_counter() - start
+
+    await ws.stop()
+    await ws.wait_stop()
+    return {
+        "dispatcher": dispatcher,
+        "messages": messages,
+        "messages_per_second": messages / elapsed,
+    }
+
+
+async def bench_subscription_memory(
+    client: Binance, url: str, subscriptions: int
+) -> Dict[str, Any]:
+    ws = Websocket(client)
+    ws._websocket_url = url
+    await ws.start()
+
+    async def callback(data: Any) -> None:
+        pass
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(subscriptions):
+        await ws.subscribe_callback(f"sym{i}usdt@trade", callback)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    await ws.stop()
+    await ws.wait_stop()
+    return {
+        "subscriptions": subscriptions,
+        "bytes_per_subscription": (after - before) / subscriptions,
+    }
+
+
+async def run(args: argparse.Namespace, port: int) -> Dict[str, Any]:
+    api_url = f"http://127.0.0.1:{port}/api/"
+    ws_url = f"ws://127.0.0.1:{port}/stream"
+    results: Dict[str, Any] = {}
+
+    def selected(name: str) -> bool:
+        return not args.only or any(name.startswith(o) for o in args.only)
+
+    client = Binance(API_KEY, API_SECRET)
+    client._api_url = api_url
+    async with client:
+        rest = {
+            "rest_ping": client.general.ping,
+            "rest_order_book": lambda: client.market.order_book("BTCUSDT", 100),
+            "rest_account_signed": client.spot.account_info,
+        }
+        for name, call in rest.items():
+            if selected(name):
+                results[name] = await bench_rest(call, args.requests, args.concurrency)
+
+        if selected("signing"):
+            results["signing"] = bench_signing(client, args.iterations)
+
+        if selected("fixedpoint"):
+            results["fixedpoint"] = bench_fixedpoint(args.iterations)
+
+        for dispatcher in DISPATCHERS:
+            name = f"websocket_{dispatcher}"
+            if selected(name):
+                results[name] = await bench_websocket(
+                    client, ws_url, args.messages, dispatcher
+                )
+
+        if selected("subscription_memory"):
+            results["subscription_memory"] = await bench_subscription_memory(
+                client, ws_url, args.subscriptions
+            )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks against a local mock of the Binance api",
+    )
+    parser.add_argument("--latency", type=float, default=0, help="seconds")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--subscriptions", type=int, default=200)
+    parser.add_argument("--only", nargs="*", help="benchmark name prefixes")
+    parser.add_argument("--output", help="json file, stdout by default")
+    args = parser.parse_args(argv)
+
+    # The server runs in its own process so it does not share the event loop
+    port = free_port()
+    server = multiprocessing.Process(
+        target=serve, args=(port, args.latency, args.messages), daemon=True
+    )
+    server.start()
+    try:
+        wait_port(port)
+        results = asyncio.run(run(args, port))
+    finally:
+        server.terminate()
+        server.join()
+
+    report = {
+        "timestamp": int(time.time()),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "binance4py": binance4py.__version__,
+        "aiohttp": aiohttp.__version__,
+        "parameters": {
+            k: v for k, v in vars(args).items() if k not in ("only", "output")
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from aiohttp import WSMsgType, web
+
+from binance4py.endpoints import Endpoints
+
+SYMBOL = "BTCUSDT"
+
+Body = Callable[[web.Request], Any]
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _levels(price: float, step: float, count: int) -> List[List[str]]:
+    return [
+        [f"{price + step * i:.2f}", f"{random.uniform(0.001, 5):.8f}"]
+        for i in range(count)
+    ]
+
+
+def _order_book(request: web.Request) -> Any:
+    limit = int(request.query.get("limit", 100))
+    return {
+        "lastUpdateId": 1027024,
+        "bids": _levels(20000, -0.01, limit),
+        "asks": _levels(20000.01, 0.01, limit),
+    }
+
+
+def _trades(request: web.Request) -> Any:
+    now = int(time.time() * 1000)
+    return [
+        {
+            "id": 28457 + i,
+            "price": "20000.00000000",
+            "qty": "0.01200000",
+            "quoteQty": "240.00000000",
+            "time": now - i,
+            "isBuyerMaker": bool(i % 2),
+            "isBestMatch": True,
+        }
+        for i in range(int(request.query.get("limit", 500)))
+    ]
+
+
+def _klines(request: web.Request) -> Any:
+    start = int(request.query.get("startTime", 0))
+    return [
+        [
+            start + i * 60000,
+            "20000.00000000",
+            "20010.00000000",
+            "19990.00000000",
+            "20005.00000000",
+            "12.50000000",
+            start + i * 60000 + 59999,
+            "250000.00000000",
+            308,
+            "6.20000000",
+            "124000.00000000",
+            "0",
+        ]
+        for i in range(int(request.query.get("limit", 500)))
+    ]
+
+
+def _ticker(request: web.Request) -> Any:
+    return {
+        "symbol": SYMBOL,
+        "priceChange": "-94.99999800",
+        "priceChangePercent": "-95.960",
+        "weightedAvgPrice": "0.29628482",
+        "prevClosePrice": "0.10002000",
+        "lastPrice": "20000.00000000",
+        "lastQty": "200.00000000",
+        "bidPrice": "19999.99000000",
+        "bidQty": "100.00000000",
+        "askPrice": "20000.01000000",
+        "askQty": "100.00000000",
+        "openPrice": "20094.99999800",
+        "highPrice": "20100.00000000",
+        "lowPrice": "19900.10000000",
+        "volume": "8913.30000000",
+        "quoteVolume": "15.30000000",
+        "openTime": 1499783499040,
+        "closeTime": 1499869899040,
+        "firstId": 28385,
+        "lastId": 28460,
+        "count": 76,
+    }
+
+
+def _order(request: web.Request) -> Any:
+    now = int(time.time() * 1000)
+    return {
+        "symbol": request.query.get("symbol", SYMBOL),
+        "orderId": random.randint(1, 1 << 40),
+        "orderListId": -1,
+        "clientOrderId": request.query.get("newClientOrderId", uuid.uuid4().hex),
+        "transactTime": now,
+        "price": request.query.get("price", "0.00000000"),
+        "origQty": request.query.get("quantity", "0.00000000"),
+        "executedQty": "0.00000000",
+        "cummulativeQuoteQty": "0.00000000",
+        "status": "NEW",
+        "timeInForce": request.query.get("timeInForce", "GTC"),
+        "type": request.query.get("type", "LIMIT"),
+        "side": request.query.get("side", "BUY"),
+        "workingTime": now,
+        "selfTradePreventionMode": "NONE",
+    }
+
+
+def _account(request: web.Request) -> Any:
+    return {
+        "makerCommission": 15,
+        "takerCommission": 15,
+        "buyerCommission": 0,
+        "sellerCommission": 0,
+        "canTrade": True,
+        "canWithdraw": True,
+        "canDeposit": True,
+        "updateTime": int(time.time() * 1000),
+        "accountType": "SPOT",
+        "balances": [
+            {"asset": f"A{i}", "free": "4723846.89208129", "locked": "0.00000000"}
+            for i in range(20)
+        ],
+        "permissions": ["SPOT"],
+    }
+
+
+def _exchange_info(request: web.Request) -> Any:
+    return {
+        "timezone": "UTC",
+        "serverTime": int(time.time() * 1000),
+        "rateLimits": [
+            {
+                "rateLimitType": "REQUEST_WEIGHT",
+                "interval": "MINUTE",
+                "intervalNum": 1,
+                "limit": 1200,
+            },
+            {
+                "rateLimitType": "ORDERS",
+                "interval": "SECOND",
+                "intervalNum": 10,
+                "limit": 50,
+            },
+            {
+                "rateLimitType": "ORDERS",
+                "interval": "DAY",
+                "intervalNum": 1,
+                "limit": 160000,
+            },
+        ],
+        "exchangeFilters": [],
+        "symbols": [
+            {
+                "symbol": SYMBOL,
+                "status": "TRADING",
+                "baseAsset": "BTC",
+                "baseAssetPrecision": 8,
+                "quoteAsset": "USDT",
+                "quotePrecision": 8,
+                "quoteAssetPrecision": 8,
+                "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET"],
+                "icebergAllowed": True,
+                "ocoAllowed": True,
+                "isSpotTradingAllowed": True,
+                "isMarginTradingAllowed": True,
+                "filters": [
+                    {
+                        "filterType": "PRICE_FILTER",
+                        "minPrice": "0.01000000",
+                        "maxPrice": "1000000.00000000",
+                        "tickSize": "0.01000000",
+                    },
+                    {
+                        "filterType": "LOT_SIZE",
+                        "minQty": "0.00001000",
+                        "maxQty": "9000.00000000",
+                        "stepSize": "0.00001000",
+                    },
+                ],
+                "permissions": ["SPOT", "MARGIN"],
+            }
+        ],
+    }
+
+
+def _bodies(endpoints: Endpoints) -> Dict[str, Dict[str, Body]]:
+    bodies: Dict[str, Dict[str, Body]] = {}
+
+    def add(method: str, endpoint: str, body: Body) -> None:
+        bodies.setdefault(f"/api/{endpoint}", {})[method] = body
+
+    add("GET", endpoints.ping, lambda r: {})
+    add("GET", endpoints.server_time, lambda r: {"serverTime": int(time.time() * 1000)})
+    add("GET", endpoints.exchange_info, _exchange_info)
+    add("GET", endpoints.order_book, _order_book)
+    add("GET", endpoints.recent_trades, _trades)
+    add("GET", endpoints.old_trades, _trades)
+    add("GET", endpoints.aggregate_trades, lambda r: [])
+    add("GET", endpoints.klines, _klines)
+    add("GET", endpoints.ui_klines, _klines)
+    add("GET", endpoints.average_price, lambda r: {"mins": 5, "price": "20000.0"})
+    add("GET", endpoints.ticker_24hr, _ticker)
+    add(
+        "GET",
+        endpoints.price_ticker,
+        lambda r: {"symbol": SYMBOL, "price": "20000.00000000"},
+    )
+    add("GET", endpoints.order_book_ticker, _ticker)
+    add("GET", endpoints.rolling_window_ticker, _ticker)
+    add("POST", endpoints.create_test_order, lambda r: {})
+    add("POST", endpoints.create_order, _order)
+    add("DELETE", endpoints.cancel_order, _order)
+    add("GET", endpoints.query_order, _order)
+    add("DELETE", endpoints.cancel_all_open_orders, lambda r: [])
+    add("GET", endpoints.open_orders, lambda r: [])
+    add("GET", endpoints.all_orders, lambda r: [])
+    add("GET", endpoints.account_info, _account)
+    add("GET", endpoints.account_trade_list, lambda r: [])
+    add("POST", endpoints.create_listen_key, lambda r: {"listenKey": "bench"})
+    add("PUT", endpoints.keep_alive_listen_key, lambda r: {})
+    add("DELETE", endpoints.close_listen_key, lambda r: {})
+    return bodies
+
+
+def _trade_frames(stream: str, count: int = 1024) -> List[str]:
+    symbol = stream.split("@", 1)[0].upper()
+    now = int(time.time() * 1000)
+    return [
+        _dumps(
+            {
+                "stream": stream,
+                "data": {
+                    "e": "trade",
+                    "E": now + i,
+                    "s": symbol,
+                    "t": 12345 + i,
+                    "p": f"{20000 + random.uniform(-10, 10):.2f}",
+                    "q": f"{random.uniform(0.0001, 1):.5f}",
+                    "b": 88 + i,
+                    "a": 50 + i,
+                    "T": now + i,
+                    "m": bool(i % 2),
+                    "M": True,
+                },
+            }
+        )
+        for i in range(count)
+    ]
+
+
+class MockBinance:
+    # Streams starting with this prefix are flooded with trade frames
+    FLOOD_PREFIX = "flood"
+
+    def __init__(self, latency: float = 0, flood_messages: int = 100000) -> None:
+        self.latency = latency
+        self.flood_messages = flood_messages
+        self._bodies = _bodies(Endpoints())
+        self._used_weight = 0
+        self._weight_reset_at = 0.0
+        self._order_count = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    def _headers(self, request: web.Request) -> Dict[str, str]:
+        now = time.time()
+        if now >= self._weight_reset_at:
+            self._used_weight = 0
+            self._weight_reset_at = (now // 60 + 1) * 60
+        self._used_weight += 1
+
+        headers = {
+            "Content-Type": "application/json;charset=UTF-8",
+            "Server": "nginx",
+            "x-mbx-uuid": str(uuid.uuid4()),
+            "x-mbx-used-weight": str(self._used_weight),
+            "x-mbx-used-weight-1m": str(self._used_weight),
+            "Strict-Transport-Security": "max-age=31536000; includeSubdomains",
+            "X-Frame-Options": "SAMEORIGIN",
+            "X-Xss-Protection": "1; mode=block",
+            "X-Content-Type-Options": "nosniff",
+            "Content-Security-Policy": "default-src 'self'",
+            "X-Content-Security-Policy": "default-src 'self'",
+            "X-WebKit-CSP": "default-src 'self'",
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+        }
+        if request.method in ("POST", "DELETE") and "order" in request.path.lower():
+            self._order_count += 1
+            headers["x-mbx-order-count-10s"] = str(self._order_count % 50)
+            headers["x-mbx-order-count-1d"] = str(self._order_count)
+        return headers
+
+    async def _rest(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        body = self._bodies.get(request.path, {}).get(request.method)
+        if body is None:
+            return web.Response(
+                status=404,
+                text=_dumps({"code": -1000, "msg": "Unknown endpoint."}),
+                headers=self._headers(request),
+            )
+        return web.Response(text=_dumps(body(request)), headers=self._headers(request))
+
+    async def _flood(self, ws: web.WebSocketResponse, stream: str) -> None:
+        frames = _trade_frames(stream)
+        for i in range(self.flood_messages):
+            if ws.closed:
+                return
+            await ws.send_str(frames[i % len(frames)])
+
+    async def _stream(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        streams: Set[str] = set(
+            s for s in request.query.get("streams", "").split("/") if s
+        )
+        tasks = [
+            asyncio.ensure_future(self._flood(ws, s))
+            for s in streams
+            if s.startswith(self.FLOOD_PREFIX)
+        ]
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+
+                data = json.loads(msg.data)
+                params = data.get("params") or []
+                result: Any = None
+                if data["method"] == "SUBSCRIBE":
+                    streams.update(params)
+                elif data["method"] == "UNSUBSCRIBE":
+                    streams.difference_update(params)
+                elif data["method"] == "LIST_SUBSCRIPTIONS":
+                    result = sorted(streams)
+                await ws.send_str(_dumps({"result": result, "id": data["id"]}))
+
+                if data["method"] == "SUBSCRIBE":
+                    tasks.extend(
+                        asyncio.ensure_future(self._flood(ws, s))
+                        for s in params
+                        if s.startswith(self.FLOOD_PREFIX)
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+        return ws
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/stream", self._stream)
+        app.router.add_route("*", "/api/{endpoint:.*}", self._rest)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def serve(port: int, latency: float = 0, flood_messages: int = 100000) -> None:
+    server = MockBinance(latency, flood_messages)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start(port=port))
+    try:
+        loop.run_forever()
+    finally:
+        loop.run_until_complete(server.stop())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock of the Binance api")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--flood-messages", type=int, default=100000)
+    args = parser.parse_args()
+    serve(args.port, args.latency, args.flood_messages)
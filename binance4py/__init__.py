@@ -1,4 +1,28 @@
+from .account import AccountState
 from .api import Binance
+from .candles import CandleBuilder
+from .exchange_info import ExchangeInfoStore
+from .fanout import FanoutPublisher, FanoutSubscriber
+from .orderbook import OrderBook
+from .pipeline import OrderPipeline
+from .ratelimit import RateLimiter
+from .recorder import Recorder, RecordingReader
+from .replay import Replay
+from .websocket_pool import WebsocketPool
 
-__all__ = ["Binance"]
+__all__ = [
+    "AccountState",
+    "Binance",
+    "CandleBuilder",
+    "ExchangeInfoStore",
+    "FanoutPublisher",
+    "FanoutSubscriber",
+    "OrderBook",
+    "OrderPipeline",
+    "RateLimiter",
+    "Recorder",
+    "RecordingReader",
+    "Replay",
+    "WebsocketPool",
+]
 __version__ = "1.0.1"
@@ -0,0 +1,269 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+
+from binance4py.api import Binance
+from binance4py.typing import JsonObject
+
+logger = logging.getLogger(__name__)
+
+CLOSED_ORDER_STATUSES = {
+    "FILLED",
+    "CANCELED",
+    "REJECTED",
+    "EXPIRED",
+    "EXPIRED_IN_MATCH",
+}
+
+
+def execution_report_to_order(event: JsonObject) -> JsonObject:
+    # The same fields as the orders returned by the REST api
+    client_order_id = event["c"]
+    if event["x"] == "CANCELED" and event.get("C"):
+        # A cancel carries the id of the cancel request in c
+        client_order_id = event["C"]
+
+    return {
+        "symbol": event["s"],
+        "orderId": event["i"],
+        "orderListId": event["g"],
+        "clientOrderId": client_order_id,
+        "price": event["p"],
+        "origQty": event["q"],
+        "executedQty": event["z"],
+        "cummulativeQuoteQty": event["Z"],
+        "status": event["X"],
+        "timeInForce": event["f"],
+        "type": event["o"],
+        "side": event["S"],
+        "stopPrice": event["P"],
+        "icebergQty": event["F"],
+        "time": event["O"],
+        "updateTime": event["T"],
+        "isWorking": event.get("w", False),
+        "origQuoteOrderQty": event["Q"],
+    }
+
+
+class AccountState:
+    __slots__ = [
+        "_client",
+        "_reconcile_interval",
+        "_history",
+        "_callback",
+        "_listen_key",
+        "_task",
+        "_synced",
+        "_balances",
+        "_balance_times",
+        "_orders",
+        "_open_orders",
+        "_closed_orders",
+        "_client_order_ids",
+    ]
+
+    def __init__(
+        self,
+        client: Binance,
+        reconcile_interval: float = 60,
+        history: int = 1000,
+        callback: Optional[Callable] = None,
+    ) -> None:
+        self._client = client
+        self._reconcile_interval = reconcile_interval
+        self._history = history
+        self._callback = callback
+
+        self._listen_key: Optional[str] = None
+        self._task: Optional[asyncio.Future] = None
+        self._synced = False
+
+        self._balances: Dict[str, JsonObject] = {}
+        # Time of the account update each balance comes from
+        self._balance_times: Dict[str, int] = {}
+        # Open and recently closed orders by orderId
+        self._orders: Dict[int, JsonObject] = {}
+        self._open_orders: Dict[str, Dict[int, JsonObject]] = {}
+        self._closed_orders: "OrderedDict[int, JsonObject]" = OrderedDict()
+        self._client_order_ids: Dict[str, int] = {}
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    @property
+    def balances(self) -> Dict[str, JsonObject]:
+        return self._balances
+
+    def balance(self, asset: str) -> Optional[JsonObject]:
+        return self._balances.get(asset)
+
+    def order(self, order_id: int) -> Optional[JsonObject]:
+        return self._orders.get(order_id)
+
+    def order_by_client_id(self, client_order_id: str) -> Optional[JsonObject]:
+        order_id = self._client_order_ids.get(client_order_id)
+        if order_id is None:
+            return None
+        return self._orders.get(order_id)
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[JsonObject]:
+        if symbol is not None:
+            return list(self._open_orders.get(symbol, {}).values())
+        return [
+            order for orders in self._open_orders.values() for order in orders.values()
+        ]
+
+    def _forget(self, order: JsonObject) -> None:
+        del self._orders[order["orderId"]]
+        if self._client_order_ids.get(order["clientOrderId"]) == order["orderId"]:
+            del self._client_order_ids[order["clientOrderId"]]
+
+    def _update_order(self, order: JsonObject) -> None:
+        order_id = order["orderId"]
+        current = self._orders.get(order_id)
+        if current is not None and (
+            current["updateTime"] > order["updateTime"]
+            or current["status"] in CLOSED_ORDER_STATUSES
+            and order["status"] not in CLOSED_ORDER_STATUSES
+        ):
+            # Older than what is already known
+            return
+
+        symbol = order["symbol"]
+        self._orders[order_id] = order
+        self._client_order_ids[order["clientOrderId"]] = order_id
+        if order["status"] in CLOSED_ORDER_STATUSES:
+            orders = self._open_orders.get(symbol)
+            if orders is not None:
+                orders.pop(order_id, None)
+                if not orders:
+                    del self._open_orders[symbol]
+            self._closed_orders[order_id] = order
+            self._closed_orders.move_to_end(order_id)
+            while len(self._closed_orders) > self._history:
+                self._forget(self._closed_orders.popitem(last=False)[1])
+        else:
+            self._open_orders.setdefault(symbol, {})[order_id] = order
+
+    def _update_balance(
+        self, asset: str, free: str, locked: str, update_time: int
+    ) -> None:
+        if self._balance_times.get(asset, 0) > update_time:
+            return
+        self._balances[asset] = {"asset": asset, "free": free, "locked": locked}
+        self._balance_times[asset] = update_time
+
+    def _apply(self, event: JsonObject) -> None:
+        event_type = event["e"]
+        if event_type == "executionReport":
+            self._update_order(execution_report_to_order(event))
+        elif event_type == "outboundAccountPosition":
+            for balance in event["B"]:
+                self._update_balance(
+                    balance["a"], balance["f"], balance["l"], event["u"]
+                )
+        elif event_type == "balanceUpdate":
+            asset = event["a"]
+            if self._balance_times.get(asset, 0) >= event["T"]:
+                # Already in a newer account position
+                return
+            balance = self._balances.get(asset)
+            free = Decimal(balance["free"]) if balance is not None else Decimal(0)
+            locked = balance["locked"] if balance is not None else "0"
+            self._update_balance(
+                asset, str(free + Decimal(event["d"])), locked, event["T"]
+            )
+
+    async def _on_event(self, event: JsonObject) -> None:
+        self._apply(event)
+        if self._callback is not None:
+            await self._callback(self, event)
+
+    async def resync(self) -> None:
+        # Events keep being applied meanwhile, the newer state wins by its time
+        requested_at = self._client._timestamp()
+        account, open_orders = await asyncio.gather(
+            self._client.spot.account_info(), self._client.spot.open_orders()
+        )
+
+        for balance in account["balances"]:
+            self._update_balance(
+                balance["asset"],
+                balance["free"],
+                balance["locked"],
+                account["updateTime"],
+            )
+
+        snapshot_ids = set()
+        for order in open_orders:
+            snapshot_ids.add(order["orderId"])
+            self._update_order(order)
+
+        # Orders that were closed while no events were received
+        missing = [
+            order
+            for order in self.open_orders()
+            if order["orderId"] not in snapshot_ids
+            and order["updateTime"] < requested_at
+        ]
+        for order in await asyncio.gather(
+            *(
+                self._client.spot.query_order(order["symbol"], order["orderId"])
+                for order in missing
+            )
+        ):
+            self._update_order(order)
+
+        self._synced = True
+
+    async def _reconciler(self) -> None:
+        while True:
+            await asyncio.sleep(self._reconcile_interval)
+            try:
+                await self.resync()
+            except Exception:
+                # The events keep the state current until the next attempt
+                pass
+
+    async def _on_gap(self, disconnected_at: int, reconnected_at: int) -> None:
+        if self._task is None:
+            # Not started yet, start resyncs anyway
+            return
+
+        # Events of the gap are missing until a resync succeeds
+        self._synced = False
+        try:
+            await self.resync()
+        except Exception:
+            # An error would stop the websocket, the reconciler tries again
+            logger.warning("Account resync after a stream gap failed", exc_info=True)
+
+    async def start(self) -> None:
+        if self._listen_key is not None:
+            return
+
+        self._client.ws.add_gap_callback(self._on_gap)
+        self._listen_key = await self._client.ws.user_data(self._on_event)
+        await self.resync()
+        self._task = asyncio.ensure_future(self._reconciler())
+
+    async def stop(self) -> None:
+        if self._listen_key is None:
+            return
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._client.ws.remove_gap_callback(self._on_gap)
+        await self._client.ws.unsubscribe_callback(self._listen_key, self._on_event)
+        self._listen_key = None
+        self._synced = False
+        self._balances.clear()
+        self._balance_times.clear()
+        self._orders.clear()
+        self._open_orders.clear()
+        self._closed_orders.clear()
+        self._client_order_ids.clear()
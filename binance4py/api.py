@@ -1,15 +1,20 @@
 import json
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
+from binance4py.cache import RequestCache
 from binance4py.client import Client
 from binance4py.endpoints import Endpoints
+from binance4py.metrics import MetricsSink
+from binance4py.ratelimit import RateLimiter
 from binance4py.resources import *
+from binance4py.signing import Signer
 from binance4py.typing import JsonDumper, JsonLoader
 from binance4py.websocket import Websocket
+from binance4py.websocket_api import WebsocketApi
 
 
 class Binance(Client):
-    __slots__ = ["general", "market", "spot", "ws"]
+    __slots__ = ["general", "market", "spot", "ws", "ws_api"]
 
     def __init__(
         self,
@@ -21,6 +26,15 @@ class Binance(Client):
         testnet: bool = False,
         json_dumps: JsonDumper = json.dumps,
         json_loads: JsonLoader = json.loads,
+        rate_limiter: Optional[RateLimiter] = None,
+        signer: Optional[Signer] = None,
+        time_sync: bool = False,
+        recv_window: Optional[int] = None,
+        recv_windows: Optional[Dict[str, int]] = None,
+        trading_transport: str = "rest",
+        metrics: Optional[MetricsSink] = None,
+        market_cache: Optional[RequestCache] = None,
+        latency_routing: Union[bool, List[str]] = False,
     ) -> None:
         super().__init__(
             api_key,
@@ -31,9 +45,26 @@ class Binance(Client):
             testnet,
             json_dumps,
             json_loads,
+            rate_limiter,
+            signer,
+            time_sync,
+            recv_window,
+            recv_windows,
+            metrics,
+            latency_routing,
         )
 
         self.general = General(self)
-        self.market = Market(self)
+        self.market = Market(self, market_cache)
         self.spot = Spot(self)
         self.ws = Websocket(self)
+        self.ws_api = WebsocketApi(self)
+
+        if trading_transport == "websocket":
+            self._ws_api = self.ws_api
+        elif trading_transport != "rest":
+            raise Exception(f"Unknown trading transport: {trading_transport}")
+
+    async def close(self) -> None:
+        await self.ws_api.stop()
+        await super().close()
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+# Seconds a response stays fresh, 0 only merges requests that are in flight
+DEFAULT_TTLS = {
+    "ticker_24hr": 1.0,
+    "price_ticker": 0.5,
+    "order_book_ticker": 0.1,
+    "average_price": 1.0,
+}
+
+CacheKey = Tuple[str, str]
+
+
+class RequestCache:
+    __slots__ = [
+        "_ttls",
+        "_maxsize",
+        "_entries",
+        "_inflight",
+        "_hits",
+        "_merged",
+        "_misses",
+    ]
+
+    def __init__(
+        self, ttls: Optional[Mapping[str, float]] = None, maxsize: int = 1024
+    ) -> None:
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._maxsize = maxsize
+        # Least recently used first, values are (expires_at, response)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._hits = 0
+        self._merged = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self._hits, "merged": self._merged, "misses": self._misses}
+
+    def ttl(self, name: str) -> float:
+        return self._ttls.get(name, 0)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key: CacheKey, ttl: float, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if ttl <= 0 or task.cancelled() or task.exception() is not None:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self, name: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        cache_key = (name, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._hits += 1
+                self._entries.move_to_end(cache_key)
+                return entry[1]
+            del self._entries[cache_key]
+
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self._merged += 1
+        else:
+            self._misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._inflight[cache_key] = task
+            ttl = self.ttl(name)
+            task.add_done_callback(lambda t: self._store(cache_key, ttl, t))
+
+        # A cancelled caller must not cancel the request shared with the others
+        return await asyncio.shield(task)
@@ -0,0 +1,494 @@
+import time
+from array import array
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from binance4py.api import Binance
+from binance4py.typing import JsonObject
+from binance4py.utils import interval_to_milliseconds
+
+# Exchange kline intervals candles can be seeded from
+SEED_INTERVALS = [
+    "1s",
+    "1m",
+    "3m",
+    "5m",
+    "15m",
+    "30m",
+    "1h",
+    "2h",
+    "4h",
+    "6h",
+    "8h",
+    "12h",
+    "1d",
+    "3d",
+    "1w",
+]
+
+# Weekly bars open on Monday, the epoch was a Thursday
+WEEK_OFFSET = 4 * 86400000
+
+
+class Candle(NamedTuple):
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    quote_volume: float
+    trades: int
+
+
+def interval_offset(interval: str) -> int:
+    return WEEK_OFFSET if interval.endswith("w") else 0
+
+
+def seed_interval(interval: str) -> str:
+    ms = interval_to_milliseconds(interval)
+    for source in reversed(SEED_INTERVALS):
+        if ms % interval_to_milliseconds(source) == 0 and (
+            not source.endswith("w") or interval.endswith("w")
+        ):
+            return source
+    raise Exception(f"Interval {interval} is not a multiple of an exchange interval")
+
+
+class CandleSeries:
+    __slots__ = [
+        "_interval",
+        "_interval_ms",
+        "_offset",
+        "_capacity",
+        "_count",
+        "_next",
+        "open_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "quote_volume",
+        "trades",
+        "_open_time",
+        "_open",
+        "_high",
+        "_low",
+        "_close",
+        "_volume",
+        "_quote_volume",
+        "_trades",
+    ]
+
+    def __init__(self, interval: str, capacity: int = 1000) -> None:
+        if interval.endswith("M"):
+            raise Exception("Month intervals are not supported")
+
+        self._interval = interval
+        self._interval_ms = interval_to_milliseconds(interval)
+        self._offset = interval_offset(interval)
+        self._capacity = capacity
+        self._count = 0
+        self._next = 0
+
+        # Ring buffers of closed bars, _next is the slot written next
+        self.open_time = array("q", bytes(8 * capacity))
+        self.open = array("d", bytes(8 * capacity))
+        self.high = array("d", bytes(8 * capacity))
+        self.low = array("d", bytes(8 * capacity))
+        self.close = array("d", bytes(8 * capacity))
+        self.volume = array("d", bytes(8 * capacity))
+        self.quote_volume = array("d", bytes(8 * capacity))
+        self.trades = array("q", bytes(8 * capacity))
+
+        # The bar that is still open, -1 before the first trade
+        self._open_time = -1
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = self._quote_volume = 0.0
+        self._trades = 0
+
+    @property
+    def interval(self) -> str:
+        return self._interval
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Candle:
+        # 0 is the oldest closed bar, -1 the newest
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("candle index out of range")
+
+        i = (self._next - self._count + index) % self._capacity
+        return Candle(
+            self.open_time[i],
+            self.open[i],
+            self.high[i],
+            self.low[i],
+            self.close[i],
+            self.volume[i],
+            self.quote_volume[i],
+            self.trades[i],
+        )
+
+    @property
+    def current(self) -> Optional[Candle]:
+        if self._open_time < 0:
+            return None
+        return Candle(
+            self._open_time,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+            self._quote_volume,
+            self._trades,
+        )
+
+    def to_dict(self) -> Dict[str, array]:
+        # Closed bars in chronological order
+        start = (self._next - self._count) % self._capacity
+        columns = {}
+        for name in (
+            "open_time",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "quote_volume",
+            "trades",
+        ):
+            values = getattr(self, name)
+            if start + self._count <= self._capacity:
+                columns[name] = values[start : start + self._count]
+            else:
+                columns[name] = values[start:] + values[: self._next]
+        return columns
+
+    def bar_start(self, time: int) -> int:
+        return time - (time - self._offset) % self._interval_ms
+
+    def clear(self) -> None:
+        self._count = 0
+        self._next = 0
+        self._open_time = -1
+
+    def _open_bar(self, open_time: int, price: float) -> None:
+        self._open_time = open_time
+        self._open = self._high = self._low = self._close = price
+        self._volume = self._quote_volume = 0.0
+        self._trades = 0
+
+    def _close_bar(self) -> None:
+        i = self._next
+        self.open_time[i] = self._open_time
+        self.open[i] = self._open
+        self.high[i] = self._high
+        self.low[i] = self._low
+        self.close[i] = self._close
+        self.volume[i] = self._volume
+        self.quote_volume[i] = self._quote_volume
+        self.trades[i] = self._trades
+
+        self._next = (i + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def update(self, price: float, quantity: float, time: int, trades: int = 1) -> int:
+        # Returns the number of bars closed by this trade
+        open_time = time - (time - self._offset) % self._interval_ms
+        closed = 0
+        if open_time != self._open_time:
+            if open_time < self._open_time:
+                # A late trade of a bar that is already closed
+                return 0
+
+            if self._open_time >= 0:
+                self._close_bar()
+                # Bars without trades are flat at the last close like exchange klines
+                empty = min(
+                    (open_time - self._open_time) // self._interval_ms - 1,
+                    self._capacity,
+                )
+                for i in range(empty, 0, -1):
+                    self._open_bar(open_time - i * self._interval_ms, self._close)
+                    self._close_bar()
+                # Bars that no longer fit are not reported
+                closed = min(empty + 1, self._count)
+            self._open_bar(open_time, price)
+        elif not self._trades:
+            # The first trade of a bar opened by advance
+            self._open = self._high = self._low = price
+
+        if price > self._high:
+            self._high = price
+        elif price < self._low:
+            self._low = price
+        self._close = price
+        self._volume += quantity
+        self._quote_volume += price * quantity
+        self._trades += trades
+        return closed
+
+    def advance(self, time: int) -> int:
+        # Closes the bars before the one of time, which is opened without trades
+        if self._open_time < 0:
+            return 0
+        return self.update(self._close, 0.0, time, 0)
+
+    def seed(self, klines: List[List]) -> None:
+        # Klines of this or of a smaller interval that divides it, oldest first
+        self.clear()
+        for kline in klines:
+            open_time = self.bar_start(kline[0])
+            high = float(kline[2])
+            low = float(kline[3])
+            if open_time != self._open_time:
+                if self._open_time >= 0:
+                    self._close_bar()
+                self._open_bar(open_time, float(kline[1]))
+                self._high = high
+                self._low = low
+            else:
+                if high > self._high:
+                    self._high = high
+                if low < self._low:
+                    self._low = low
+            self._close = float(kline[4])
+            self._volume += float(kline[5])
+            self._quote_volume += float(kline[7])
+            self._trades += kline[8]
+
+
+class CandleBuilder:
+    __slots__ = [
+        "_client",
+        "_symbol",
+        "_source",
+        "_capacity",
+        "_callback",
+        "_series",
+        "_resync_delay",
+        "_max_resync_delay",
+        "_stream",
+        "_synced",
+        "_resyncing",
+        "_retry_at",
+        "_failures",
+        "_buffer",
+    ]
+
+    def __init__(
+        self,
+        client: Binance,
+        symbol: str,
+        intervals: List[str],
+        capacity: int = 1000,
+        callback: Optional[Callable] = None,
+        source: str = "aggTrade",
+        resync_delay: float = 1,
+        max_resync_delay: float = 60,
+    ) -> None:
+        if source not in ("trade", "aggTrade"):
+            raise Exception(f"Unknown trade source: {source}")
+
+        self._client = client
+        self._symbol = symbol.upper()
+        self._source = source
+        self._capacity = capacity
+        self._callback = callback
+        self._resync_delay = resync_delay
+        self._max_resync_delay = max_resync_delay
+        self._series = {
+            interval: CandleSeries(interval, capacity) for interval in intervals
+        }
+
+        self._stream: Optional[str] = None
+        self._synced = False
+        self._resyncing = False
+        # When a resync from the stream may retry failed kline requests
+        self._retry_at = 0.0
+        self._failures = 0
+        # Trades received while a resync is waiting for the klines
+        self._buffer: List[JsonObject] = []
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    @property
+    def series(self) -> Dict[str, CandleSeries]:
+        return self._series
+
+    def __getitem__(self, interval: str) -> CandleSeries:
+        return self._series[interval]
+
+    async def _apply(self, trade: JsonObject) -> None:
+        price = float(trade["p"])
+        quantity = float(trade["q"])
+        time = trade["T"]
+        # An aggregate trade covers the trades from f to l
+        trades = trade["l"] - trade["f"] + 1 if "f" in trade else 1
+
+        for series in self._series.values():
+            closed = series.update(price, quantity, time, trades)
+            if closed and self._callback is not None:
+                for i in range(closed, 0, -1):
+                    await self._callback(self, series, series[-i])
+
+    async def _on_trade(self, trade: JsonObject) -> None:
+        if self._synced:
+            await self._apply(trade)
+        elif self._resyncing:
+            self._buffer.append(trade)
+        elif self._failures:
+            # Trades before the next resync are in its klines
+            await self._retry()
+
+    async def _klines(self, interval: str, start_time: int, end_time: int) -> List:
+        # Klines opened from start_time until before end_time
+        if start_time >= end_time:
+            return []
+        return [
+            kline
+            async for kline in self._client.market.iter_klines(
+                self._symbol, interval, start_time, end_time - 1
+            )
+            if kline[0] < end_time
+        ]
+
+    async def _seed(self, now: int) -> List[JsonObject]:
+        # Only closed klines are used, an open one would count the trades received
+        # after the request again. The open bars are filled up with minute and
+        # second klines, the trades of the current second are returned
+        minute = now - now % 60000
+        second = now - now % 1000
+
+        # Intervals with the same seed interval share one kline download
+        groups: Dict[str, List[CandleSeries]] = {}
+        for series in self._series.values():
+            groups.setdefault(seed_interval(series.interval), []).append(series)
+
+        seeds = []
+        for interval, group in groups.items():
+            interval_ms = interval_to_milliseconds(interval)
+            open_time = now - (now - interval_offset(interval)) % interval_ms
+            start_times = [
+                series.bar_start(now)
+                - self._capacity * interval_to_milliseconds(series.interval)
+                for series in group
+            ]
+            klines = await self._klines(interval, min(start_times), open_time)
+            for series, start_time in zip(group, start_times):
+                seeds.append(
+                    (series, open_time, [k for k in klines if k[0] >= start_time])
+                )
+
+        first_open_time = min(open_time for _, open_time, _ in seeds)
+        rest = await self._klines("1m", first_open_time, minute)
+        rest += await self._klines("1s", max(first_open_time, minute), second)
+        for series, open_time, klines in seeds:
+            series.seed(klines + [k for k in rest if k[0] >= open_time])
+            series.advance(now)
+
+        return [
+            trade
+            async for trade in self._client.market.iter_aggregate_trades(
+                self._symbol, second, now
+            )
+        ]
+
+    async def resync(self) -> None:
+        if self._resyncing:
+            return
+
+        self._resyncing = True
+        self._synced = False
+        self._buffer.clear()
+        try:
+            now = self._client._timestamp()
+            try:
+                trades = await self._seed(now)
+            except Exception:
+                self._failures += 1
+                self._retry_at = time.monotonic() + min(
+                    self._resync_delay * 2**self._failures, self._max_resync_delay
+                )
+                raise
+            self._failures = 0
+            self._retry_at = 0
+
+            for trade in trades:
+                await self._apply(trade)
+
+            # Trades before the current second are in the klines, the others are
+            # skipped up to the last aggregate trade that was downloaded
+            second = now - now % 1000
+            if self._source == "aggTrade":
+                id_key = "a"
+                last_id = trades[-1]["a"] if trades else -1
+            else:
+                id_key = "t"
+                last_id = trades[-1]["l"] if trades else -1
+            while self._buffer:
+                buffer, self._buffer = self._buffer, []
+                for trade in buffer:
+                    if trade["T"] >= second and trade[id_key] > last_id:
+                        await self._apply(trade)
+            self._synced = True
+        finally:
+            self._resyncing = False
+            self._buffer.clear()
+
+    async def _retry(self) -> None:
+        # Resyncs from the stream, failed kline requests are retried with backoff
+        if self._stream is None or time.monotonic() < self._retry_at:
+            return
+        try:
+            await self.resync()
+        except Exception:
+            pass
+
+    async def _on_gap(self, disconnected_at: int, reconnected_at: int) -> None:
+        if not self._resyncing:
+            self._retry_at = 0
+            await self._retry()
+
+    async def start(self) -> None:
+        if self._stream is not None:
+            return
+
+        self._client.ws.add_gap_callback(self._on_gap)
+        if self._source == "trade":
+            self._stream = await self._client.ws.trade(self._on_trade, self._symbol)
+        else:
+            self._stream = await self._client.ws.aggregate_trade(
+                self._on_trade, self._symbol
+            )
+        await self.resync()
+
+    async def stop(self) -> None:
+        if self._stream is None:
+            return
+
+        self._client.ws.remove_gap_callback(self._on_gap)
+        await self._client.ws.unsubscribe_callback(self._stream, self._on_trade)
+        self._stream = None
+        self._synced = False
+        self._retry_at = 0
+        self._failures = 0
+        self._buffer.clear()
+        for series in self._series.values():
+            series.clear()
@@ -1,18 +1,30 @@
-import hashlib
-import hmac
+import asyncio
 import json
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from urllib.parse import quote
 
-from aiohttp import ClientSession, ContentTypeError
+from aiohttp import ClientError, ClientResponse, ClientSession
+from yarl import URL
 
+from binance4py.cluster import ApiCluster
 from binance4py.endpoints import Endpoints
 from binance4py.exception import BinanceApiException
+from binance4py.metrics import MetricsSink
+from binance4py.ratelimit import ORDER_COUNT_HEADER, WEIGHT_HEADER, RateLimiter
+from binance4py.signing import HmacSigner, Signer
+from binance4py.timesync import TimeSync
 from binance4py.typing import JsonDumper, JsonLoader
-from binance4py.utils import create_query_dict, get_timestamp
+from binance4py.utils import create_query_string, get_timestamp
+
+if TYPE_CHECKING:
+    from binance4py.websocket_api import WebsocketApi
 
 API_URL = "https://api{}.binance.{}/api/"
 API_TEST_URL = "https://testnet.binance.vision/api/"
+API_CLUSTERS = ("", 1, 2, 3, 4)
+
+CONNECTION_ERRORS = (ClientError, asyncio.TimeoutError, OSError)
 
 
 class Client:
@@ -26,6 +38,14 @@ class Client:
         "_json_dumps",
         "_json_loads",
         "_session",
+        "_rate_limiter",
+        "_signer",
+        "_time_sync",
+        "_recv_window",
+        "_recv_windows",
+        "_ws_api",
+        "_metrics",
+        "_api_cluster",
     ]
 
     def __init__(
@@ -38,6 +58,13 @@ class Client:
         testnet: bool = False,
         json_dumps: JsonDumper = json.dumps,
         json_loads: JsonLoader = json.loads,
+        rate_limiter: Optional[RateLimiter] = None,
+        signer: Optional[Signer] = None,
+        time_sync: bool = False,
+        recv_window: Optional[int] = None,
+        recv_windows: Optional[Dict[str, int]] = None,
+        metrics: Optional[MetricsSink] = None,
+        latency_routing: Union[bool, List[str]] = False,
     ) -> None:
         self._api_key = api_key
         self._api_secret = api_secret
@@ -57,17 +84,101 @@ class Client:
             headers["X-MBX-APIKEY"] = self._api_key
         self._session = ClientSession(headers=headers, json_serialize=self._json_dumps)
 
+        self._rate_limiter = rate_limiter
+
+        if signer is None and api_secret is not None:
+            signer = HmacSigner(api_secret)
+        self._signer = signer
+
+        self._time_sync = TimeSync(self) if time_sync else None
+        self._recv_window = recv_window
+        # Endpoint path to recvWindow, e.g. {"v3/order": 2000}
+        self._recv_windows = recv_windows or {}
+
+        # Trading requests are sent through the websocket api when it is set
+        self._ws_api: Optional["WebsocketApi"] = None
+
+        self._metrics = metrics
+
+        # Requests go to the fastest healthy api url instead of _api_url
+        self._api_cluster: Optional[ApiCluster] = None
+        if isinstance(latency_routing, list):
+            self._api_cluster = ApiCluster(self, latency_routing)
+        elif latency_routing and not testnet:
+            self._api_cluster = ApiCluster(
+                self, [API_URL.format(c, self._tld) for c in API_CLUSTERS]
+            )
+
     @property
     def closed(self) -> bool:
         return self._session.closed
 
+    def _timestamp(self) -> int:
+        if self._time_sync is not None:
+            return self._time_sync.timestamp()
+        return get_timestamp()
+
     def _generate_signature(self, query: str) -> str:
-        if self._api_secret is None:
+        if self._signer is None:
             raise Exception("Api secret cannot be None")
 
-        return hmac.new(
-            self._api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        return quote(self._signer.sign(query.encode("utf-8")), safe="")
+
+    def _build_url(
+        self,
+        url: str,
+        signed: bool,
+        params: Optional[Dict[str, Any]],
+        send_url: Optional[str] = None,
+    ) -> Union[str, URL]:
+        query = create_query_string(params) if params else ""
+
+        if signed:
+            recv_window = self._recv_windows.get(
+                url[len(self._api_url) :], self._recv_window
+            )
+            signed_query = f"timestamp={self._timestamp()}"
+            if recv_window is not None:
+                signed_query = f"recvWindow={recv_window}&{signed_query}"
+
+            query = f"{query}&{signed_query}" if query else signed_query
+            query += "&signature=" + self._generate_signature(query)
+
+        if send_url is None:
+            send_url = url
+        if not query:
+            return send_url
+        # Sent exactly as it was signed, aiohttp must not encode it again
+        return URL(f"{send_url}?{query}", encoded=True)
+
+    def _record_response(
+        self,
+        metrics: MetricsSink,
+        method: str,
+        url: str,
+        response: ClientResponse,
+        started_at: float,
+    ) -> None:
+        endpoint = url[len(self._api_url) :] if url.startswith(self._api_url) else url
+        tags = {"method": method, "endpoint": endpoint}
+        # Time until the response headers are received
+        metrics.timing("request_seconds", time.perf_counter() - started_at, tags)
+        metrics.increment(
+            "request_status", tags={**tags, "status": str(response.status)}
+        )
+
+        for name, value in response.headers.items():
+            name = name.upper()
+            if name.startswith(WEIGHT_HEADER):
+                metrics.gauge(
+                    "used_weight", int(value), {"interval": name[len(WEIGHT_HEADER) :]}
+                )
+            elif name.startswith(ORDER_COUNT_HEADER):
+                metrics.gauge(
+                    "order_count",
+                    int(value),
+                    {"interval": name[len(ORDER_COUNT_HEADER) :]},
+                )
 
     async def request(
         self,
@@ -75,33 +186,93 @@ class Client:
         url: str,
         signed: bool = False,
         params: Optional[Dict[str, Any]] = None,
+        weight: int = 1,
+        orders: int = 0,
     ) -> Any:
-        if params is not None:
-            params = create_query_dict(params)
+        if self._ws_api is not None and url.startswith(self._api_url):
+            endpoint = url[len(self._api_url) :]
+            ws_method = self._ws_api.method_for(method, endpoint)
+            if ws_method is not None:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.acquire(weight, orders)
+                return await self._ws_api.request(ws_method, endpoint, signed, params)
 
-        if signed:
-            if params is None:
-                params = {}
-            params["timestamp"] = get_timestamp()
-            params["signature"] = self._generate_signature(urlencode(params))
+        if self._api_cluster is None or not url.startswith(self._api_url):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(weight, orders)
+            return await self._send_request(method, url, signed, params)
+
+        endpoint = url[len(self._api_url) :]
+        tried: List[str] = []
+        while True:
+            api_url = self._api_cluster.best(tried)
+            # Every attempt counts to the limits, which are shared by the clusters
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(weight, orders)
+            try:
+                return await self._send_request(
+                    method, url, signed, params, api_url + endpoint
+                )
+            except (*CONNECTION_ERRORS, BinanceApiException) as e:
+                if isinstance(e, BinanceApiException) and e.status < 500:
+                    raise
+                self._api_cluster.mark_failed(api_url)
+                tried.append(api_url)
+                # Anything but GET may have been executed already
+                if method != "GET" or len(tried) >= len(self._api_cluster.urls):
+                    raise
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        signed: bool,
+        params: Optional[Dict[str, Any]],
+        send_url: Optional[str] = None,
+    ) -> Any:
+        # Built after waiting for the rate limiter so the timestamp is fresh
+        request_url = self._build_url(url, signed, params, send_url)
+
+        started_at = time.perf_counter()
+        async with self._session.request(method, request_url) as response:
+            if self._metrics is not None:
+                self._record_response(self._metrics, method, url, response, started_at)
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response.headers)
+                if response.status in (418, 429):
+                    self._rate_limiter.ban(
+                        float(response.headers.get("Retry-After", 60))
+                    )
 
-        async with self._session.request(method, url, params=params) as response:
             if not response.ok:
-                raise BinanceApiException(response, await response.text())
+                error_msg = await response.text()
+                if self._time_sync is not None and "-1021" in error_msg:
+                    # The timestamp was outside of recvWindow, resync at once
+                    asyncio.ensure_future(self._time_sync.sample())
+                raise BinanceApiException(response, error_msg)
 
-            try:
-                return await response.json(loads=self._json_loads)
-            except ContentTypeError:
+            if "json" not in response.content_type:
                 raise Exception(
                     f"Invalid response content type: {response.content_type}"
                 )
+            # Bytes go straight to the loader without decoding to str first
+            return self._json_loads(await response.read())
 
     async def open(self) -> "Client":
+        if self._time_sync is not None:
+            await self._time_sync.start()
+        if self._api_cluster is not None:
+            await self._api_cluster.start()
         return self
 
     async def close(self) -> None:
         if self.closed:
             return
+        if self._time_sync is not None:
+            await self._time_sync.stop()
+        if self._api_cluster is not None:
+            await self._api_cluster.stop()
         await self._session.close()
 
     async def __aenter__(self) -> "Client":
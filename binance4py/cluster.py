@@ -0,0 +1,92 @@
+import asyncio
+import time
+from typing import Collection, Dict, List, Optional
+
+
+class ApiCluster:
+    __slots__ = ["_client", "_urls", "_interval", "_latencies", "_failed", "_task"]
+
+    def __init__(self, client, urls: List[str], interval: float = 30) -> None:
+        self._client = client
+        # The first url is used until the others are measured
+        self._urls = urls
+        self._interval = interval
+        # Smoothed ping round trip time in seconds
+        self._latencies: Dict[str, float] = {}
+        self._failed: Dict[str, float] = {}
+        self._task: Optional[asyncio.Future] = None
+
+    @property
+    def urls(self) -> List[str]:
+        return self._urls
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        return dict(self._latencies)
+
+    @property
+    def healthy(self) -> List[str]:
+        return [url for url in self._urls if url not in self._failed]
+
+    def best(self, exclude: Collection[str] = ()) -> str:
+        candidates = [url for url in self._urls if url not in exclude]
+        if not candidates:
+            candidates = self._urls
+
+        healthy = [url for url in candidates if url not in self._failed]
+        if not healthy:
+            # Everything failed, try the one that failed first again
+            return min(candidates, key=lambda url: self._failed[url])
+
+        return min(
+            healthy,
+            key=lambda url: (url not in self._latencies, self._latencies.get(url, 0)),
+        )
+
+    def mark_failed(self, url: str) -> None:
+        # Unhealthy until the next successful ping
+        self._failed.setdefault(url, time.monotonic())
+
+    async def ping(self, url: str) -> None:
+        client = self._client
+        if client._rate_limiter is not None:
+            await client._rate_limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            async with client._session.get(url + client._endpoints.ping) as response:
+                await response.read()
+                if client._rate_limiter is not None:
+                    client._rate_limiter.update(response.headers)
+                if response.status >= 500:
+                    raise Exception(f"Server error {response.status}")
+        except Exception:
+            self.mark_failed(url)
+            return
+        rtt = time.perf_counter() - start
+
+        self._failed.pop(url, None)
+        latency = self._latencies.get(url)
+        self._latencies[url] = rtt if latency is None else latency * 0.7 + rtt * 0.3
+
+    async def ping_all(self) -> None:
+        await asyncio.gather(*(self.ping(url) for url in self._urls))
+
+    async def _pinger(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.ping_all()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.ping_all()
+        self._task = asyncio.ensure_future(self._pinger())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
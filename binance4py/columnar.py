@@ -0,0 +1,129 @@
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Tuple, Type, TypeVar
+
+# (column name, array typecode, row key)
+ColumnSpec = Tuple[str, str, Any]
+
+NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "bool"}
+
+T = TypeVar("T", bound="Columns")
+
+
+class Columns:
+    __slots__: Tuple[str, ...] = ()
+    _columns: Tuple[ColumnSpec, ...] = ()
+
+    def __init__(self) -> None:
+        for name, typecode, _ in self._columns:
+            setattr(self, name, array(typecode))
+
+    @classmethod
+    def from_rows(cls: Type[T], rows: List[Any]) -> T:
+        columns = cls()
+        columns.extend(rows)
+        return columns
+
+    def __len__(self) -> int:
+        return len(getattr(self, self._columns[0][0]))
+
+    def extend(self, rows: List[Any]) -> None:
+        for name, typecode, key in self._columns:
+            values: Iterable[Any] = map(itemgetter(key), rows)
+            if typecode == "d":
+                values = map(float, values)
+            getattr(self, name).extend(values)
+
+    def to_dict(self) -> Dict[str, array]:
+        return {name: getattr(self, name) for name, _, _ in self._columns}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        import numpy as np
+
+        return {
+            name: np.frombuffer(getattr(self, name), dtype=NUMPY_DTYPES[typecode])
+            for name, typecode, _ in self._columns
+        }
+
+    def to_pandas(self) -> Any:
+        import pandas as pd
+
+        return pd.DataFrame(self.to_numpy(), copy=False)
+
+    def to_arrow(self) -> Any:
+        import pyarrow as pa
+
+        return pa.table(self.to_numpy())
+
+
+class KlineColumns(Columns):
+    __slots__ = (
+        "open_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "close_time",
+        "quote_volume",
+        "trades",
+        "taker_buy_base_volume",
+        "taker_buy_quote_volume",
+    )
+    _columns = (
+        ("open_time", "q", 0),
+        ("open", "d", 1),
+        ("high", "d", 2),
+        ("low", "d", 3),
+        ("close", "d", 4),
+        ("volume", "d", 5),
+        ("close_time", "q", 6),
+        ("quote_volume", "d", 7),
+        ("trades", "q", 8),
+        ("taker_buy_base_volume", "d", 9),
+        ("taker_buy_quote_volume", "d", 10),
+    )
+
+
+class TradeColumns(Columns):
+    __slots__ = (
+        "id",
+        "price",
+        "qty",
+        "quote_qty",
+        "time",
+        "is_buyer_maker",
+        "is_best_match",
+    )
+    _columns = (
+        ("id", "q", "id"),
+        ("price", "d", "price"),
+        ("qty", "d", "qty"),
+        ("quote_qty", "d", "quoteQty"),
+        ("time", "q", "time"),
+        ("is_buyer_maker", "b", "isBuyerMaker"),
+        ("is_best_match", "b", "isBestMatch"),
+    )
+
+
+class AggTradeColumns(Columns):
+    __slots__ = (
+        "agg_id",
+        "price",
+        "qty",
+        "first_id",
+        "last_id",
+        "time",
+        "is_buyer_maker",
+        "is_best_match",
+    )
+    _columns = (
+        ("agg_id", "q", "a"),
+        ("price", "d", "p"),
+        ("qty", "d", "q"),
+        ("first_id", "q", "f"),
+        ("last_id", "q", "l"),
+        ("time", "q", "T"),
+        ("is_buyer_maker", "b", "m"),
+        ("is_best_match", "b", "M"),
+    )
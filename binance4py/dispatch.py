@@ -0,0 +1,160 @@
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Set
+
+ErrorHandler = Callable[[BaseException], None]
+
+
+class Dispatcher(ABC):
+    __slots__ = ["_on_error"]
+
+    def __init__(self) -> None:
+        self._on_error: Optional[ErrorHandler] = None
+
+    def bind(self, on_error: ErrorHandler) -> None:
+        self._on_error = on_error
+
+    def _handle_exception(self, exp: BaseException) -> None:
+        if self._on_error is not None:
+            self._on_error(exp)
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        return {}
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def join(self) -> None:
+        # Waits until the dispatched callbacks are done
+        pass
+
+    @abstractmethod
+    async def dispatch(self, stream: str, callbacks: List[Callable], data: Any) -> None:
+        pass
+
+
+class TaskDispatcher(Dispatcher):
+    __slots__ = ["_tasks"]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        return {"tasks": len(self._tasks)}
+
+    async def join(self) -> None:
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled():
+            exp = task.exception()
+            if exp is not None:
+                self._handle_exception(exp)
+
+    async def dispatch(self, stream: str, callbacks: List[Callable], data: Any) -> None:
+        for callback in callbacks:
+            task = asyncio.create_task(callback(data))
+            self._tasks.add(task)
+            task.add_done_callback(self._done)
+
+
+class InlineDispatcher(Dispatcher):
+    __slots__ = ()
+
+    async def dispatch(self, stream: str, callbacks: List[Callable], data: Any) -> None:
+        for callback in callbacks:
+            try:
+                await callback(data)
+            except Exception as e:
+                self._handle_exception(e)
+
+
+class QueueDispatcher(Dispatcher):
+    __slots__ = [
+        "_workers",
+        "_maxsize",
+        "_overflow",
+        "_queues",
+        "_stream_queues",
+        "_tasks",
+        "_dropped",
+    ]
+
+    def __init__(
+        self, workers: int = 4, maxsize: int = 0, overflow: str = "block"
+    ) -> None:
+        super().__init__()
+        if overflow not in ("block", "drop_oldest"):
+            raise Exception(f"Unknown overflow policy: {overflow}")
+
+        self._workers = workers
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._queues: List[asyncio.Queue] = []
+        self._stream_queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._dropped = 0
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        return {f"worker{i}": queue.qsize() for i, queue in enumerate(self._queues)}
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            callbacks, data = await queue.get()
+            for callback in callbacks:
+                try:
+                    await callback(data)
+                except Exception as e:
+                    self._handle_exception(e)
+            queue.task_done()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+
+        self._queues = [asyncio.Queue(self._maxsize) for _ in range(self._workers)]
+        self._tasks = [
+            asyncio.create_task(self._worker(queue)) for queue in self._queues
+        ]
+
+    async def join(self) -> None:
+        for queue in self._queues:
+            await queue.join()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+        self._stream_queues.clear()
+
+    async def dispatch(self, stream: str, callbacks: List[Callable], data: Any) -> None:
+        queue = self._stream_queues.get(stream)
+        if queue is None:
+            # A stream is always served by the same worker to keep its messages in order
+            queue = self._queues[zlib.crc32(stream.encode()) % len(self._queues)]
+            self._stream_queues[stream] = queue
+
+        if self._overflow == "drop_oldest":
+            if queue.full():
+                queue.get_nowait()
+                queue.task_done()
+                self._dropped += 1
+            queue.put_nowait((callbacks, data))
+        else:
+            await queue.put((callbacks, data))
@@ -1,10 +1,25 @@
+import json
 from inspect import cleandoc
+from typing import Any, Optional
 
 from aiohttp import ClientResponse
 
+from binance4py.typing import JsonObject
+
 
 class BinanceApiException(Exception):
     def __init__(self, response: ClientResponse, error_msg: str) -> None:
+        self.status = response.status
+        # The error code and data of a json error body
+        self.code: Optional[int] = None
+        self.data: Any = None
+        try:
+            error = json.loads(error_msg)
+        except ValueError:
+            error = None
+        if isinstance(error, dict):
+            self.code = error.get("code")
+            self.data = error.get("data")
         super().__init__(
             "\n"
             + cleandoc(
@@ -14,3 +29,11 @@ class BinanceApiException(Exception):
             """
             )
         )
+
+
+class BinanceWebsocketException(Exception):
+    def __init__(self, error: JsonObject) -> None:
+        self.code = error["code"]
+        self.msg = error["msg"]
+        self.data = error.get("data")
+        super().__init__(f"Websocket error code {self.code}. {self.msg}")
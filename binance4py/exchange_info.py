@@ -0,0 +1,201 @@
+import asyncio
+import os
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+from binance4py.api import Binance
+from binance4py.fixedpoint import Fixed, fixed_type
+from binance4py.typing import JsonObject
+from binance4py.utils import Quantizer
+
+
+class SymbolInfo:
+    __slots__ = [
+        "symbol",
+        "status",
+        "base_asset",
+        "quote_asset",
+        "base_asset_precision",
+        "quote_asset_precision",
+        "order_types",
+        "permissions",
+        "filters",
+        "min_price",
+        "max_price",
+        "tick_size",
+        "min_qty",
+        "max_qty",
+        "step_size",
+        "min_notional",
+        "price_quantizer",
+        "quantity_quantizer",
+        "price_type",
+        "quantity_type",
+    ]
+
+    def __init__(self, data: JsonObject) -> None:
+        self.symbol: str = data["symbol"]
+        self.status: str = data["status"]
+        self.base_asset: str = data["baseAsset"]
+        self.quote_asset: str = data["quoteAsset"]
+        self.base_asset_precision: int = data["baseAssetPrecision"]
+        self.quote_asset_precision: int = data["quoteAssetPrecision"]
+        self.order_types: Tuple[str, ...] = tuple(data["orderTypes"])
+        self.permissions: Tuple[str, ...] = tuple(data["permissions"])
+        self.filters: Dict[str, JsonObject] = {
+            f["filterType"]: f for f in data["filters"]
+        }
+
+        price_filter = self.filters.get("PRICE_FILTER", {})
+        self.min_price = Decimal(price_filter.get("minPrice", "0"))
+        self.max_price = Decimal(price_filter.get("maxPrice", "0"))
+        self.tick_size = Decimal(price_filter.get("tickSize", "0"))
+
+        lot_size = self.filters.get("LOT_SIZE", {})
+        self.min_qty = Decimal(lot_size.get("minQty", "0"))
+        self.max_qty = Decimal(lot_size.get("maxQty", "0"))
+        self.step_size = Decimal(lot_size.get("stepSize", "0"))
+
+        notional = self.filters.get("NOTIONAL") or self.filters.get("MIN_NOTIONAL", {})
+        self.min_notional = Decimal(notional.get("minNotional", "0"))
+
+        self.price_quantizer = Quantizer(self.tick_size) if self.tick_size else None
+        self.quantity_quantizer = Quantizer(self.step_size) if self.step_size else None
+        self.price_type: Optional[Type[Fixed]] = (
+            fixed_type(self.tick_size) if self.tick_size else None
+        )
+        self.quantity_type: Optional[Type[Fixed]] = (
+            fixed_type(self.step_size) if self.step_size else None
+        )
+
+    @property
+    def trading(self) -> bool:
+        return self.status == "TRADING"
+
+    def quantize_price(
+        self, price: Union[str, int, float, Decimal], rounding: Optional[str] = None
+    ) -> Decimal:
+        if self.price_quantizer is None:
+            raise Exception(f"{self.symbol} has no tick size")
+        return self.price_quantizer(price, rounding)
+
+    def quantize_quantity(
+        self, quantity: Union[str, int, float, Decimal], rounding: Optional[str] = None
+    ) -> Decimal:
+        if self.quantity_quantizer is None:
+            raise Exception(f"{self.symbol} has no step size")
+        return self.quantity_quantizer(quantity, rounding)
+
+
+class ExchangeInfoStore:
+    __slots__ = [
+        "_client",
+        "_ttl",
+        "_path",
+        "_symbols",
+        "_rate_limits",
+        "_updated_at",
+        "_task",
+    ]
+
+    def __init__(
+        self, client: Binance, ttl: float = 3600, path: Optional[str] = None
+    ) -> None:
+        self._client = client
+        self._ttl = ttl
+        self._path = path
+
+        self._symbols: Dict[str, SymbolInfo] = {}
+        self._rate_limits: List[JsonObject] = []
+        self._updated_at = 0.0
+        self._task: Optional[asyncio.Future] = None
+
+    def __getitem__(self, symbol: str) -> SymbolInfo:
+        return self._symbols[symbol.upper()]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._symbols
+
+    def get(self, symbol: str) -> Optional[SymbolInfo]:
+        return self._symbols.get(symbol.upper())
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    @property
+    def rate_limits(self) -> List[JsonObject]:
+        return self._rate_limits
+
+    @property
+    def updated_at(self) -> float:
+        return self._updated_at
+
+    @property
+    def expired(self) -> bool:
+        return time.time() - self._updated_at >= self._ttl
+
+    def _index(self, exchange_info: JsonObject, updated_at: float) -> None:
+        # The new index replaces the old one at once so readers never see a mix
+        self._symbols = {s["symbol"]: SymbolInfo(s) for s in exchange_info["symbols"]}
+        self._rate_limits = exchange_info["rateLimits"]
+        self._updated_at = updated_at
+
+    def _read_snapshot(self) -> Optional[JsonObject]:
+        if self._path is None or not os.path.exists(self._path):
+            return None
+        with open(self._path, "r", encoding="utf-8") as f:
+            return self._client._json_loads(f.read())
+
+    def _write_snapshot(self, path: str, snapshot: JsonObject) -> None:
+        # Written next to the target first so a crash never leaves half a file
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(self._client._json_dumps(snapshot))
+        os.replace(path + ".tmp", path)
+
+    async def refresh(self) -> None:
+        exchange_info = await self._client.general.exchange_info()
+        updated_at = time.time()
+        self._index(exchange_info, updated_at)
+
+        if self._path is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._write_snapshot,
+                self._path,
+                {"updatedAt": updated_at, "exchangeInfo": exchange_info},
+            )
+
+    async def load(self) -> None:
+        snapshot = await asyncio.get_running_loop().run_in_executor(
+            None, self._read_snapshot
+        )
+        if snapshot is None:
+            await self.refresh()
+        else:
+            # A stale snapshot is still served, the refresher replaces it right away
+            self._index(snapshot["exchangeInfo"], snapshot["updatedAt"])
+
+    async def _refresher(self) -> None:
+        while True:
+            await asyncio.sleep(max(self._updated_at + self._ttl - time.time(), 0))
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep serving the previous data and try again later
+                await asyncio.sleep(min(self._ttl, 60))
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.load()
+        self._task = asyncio.ensure_future(self._refresher())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
@@ -0,0 +1,329 @@
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from binance4py.typing import JsonObject
+
+# Records written, slot capacity, slot size and the record layout name
+RING_HEADER = struct.Struct("<QII16s")
+RING_HEADER_SIZE = 64
+# Number of the record in a slot, 0 while it is being written
+SLOT_HEADER = struct.Struct("<Q")
+
+
+class TradeRecord(NamedTuple):
+    event_time: int
+    trade_id: int
+    price: float
+    quantity: float
+    trade_time: int
+    is_buyer_maker: bool
+
+
+class AggTradeRecord(NamedTuple):
+    event_time: int
+    aggregate_trade_id: int
+    price: float
+    quantity: float
+    first_trade_id: int
+    last_trade_id: int
+    trade_time: int
+    is_buyer_maker: bool
+
+
+class KlineRecord(NamedTuple):
+    event_time: int
+    open_time: int
+    close_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    quote_volume: float
+    trades: int
+    closed: bool
+
+
+class BookTickerRecord(NamedTuple):
+    update_id: int
+    bid_price: float
+    bid_quantity: float
+    ask_price: float
+    ask_quantity: float
+
+
+class RecordLayout:
+    __slots__ = ["name", "record", "struct", "_keys", "_numbers"]
+
+    def __init__(
+        self, name: str, record: Type[Any], format: str, keys: List[str]
+    ) -> None:
+        self.name = name
+        self.record = record
+        self.struct = struct.Struct(format)
+        self._keys = keys
+        # Fields sent as strings that are packed as doubles
+        self._numbers = [i for i, f in enumerate(format[1:]) if f == "d"]
+
+    def values(self, data: JsonObject) -> List[Any]:
+        if "k" in data and "k" not in self._keys:
+            # Kline fields are nested in k
+            data = {**data["k"], "E": data["E"]}
+        values = [data[key] for key in self._keys]
+        for i in self._numbers:
+            values[i] = float(values[i])
+        return values
+
+
+LAYOUTS = {
+    layout.name: layout
+    for layout in (
+        RecordLayout("trade", TradeRecord, "<qqddq?", ["E", "t", "p", "q", "T", "m"]),
+        RecordLayout(
+            "aggTrade",
+            AggTradeRecord,
+            "<qqddqqq?",
+            ["E", "a", "p", "q", "f", "l", "T", "m"],
+        ),
+        RecordLayout(
+            "kline",
+            KlineRecord,
+            "<qqqddddddq?",
+            ["E", "t", "T", "o", "h", "l", "c", "v", "q", "n", "x"],
+        ),
+        RecordLayout(
+            "bookTicker",
+            BookTickerRecord,
+            "<qdddd",
+            ["u", "b", "B", "a", "A"],
+        ),
+    )
+}
+
+
+def stream_layout(stream: str) -> RecordLayout:
+    # Streams with a fixed record layout: trade, aggTrade, kline_* and bookTicker
+    kind = stream.split("@", 1)[-1].split("_", 1)[0]
+    layout = LAYOUTS.get(kind)
+    if layout is None:
+        raise Exception(f"Stream {stream} has no fixed record layout")
+    return layout
+
+
+def ring_name(prefix: str, stream: str) -> str:
+    # Shared memory names are short on some systems
+    return f"{prefix}_{zlib.crc32(stream.encode()):08x}"
+
+
+def _shared_memory(name: str, create: bool = False, size: int = 0) -> Any:
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:
+        raise Exception("Shared memory fan-out requires Python 3.8 or newer")
+
+    shm: Any = SharedMemory(name, create=create, size=size)
+    if os.name == "posix":
+        # The resource tracker would remove the memory when any process using it
+        # exits, the publisher removes it on close instead
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink(shm: Any) -> None:
+    if os.name == "posix":
+        # unlink unregisters it from the resource tracker again
+        from multiprocessing import resource_tracker
+
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+class SharedRing:
+    __slots__ = [
+        "_shm",
+        "_buffer",
+        "_capacity",
+        "_slot_size",
+        "_layout",
+        "_written",
+        "_owner",
+    ]
+
+    def __init__(self, shm: Any, owner: bool) -> None:
+        self._shm = shm
+        self._buffer = shm.buf
+        self._owner = owner
+        written, capacity, slot_size, name = RING_HEADER.unpack_from(self._buffer, 0)
+        self._written = written
+        self._capacity = capacity
+        self._slot_size = slot_size
+        self._layout = LAYOUTS[name.rstrip(b"\0").decode()]
+
+    @classmethod
+    def create(cls, name: str, layout: RecordLayout, capacity: int) -> "SharedRing":
+        # Slots are 8 byte aligned
+        slot_size = (SLOT_HEADER.size + layout.struct.size + 7) // 8 * 8
+        size = RING_HEADER_SIZE + capacity * slot_size
+        try:
+            shm = _shared_memory(name, True, size)
+        except FileExistsError:
+            # Left behind by a publisher that did not close
+            stale = _shared_memory(name)
+            stale.close()
+            _unlink(stale)
+            shm = _shared_memory(name, True, size)
+
+        RING_HEADER.pack_into(shm.buf, 0, 0, capacity, slot_size, layout.name.encode())
+        return cls(shm, True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRing":
+        return cls(_shared_memory(name), False)
+
+    @property
+    def layout(self) -> RecordLayout:
+        return self._layout
+
+    @property
+    def written(self) -> int:
+        return RING_HEADER.unpack_from(self._buffer, 0)[0]
+
+    def write(self, values: List[Any]) -> None:
+        n = self._written
+        offset = RING_HEADER_SIZE + n % self._capacity * self._slot_size
+        buffer = self._buffer
+        SLOT_HEADER.pack_into(buffer, offset, 0)
+        self._layout.struct.pack_into(buffer, offset + SLOT_HEADER.size, *values)
+        SLOT_HEADER.pack_into(buffer, offset, n + 1)
+        self._written = n + 1
+        SLOT_HEADER.pack_into(buffer, 0, n + 1)
+
+    def read(self, cursor: int, limit: int) -> Tuple[int, List[Any], int]:
+        # Returns the next cursor, the records and how many were overwritten unread
+        buffer = self._buffer
+        written = SLOT_HEADER.unpack_from(buffer, 0)[0]
+        dropped = 0
+        if written - cursor > self._capacity:
+            dropped = written - self._capacity - cursor
+            cursor = written - self._capacity
+
+        records = []
+        make = self._layout.record._make
+        unpack = self._layout.struct.unpack_from
+        end = min(written, cursor + limit)
+        while cursor < end:
+            offset = RING_HEADER_SIZE + cursor % self._capacity * self._slot_size
+            values = unpack(buffer, offset + SLOT_HEADER.size)
+            if SLOT_HEADER.unpack_from(buffer, offset)[0] != cursor + 1:
+                # Overwritten while it was read
+                dropped += 1
+            else:
+                records.append(make(values))
+            cursor += 1
+        return cursor, records, dropped
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            _unlink(self._shm)
+
+
+class RingWriter:
+    __slots__ = ["ring"]
+
+    def __init__(self, ring: SharedRing) -> None:
+        self.ring = ring
+
+    async def __call__(self, data: JsonObject) -> None:
+        self.ring.write(self.ring.layout.values(data))
+
+
+class FanoutPublisher:
+    __slots__ = ["_ws", "_prefix", "_capacity", "_writers"]
+
+    def __init__(self, ws: Any, prefix: str = "b4p", capacity: int = 65536) -> None:
+        # A Websocket or a WebsocketPool, an InlineDispatcher keeps the writes cheap
+        self._ws = ws
+        self._prefix = prefix
+        self._capacity = capacity
+        self._writers: Dict[str, RingWriter] = {}
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._writers)
+
+    async def publish(self, stream: str) -> None:
+        if stream in self._writers:
+            return
+
+        writer = RingWriter(
+            SharedRing.create(
+                ring_name(self._prefix, stream), stream_layout(stream), self._capacity
+            )
+        )
+        self._writers[stream] = writer
+        try:
+            await self._ws.subscribe_callback(stream, writer)
+        except BaseException:
+            # Nothing writes to the ring, so it must not stay in shared memory
+            del self._writers[stream]
+            writer.ring.close()
+            raise
+
+    async def unpublish(self, stream: str) -> None:
+        writer = self._writers.pop(stream, None)
+        if writer is None:
+            return
+
+        await self._ws.unsubscribe_callback(stream, writer)
+        writer.ring.close()
+
+    async def close(self) -> None:
+        for stream in list(self._writers):
+            await self.unpublish(stream)
+
+
+class FanoutSubscriber:
+    __slots__ = ["_rings", "_cursors", "_dropped"]
+
+    def __init__(self, streams: List[str], prefix: str = "b4p") -> None:
+        # Reads in a worker process what the publisher writes from now on
+        self._rings = {
+            stream: SharedRing.attach(ring_name(prefix, stream)) for stream in streams
+        }
+        self._cursors = {stream: ring.written for stream, ring in self._rings.items()}
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def read(self, limit: int = 1024) -> List[Tuple[str, Any]]:
+        events: List[Tuple[str, Any]] = []
+        for stream, ring in self._rings.items():
+            cursor, records, dropped = ring.read(self._cursors[stream], limit)
+            self._cursors[stream] = cursor
+            self._dropped += dropped
+            events.extend((stream, record) for record in records)
+        return events
+
+    def poll(
+        self, timeout: Optional[float] = None, interval: float = 0.0005
+    ) -> List[Tuple[str, Any]]:
+        # Blocks the worker until there are records or the timeout passed
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            events = self.read()
+            if events or deadline is not None and time.monotonic() >= deadline:
+                return events
+            time.sleep(interval)
+
+    def close(self) -> None:
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
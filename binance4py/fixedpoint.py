@@ -0,0 +1,361 @@
+import operator
+from decimal import (
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Decimal,
+)
+from fractions import Fraction
+from functools import lru_cache
+from sys import hash_info
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+HASH_MODULUS = hash_info.modulus
+
+
+def divide(n: int, d: int, rounding: Optional[str] = None) -> int:
+    # n / d rounded to an int with a decimal module rounding mode
+    q, r = divmod(n, d)
+    if r == 0 or rounding == ROUND_FLOOR:
+        return q
+    if rounding == ROUND_CEILING:
+        return q + 1
+    if rounding == ROUND_DOWN:
+        return q if n >= 0 else q + 1
+    if rounding == ROUND_UP:
+        return q + 1 if n >= 0 else q
+
+    if 2 * r < d:
+        return q
+    if 2 * r > d:
+        return q + 1
+    if rounding == ROUND_HALF_UP:
+        return q + 1 if n >= 0 else q
+    if rounding == ROUND_HALF_DOWN:
+        return q if n >= 0 else q + 1
+    if rounding is None or rounding == ROUND_HALF_EVEN:
+        return q + (q & 1)
+    raise Exception(f"Unknown rounding: {rounding}")
+
+
+def _fixed(cls: Type["Fixed"], units: int) -> "Fixed":
+    fixed = object.__new__(cls)
+    fixed.units = units
+    return fixed
+
+
+class Fixed:
+    # A number of units of 10**-decimals, the subclasses of fixed_type set the scale.
+    # Arithmetic and comparisons work on the value, ints and other fixed types are
+    # converted exactly and floats and Decimals are refused like Decimal does
+    __slots__ = ["units"]
+
+    units: int
+
+    decimals = 0
+    factor = 1
+    # The tick or step size in units
+    tick = 1
+    # Where exchange strings with exactly the decimals of the type have the point
+    _point = -1
+    _hash_inverse = 1
+
+    def __init__(
+        self,
+        value: Union[str, int, float, Decimal, "Fixed"] = 0,
+        rounding: Optional[str] = None,
+    ) -> None:
+        if isinstance(value, str):
+            # Exchange strings usually have exactly the decimals of the type
+            point = self._point
+            if value[point : point + 1] == ".":
+                self.units = int(value.replace(".", ""))
+            else:
+                self.units = self.parse_units(value, rounding)
+        elif isinstance(value, Fixed):
+            if value.decimals <= self.decimals:
+                self.units = value.units * 10 ** (self.decimals - value.decimals)
+            else:
+                self.units = divide(
+                    value.units, 10 ** (value.decimals - self.decimals), rounding
+                )
+        elif isinstance(value, int):
+            self.units = value * self.factor
+        elif isinstance(value, float):
+            # The shortest repr is the number the float was written as
+            text = repr(value)
+            if "e" in text:
+                text = "{:f}".format(Decimal(text))
+            self.units = self.parse_units(text, rounding)
+        elif isinstance(value, Decimal):
+            self.units = self.parse_units("{:f}".format(value), rounding)
+        else:
+            raise TypeError(
+                f"Cannot convert {type(value).__name__} to {type(self).__name__}"
+            )
+
+    @classmethod
+    def from_units(cls, units: int) -> "Fixed":
+        return _fixed(cls, units)
+
+    @classmethod
+    def parse(cls, s: str, rounding: Optional[str] = None) -> "Fixed":
+        return _fixed(cls, cls.parse_units(s, rounding))
+
+    @classmethod
+    def parse_units(cls, s: str, rounding: Optional[str] = None) -> int:
+        decimals = cls.decimals
+        point = s.find(".")
+        if point < 0:
+            return int(s) * cls.factor
+
+        extra = len(s) - point - 1 - decimals
+        if extra == 0:
+            return int(s.replace(".", ""))
+        if extra < 0:
+            return int(s.replace(".", "")) * 10**-extra
+        # Exchange strings are padded to 8 decimals with zeros
+        if s[len(s) - extra :].strip("0"):
+            return divide(int(s.replace(".", "")), 10**extra, rounding)
+        return int(s[: len(s) - extra].replace(".", ""))
+
+    def round(self, rounding: Optional[str] = None) -> "Fixed":
+        # To a multiple of the tick or step size
+        tick = self.tick
+        if tick == 1:
+            return self
+        return _fixed(type(self), divide(self.units, tick, rounding) * tick)
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.units).scaleb(-self.decimals)
+
+    def __str__(self) -> str:
+        digits = str(self.units)
+        decimals = self.decimals
+        if not decimals:
+            return digits
+
+        sign = ""
+        if digits[0] == "-":
+            sign, digits = "-", digits[1:]
+        if len(digits) <= decimals:
+            digits = digits.rjust(decimals + 1, "0")
+        fraction = digits[-decimals:].rstrip("0")
+        if fraction:
+            return f"{sign}{digits[:-decimals]}.{fraction}"
+        return sign + digits[:-decimals]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
+        return format(self.to_decimal(), format_spec)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __int__(self) -> int:
+        # Truncated like int() of a Decimal
+        return divide(self.units, self.factor, ROUND_DOWN)
+
+    def __float__(self) -> float:
+        return self.units / self.factor
+
+    def __hash__(self) -> int:
+        # The hash of an equal int, float, Decimal or Fraction, as in the numeric
+        # hash of Python: units * factor**-1 modulo the hash modulus
+        units = self.units
+        value = hash(-units if units < 0 else units) * self._hash_inverse % HASH_MODULUS
+        if units < 0:
+            value = -value
+        return -2 if value == -1 else value
+
+    def _operands(self, other: Any, op: str) -> Tuple[int, int, Type["Fixed"]]:
+        # The units of both operands at a common scale and the type of that scale
+        if type(other) is type(self):
+            return self.units, other.units, type(self)
+        if isinstance(other, Fixed):
+            if other.decimals > self.decimals:
+                scale = 10 ** (other.decimals - self.decimals)
+                return self.units * scale, other.units, fixed_decimals(other.decimals)
+            scale = 10 ** (self.decimals - other.decimals)
+            return self.units, other.units * scale, fixed_decimals(self.decimals)
+        if isinstance(other, int):
+            return self.units, other * self.factor, type(self)
+        raise TypeError(
+            f"unsupported operand type(s) for {op}: "
+            f"'{type(self).__name__}' and '{type(other).__name__}'"
+        )
+
+    def _compare(self, other: Any, op: Callable[[Any, Any], bool]) -> bool:
+        if isinstance(other, (Fixed, int)):
+            a, b, _ = self._operands(other, "compare")
+            return op(a, b)
+        if isinstance(other, float):
+            return op(Fraction(self.units, self.factor), other)
+        if isinstance(other, Decimal):
+            return op(self.to_decimal(), other)
+        return NotImplemented
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.units == other.units
+        return self._compare(other, operator.eq)
+
+    def __lt__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.units < other.units
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.units <= other.units
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.units > other.units
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self.units >= other.units
+        return self._compare(other, operator.ge)
+
+    def __add__(self, other: Any) -> "Fixed":
+        if type(other) is type(self):
+            return _fixed(type(self), self.units + other.units)
+        a, b, result = self._operands(other, "+")
+        return _fixed(result, a + b)
+
+    def __radd__(self, other: Any) -> "Fixed":
+        b, a, result = self._operands(other, "+")
+        return _fixed(result, a + b)
+
+    def __sub__(self, other: Any) -> "Fixed":
+        if type(other) is type(self):
+            return _fixed(type(self), self.units - other.units)
+        a, b, result = self._operands(other, "-")
+        return _fixed(result, a - b)
+
+    def __rsub__(self, other: Any) -> "Fixed":
+        b, a, result = self._operands(other, "-")
+        return _fixed(result, a - b)
+
+    def __mul__(self, other: Any) -> "Fixed":
+        if isinstance(other, Fixed):
+            # Price times quantity keeps all the decimals of both
+            return _fixed(
+                fixed_decimals(self.decimals + other.decimals),
+                self.units * other.units,
+            )
+        if isinstance(other, int):
+            return _fixed(type(self), self.units * other)
+        raise TypeError(
+            f"unsupported operand type(s) for *: "
+            f"'{type(self).__name__}' and '{type(other).__name__}'"
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> "Fixed":
+        # Rounded half even to the decimals of this type
+        if isinstance(other, Fixed):
+            return _fixed(type(self), divide(self.units * other.factor, other.units))
+        a, b, _ = self._operands(other, "/")
+        return _fixed(type(self), divide(a * self.factor, b))
+
+    def __rtruediv__(self, other: Any) -> "Fixed":
+        b, a, _ = self._operands(other, "/")
+        return _fixed(type(self), divide(a * self.factor, b))
+
+    def __floordiv__(self, other: Any) -> "Fixed":
+        a, b, _ = self._operands(other, "//")
+        return _fixed(type(self), a // b * self.factor)
+
+    def __rfloordiv__(self, other: Any) -> "Fixed":
+        b, a, _ = self._operands(other, "//")
+        return _fixed(type(self), a // b * self.factor)
+
+    def __mod__(self, other: Any) -> "Fixed":
+        a, b, result = self._operands(other, "%")
+        return _fixed(result, a % b)
+
+    def __rmod__(self, other: Any) -> "Fixed":
+        b, a, result = self._operands(other, "%")
+        return _fixed(result, a % b)
+
+    def __divmod__(self, other: Any) -> Tuple["Fixed", "Fixed"]:
+        return self // other, self % other
+
+    def __rdivmod__(self, other: Any) -> Tuple["Fixed", "Fixed"]:
+        return self.__rfloordiv__(other), self.__rmod__(other)
+
+    def __pow__(self, other: Any) -> "Fixed":
+        if type(other) is not int or other < 0:
+            raise TypeError(f"{type(self).__name__} only supports natural powers")
+        return _fixed(fixed_decimals(self.decimals * other), self.units**other)
+
+    def __round__(self, ndigits: Optional[int] = None) -> Any:
+        # Half even like the built in round
+        if ndigits is None:
+            return divide(self.units, self.factor)
+        if ndigits >= self.decimals:
+            return self
+        scale = 10 ** (self.decimals - ndigits)
+        return _fixed(type(self), divide(self.units, scale) * scale)
+
+    def __trunc__(self) -> int:
+        return int(self)
+
+    def __floor__(self) -> int:
+        return self.units // self.factor
+
+    def __ceil__(self) -> int:
+        return -(-self.units // self.factor)
+
+    def __neg__(self) -> "Fixed":
+        return _fixed(type(self), -self.units)
+
+    def __pos__(self) -> "Fixed":
+        return self
+
+    def __abs__(self) -> "Fixed":
+        return self if self.units >= 0 else _fixed(type(self), -self.units)
+
+
+@lru_cache(maxsize=None)
+def fixed_decimals(decimals: int, tick: int = 1) -> Type[Fixed]:
+    return type(
+        f"Fixed{decimals}" if tick == 1 else f"Fixed{decimals}x{tick}",
+        (Fixed,),
+        {
+            "__slots__": (),
+            "decimals": decimals,
+            "factor": 10**decimals,
+            "tick": tick,
+            "_point": -decimals - 1,
+            "_hash_inverse": pow(10**decimals, HASH_MODULUS - 2, HASH_MODULUS),
+        },
+    )
+
+
+def fixed_type(tick_size: Union[str, Decimal]) -> Type[Fixed]:
+    # The fixed point type of a tick or step size from the exchange filters
+    tick = Decimal(tick_size).normalize()
+    _, digits, exponent = tick.as_tuple()
+    units = int("".join(map(str, digits)))
+    decimals = -int(exponent)
+    if decimals <= 0:
+        return fixed_decimals(0, units * 10**-decimals)
+    return fixed_decimals(decimals, units)
+
+
+# Numbers in exchange strings have at most 8 decimals
+ExchangeFixed = fixed_decimals(8)
@@ -0,0 +1,245 @@
+import socket
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Tags = Optional[Dict[str, str]]
+Labels = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class MetricsSink:
+    __slots__ = []
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        pass
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        pass
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        pass
+
+
+class Metrics(MetricsSink):
+    __slots__ = ["_sinks"]
+
+    def __init__(self, *sinks: MetricsSink) -> None:
+        self._sinks = list(sinks)
+
+    @property
+    def sinks(self) -> List[MetricsSink]:
+        return self._sinks
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        self._sinks.remove(sink)
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        for sink in self._sinks:
+            sink.increment(name, value, tags)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        for sink in self._sinks:
+            sink.gauge(name, value, tags)
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        for sink in self._sinks:
+            sink.timing(name, seconds, tags)
+
+
+class CallbackSink(MetricsSink):
+    __slots__ = ["_callback"]
+
+    def __init__(self, callback: Callable[[str, str, float, Tags], None]) -> None:
+        # Called with (kind, name, value, tags), kind is increment, gauge or timing
+        self._callback = callback
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        self._callback("increment", name, value, tags)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        self._callback("gauge", name, value, tags)
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        self._callback("timing", name, seconds, tags)
+
+
+def _labels(tags: Tags) -> Labels:
+    return tuple(sorted(tags.items())) if tags else ()
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            '{}="{}"'.format(
+                k,
+                str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+            )
+            for k, v in labels
+        )
+        + "}"
+    )
+
+
+class PrometheusSink(MetricsSink):
+    __slots__ = ["_prefix", "_buckets", "_counters", "_gauges", "_histograms"]
+
+    def __init__(
+        self, prefix: str = "binance4py_", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self._prefix = prefix
+        self._buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        # Per labels: [count of every bucket and of +Inf, sum]
+        self._histograms: Dict[str, Dict[Labels, List[Any]]] = {}
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        series = self._counters.setdefault(name, {})
+        labels = _labels(tags)
+        series[labels] = series.get(labels, 0) + value
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        self._gauges.setdefault(name, {})[_labels(tags)] = value
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        series = self._histograms.setdefault(name, {})
+        labels = _labels(tags)
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = [[0] * (len(self._buckets) + 1), 0.0]
+        histogram[0][bisect_left(self._buckets, seconds)] += 1
+        histogram[1] += seconds
+
+    def render(self) -> str:
+        lines = []
+        for name, series in self._counters.items():
+            name = f"{self._prefix}{name}_total"
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for name, series in self._gauges.items():
+            name = self._prefix + name
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for name, histograms in self._histograms.items():
+            name = self._prefix + name
+            lines.append(f"# TYPE {name} histogram")
+            for labels, (counts, total) in histograms.items():
+                cumulative = 0
+                for bound, count in zip(self._buckets + ("+Inf",), counts):
+                    cumulative += count
+                    bucket_labels = labels + (("le", str(bound)),)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                    )
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    async def handler(self, request: Any) -> Any:
+        # An aiohttp.web handler for the metrics endpoint
+        from aiohttp import web
+
+        return web.Response(
+            body=self.render().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+
+class StatsdSink(MetricsSink):
+    __slots__ = ["_address", "_prefix", "_tags", "_socket"]
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8125,
+        prefix: str = "binance4py.",
+        tags: bool = True,
+    ) -> None:
+        self._address = (host, port)
+        self._prefix = prefix
+        # Tags are sent in the DogStatsD format, plain StatsD servers need False
+        self._tags = tags
+        self._socket: Optional[socket.socket] = None
+
+    def _send(self, name: str, value: str, tags: Tags) -> None:
+        line = f"{self._prefix}{name}:{value}"
+        if tags and self._tags:
+            line += "|#" + ",".join(f"{k}:{v}" for k, v in tags.items())
+
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.setblocking(False)
+        try:
+            self._socket.sendto(line.encode("utf-8"), self._address)
+        except OSError:
+            # Metrics are best effort and never fail the caller
+            pass
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        self._send(name, f"{value:g}|c", tags)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        self._send(name, f"{value:g}|g", tags)
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        self._send(name, f"{seconds * 1000:.3f}|ms", tags)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class TimedCallback:
+    __slots__ = ["_metrics", "_tags", "_callback", "_enqueued_at"]
+
+    def __init__(
+        self,
+        metrics: MetricsSink,
+        tags: Dict[str, str],
+        callback: Callable,
+        enqueued_at: float,
+    ) -> None:
+        self._metrics = metrics
+        self._tags = tags
+        self._callback = callback
+        self._enqueued_at = enqueued_at
+
+    async def __call__(self, data: Any) -> None:
+        started_at = time.perf_counter()
+        self._metrics.timing(
+            "stream_dispatch_delay_seconds", started_at - self._enqueued_at, self._tags
+        )
+        try:
+            await self._callback(data)
+        finally:
+            self._metrics.timing(
+                "stream_callback_seconds", time.perf_counter() - started_at, self._tags
+            )
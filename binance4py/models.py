@@ -0,0 +1,178 @@
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from binance4py.typing import JsonObject
+
+Numeric = Callable[[str], Any]
+
+
+def _field(key: str) -> Any:
+    return property(lambda self: self._data[key])
+
+
+def _number(key: str) -> Any:
+    # Numbers are sent as strings and only converted when they are read
+    return property(lambda self: self._numeric(self._data[key]))
+
+
+class Event:
+    __slots__ = ["_data", "_numeric"]
+
+    def __init__(self, data: JsonObject, numeric: Numeric = float) -> None:
+        self._data = data
+        self._numeric = numeric
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    @property
+    def data(self) -> JsonObject:
+        return self._data
+
+    event_type = _field("e")
+    event_time = _field("E")
+    symbol = _field("s")
+
+
+class Trade(Event):
+    __slots__ = []
+
+    trade_id = _field("t")
+    price = _number("p")
+    quantity = _number("q")
+    buyer_order_id = _field("b")
+    seller_order_id = _field("a")
+    trade_time = _field("T")
+    is_buyer_maker = _field("m")
+
+
+class AggTrade(Event):
+    __slots__ = []
+
+    agg_trade_id = _field("a")
+    price = _number("p")
+    quantity = _number("q")
+    first_trade_id = _field("f")
+    last_trade_id = _field("l")
+    trade_time = _field("T")
+    is_buyer_maker = _field("m")
+
+
+def _kline_field(key: str) -> Any:
+    return property(lambda self: self._data["k"][key])
+
+
+def _kline_number(key: str) -> Any:
+    return property(lambda self: self._numeric(self._data["k"][key]))
+
+
+class Kline(Event):
+    __slots__ = []
+
+    start_time = _kline_field("t")
+    close_time = _kline_field("T")
+    interval = _kline_field("i")
+    first_trade_id = _kline_field("f")
+    last_trade_id = _kline_field("L")
+    open = _kline_number("o")
+    close = _kline_number("c")
+    high = _kline_number("h")
+    low = _kline_number("l")
+    volume = _kline_number("v")
+    trades = _kline_field("n")
+    closed = _kline_field("x")
+    quote_volume = _kline_number("q")
+    taker_buy_base_volume = _kline_number("V")
+    taker_buy_quote_volume = _kline_number("Q")
+
+
+class BookTicker(Event):
+    __slots__ = []
+
+    update_id = _field("u")
+    bid_price = _number("b")
+    bid_quantity = _number("B")
+    ask_price = _number("a")
+    ask_quantity = _number("A")
+
+
+class DepthUpdate(Event):
+    __slots__ = []
+
+    first_update_id = _field("U")
+    final_update_id = _field("u")
+
+    def _levels(self, key: str) -> List[Tuple[Any, Any]]:
+        numeric = self._numeric
+        return [(numeric(p), numeric(q)) for p, q in self._data[key]]
+
+    @property
+    def bids(self) -> List[Tuple[Any, Any]]:
+        return self._levels("b")
+
+    @property
+    def asks(self) -> List[Tuple[Any, Any]]:
+        return self._levels("a")
+
+
+class ExecutionReport(Event):
+    __slots__ = []
+
+    client_order_id = _field("c")
+    side = _field("S")
+    order_type = _field("o")
+    time_in_force = _field("f")
+    quantity = _number("q")
+    price = _number("p")
+    stop_price = _number("P")
+    iceberg_quantity = _number("F")
+    order_list_id = _field("g")
+    original_client_order_id = _field("C")
+    execution_type = _field("x")
+    order_status = _field("X")
+    reject_reason = _field("r")
+    order_id = _field("i")
+    last_executed_quantity = _number("l")
+    cumulative_filled_quantity = _number("z")
+    last_executed_price = _number("L")
+    commission = _number("n")
+    commission_asset = _field("N")
+    transaction_time = _field("T")
+    trade_id = _field("t")
+    is_maker = _field("m")
+    order_creation_time = _field("O")
+    cumulative_quote_quantity = _number("Z")
+    last_quote_quantity = _number("Y")
+    quote_order_quantity = _number("Q")
+
+
+USER_DATA_MODELS: Dict[str, Type[Event]] = {"executionReport": ExecutionReport}
+
+
+def user_data_model(data: JsonObject, numeric: Numeric = float) -> Event:
+    return USER_DATA_MODELS.get(data["e"], Event)(data, numeric)
+
+
+class ModelCallback:
+    __slots__ = ["callback", "model", "numeric"]
+
+    def __init__(
+        self, callback: Callable, model: Callable[..., Event], numeric: Numeric
+    ) -> None:
+        self.callback = callback
+        self.model = model
+        self.numeric = numeric
+
+    async def __call__(self, data: JsonObject) -> None:
+        await self.callback(self.model(data, self.numeric))
+
+    def __eq__(self, other: object) -> bool:
+        # Lets unsubscribe_callback find the wrapper by the original callback
+        if isinstance(other, ModelCallback):
+            return self.callback == other.callback
+        return self.callback == other
+
+    def __hash__(self) -> int:
+        return hash(self.callback)
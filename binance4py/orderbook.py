@@ -0,0 +1,273 @@
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from binance4py.api import Binance
+from binance4py.fixedpoint import Fixed
+from binance4py.models import Numeric
+from binance4py.typing import JsonObject
+
+
+class OrderBookSide:
+    __slots__ = ["_sign", "_numeric", "_fixed", "_zero", "_keys", "_quantities"]
+
+    def __init__(self, descending: bool = False, numeric: Numeric = float) -> None:
+        # Prices are stored as sorted keys, bids are negated to keep one ascending order
+        self._sign = -1 if descending else 1
+        self._numeric = numeric
+        # The keys of a fixed point type are its plain int units
+        self._fixed = isinstance(numeric, type) and issubclass(numeric, Fixed)
+        self._zero = numeric("0")
+        self._keys: List[Any] = []
+        self._quantities: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, price: Any) -> Any:
+        if self._fixed:
+            if type(price) is not self._numeric:
+                price = self._numeric(price)
+            return self._sign * price.units
+        return self._sign * price
+
+    def _price(self, key: Any) -> Any:
+        if self._fixed:
+            return self._numeric.from_units(self._sign * key)  # type: ignore
+        return self._sign * key
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._quantities.clear()
+
+    def load(self, levels: List[List[str]]) -> None:
+        # Snapshot levels are already sorted from the best price
+        numeric = self._numeric
+        self._keys = [self._key(numeric(p)) for p, _ in levels]
+        self._quantities = [numeric(q) for _, q in levels]
+
+    def update(self, price: Any, quantity: Any) -> None:
+        key = self._key(price)
+        keys = self._keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            if not quantity:
+                del keys[i]
+                del self._quantities[i]
+            else:
+                self._quantities[i] = quantity
+        elif quantity:
+            keys.insert(i, key)
+            self._quantities.insert(i, quantity)
+
+    def best(self) -> Optional[Tuple[Any, Any]]:
+        if not self._keys:
+            return None
+        return self._price(self._keys[0]), self._quantities[0]
+
+    def top(self, n: int) -> List[Tuple[Any, Any]]:
+        price = self._price
+        return [(price(k), q) for k, q in zip(self._keys[:n], self._quantities[:n])]
+
+    def quantity(self, price: Any) -> Any:
+        key = self._key(price)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._quantities[i]
+        return self._zero
+
+    def volume(self, price: Any) -> Any:
+        # Cumulative quantity from the best price up to and including price
+        return sum(
+            self._quantities[: bisect_right(self._keys, self._key(price))],
+            self._zero,
+        )
+
+
+class OrderBook:
+    __slots__ = [
+        "_client",
+        "_symbol",
+        "_limit",
+        "_update_speed",
+        "_callback",
+        "_numeric",
+        "_stream",
+        "_resync_delay",
+        "_max_resync_delay",
+        "_synced",
+        "_resyncing",
+        "_retry_at",
+        "_failures",
+        "_buffer",
+        "_last_update_id",
+        "bids",
+        "asks",
+    ]
+
+    def __init__(
+        self,
+        client: Binance,
+        symbol: str,
+        limit: int = 1000,
+        update_speed: int = 100,
+        callback: Optional[Callable] = None,
+        numeric: Numeric = float,
+        resync_delay: float = 0.5,
+        max_resync_delay: float = 30,
+        buffer_size: int = 1000,
+    ) -> None:
+        self._client = client
+        self._symbol = symbol.upper()
+        self._limit = limit
+        self._update_speed = update_speed
+        self._callback = callback
+        self._numeric = numeric
+        self._resync_delay = resync_delay
+        self._max_resync_delay = max_resync_delay
+
+        self._stream: Optional[str] = None
+        self._synced = False
+        self._resyncing = False
+        # When a resync from the stream may retry a failed snapshot request
+        self._retry_at = 0.0
+        self._failures = 0
+        # Events older than the next snapshot are skipped anyway
+        self._buffer: Deque[JsonObject] = deque(maxlen=buffer_size)
+        self._last_update_id = 0
+
+        self.bids = OrderBookSide(descending=True, numeric=numeric)
+        self.asks = OrderBookSide(numeric=numeric)
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @property
+    def synced(self) -> bool:
+        return self._synced
+
+    @property
+    def last_update_id(self) -> int:
+        return self._last_update_id
+
+    def best_bid(self) -> Optional[Tuple[Any, Any]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[Any, Any]]:
+        return self.asks.best()
+
+    def depth_at(self, price: Any) -> Any:
+        return self.bids.quantity(price) or self.asks.quantity(price)
+
+    def _apply(self, event: JsonObject) -> bool:
+        if event["u"] <= self._last_update_id:
+            return True
+        if event["U"] > self._last_update_id + 1:
+            return False
+
+        numeric = self._numeric
+        for price, quantity in event["b"]:
+            self.bids.update(numeric(price), numeric(quantity))
+        for price, quantity in event["a"]:
+            self.asks.update(numeric(price), numeric(quantity))
+        self._last_update_id = event["u"]
+        return True
+
+    async def _on_depth(self, event: JsonObject) -> None:
+        if not self._synced:
+            self._buffer.append(event)
+            if self._failures and not self._resyncing:
+                await self._retry()
+            return
+
+        if not self._apply(event):
+            self._synced = False
+            self._buffer.append(event)
+            await self._retry()
+        elif self._callback is not None:
+            await self._callback(self)
+
+    async def resync(self) -> None:
+        if self._resyncing:
+            return
+
+        self._resyncing = True
+        self._synced = False
+        try:
+            delay = 0.0
+            while True:
+                if delay:
+                    await asyncio.sleep(delay)
+                try:
+                    snapshot = await self._client.market.order_book(
+                        self._symbol, self._limit
+                    )
+                except Exception:
+                    self._failures += 1
+                    self._retry_at = time.monotonic() + min(
+                        self._resync_delay * 2**self._failures,
+                        self._max_resync_delay,
+                    )
+                    raise
+                self._failures = 0
+                self._retry_at = 0
+                self._last_update_id = snapshot["lastUpdateId"]
+                self.bids.load(snapshot["bids"])
+                self.asks.load(snapshot["asks"])
+
+                buffer = self._buffer
+                while buffer:
+                    if not self._apply(buffer[0]):
+                        break
+                    buffer.popleft()
+                else:
+                    break
+                # The snapshot is older than the buffered events, fetch a newer one
+                delay = min(delay * 2 or self._resync_delay, self._max_resync_delay)
+        finally:
+            self._resyncing = False
+
+        self._synced = True
+        if self._callback is not None:
+            await self._callback(self)
+
+    async def _retry(self) -> None:
+        # Resyncs from the stream, a failed snapshot request is retried with backoff
+        if self._stream is None or time.monotonic() < self._retry_at:
+            return
+        try:
+            await self.resync()
+        except Exception:
+            pass
+
+    async def _on_gap(self, disconnected_at: int, reconnected_at: int) -> None:
+        if not self._resyncing:
+            self._retry_at = 0
+            await self._retry()
+
+    async def start(self) -> None:
+        if self._stream is not None:
+            return
+
+        self._client.ws.add_gap_callback(self._on_gap)
+        self._stream = await self._client.ws.depth(
+            self._on_depth, self._symbol, self._update_speed
+        )
+        await self.resync()
+
+    async def stop(self) -> None:
+        if self._stream is None:
+            return
+
+        self._client.ws.remove_gap_callback(self._on_gap)
+        await self._client.ws.unsubscribe_callback(self._stream, self._on_depth)
+        self._stream = None
+        self._synced = False
+        self._retry_at = 0
+        self._failures = 0
+        self._buffer.clear()
+        self.bids.clear()
+        self.asks.clear()
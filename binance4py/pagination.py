@@ -0,0 +1,103 @@
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from binance4py.ratelimit import RateLimiter
+
+PageFetcher = Callable[..., Awaitable[List[Any]]]
+WindowFetcher = Callable[[], Awaitable[List[Any]]]
+
+
+def time_windows(start: int, end: int, span: int) -> Iterator[Tuple[int, int]]:
+    # Both bounds are inclusive, as startTime and endTime are for the exchange
+    while start <= end:
+        yield start, min(start + span - 1, end)
+        start += span
+
+
+def id_windows(from_id: int, to_id: int, limit: int) -> Iterator[Tuple[int, int]]:
+    while from_id <= to_id:
+        yield from_id, min(to_id - from_id + 1, limit)
+        from_id += limit
+
+
+def throttle(fetch: PageFetcher, weight_limit: Optional[int], weight: int = 1):
+    if weight_limit is None:
+        return fetch
+
+    rate_limiter = RateLimiter({"1M": weight_limit})
+
+    async def throttled_fetch(*args: Any) -> List[Any]:
+        await rate_limiter.acquire(weight)
+        return await fetch(*args)
+
+    return throttled_fetch
+
+
+async def fetch_time_window(
+    fetch: PageFetcher,
+    start: int,
+    end: int,
+    limit: int,
+    time_key: Any,
+    id_key: Optional[Any] = None,
+) -> List[Any]:
+    # With id_key fetch also takes a from id, which is used with no time bounds
+    rows: List[Any] = []
+    page = await fetch(start, end)
+    while True:
+        full = len(page) >= limit
+        last_time = page[-1][time_key] if page else None
+        one_time = full and page[0][time_key] == last_time
+
+        if id_key is not None and rows:
+            # Rows sharing the last timestamp of the previous page are returned again
+            last_id = rows[-1][id_key]
+            page = [row for row in page if row[id_key] > last_id]
+        if last_time is not None and last_time > end:
+            # Pages by id and servers that ignore endTime go past the window
+            rows.extend(row for row in page if row[time_key] <= end)
+            return rows
+        rows.extend(page)
+
+        if not full or not page:
+            return rows
+        if one_time and id_key is not None:
+            # The whole page is one millisecond, the rest of it is only reachable by id
+            page = await fetch(None, None, rows[-1][id_key] + 1)
+            continue
+
+        start = page[-1][time_key] if id_key is not None else page[-1][time_key] + 1
+        if start > end:
+            return rows
+        page = await fetch(start, end)
+
+
+async def iterate_windows(
+    windows: Iterable[WindowFetcher], concurrency: int
+) -> AsyncIterator[Any]:
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        for window in windows:
+            pending.append(asyncio.ensure_future(window()))
+            if len(pending) >= concurrency:
+                for row in await pending.popleft():
+                    yield row
+
+        while pending:
+            for row in await pending.popleft():
+                yield row
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,246 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from binance4py.api import Binance
+from binance4py.typing import JsonObject
+
+# Lanes in priority order, orders of the later lanes count to the order limits
+LANES = ("cancel", "replace", "new")
+
+# Errors of a STOP_ON_FAILURE replace_order
+CANCEL_FAILED = -2022  # the new order was not attempted
+NEW_ORDER_FAILED = -2021  # the cancel went through
+
+
+class PendingOrder:
+    __slots__ = ["method", "params", "future", "merged"]
+
+    def __init__(self, method: str, params: Dict[str, Any]) -> None:
+        self.method = method
+        self.params = params
+        self.future: asyncio.Future = asyncio.get_event_loop().create_future()
+        # The cancel and the new order sent as this replace_order
+        self.merged: Optional[Tuple[PendingOrder, PendingOrder]] = None
+
+
+class OrderPipeline:
+    __slots__ = [
+        "_client",
+        "_concurrency",
+        "_merge",
+        "_lanes",
+        "_running",
+        "_running_orders",
+        "_wakeup",
+        "_task",
+        "_tasks",
+    ]
+
+    def __init__(
+        self, client: Binance, concurrency: int = 4, merge: bool = False
+    ) -> None:
+        self._client = client
+        # Bounds the orders in flight, cancels are never held back by it
+        self._concurrency = concurrency
+        self._merge = merge
+
+        self._lanes: Dict[str, Deque[PendingOrder]] = {lane: deque() for lane in LANES}
+        self._running = 0
+        # Sent orders that may not be counted by the rate limiter yet
+        self._running_orders = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Future] = None
+        self._tasks: List[asyncio.Future] = []
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        return {lane: len(pending) for lane, pending in self._lanes.items()}
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def _order_delay(self) -> float:
+        if self._client._rate_limiter is None:
+            return 0
+        return self._client._rate_limiter.order_delay(self._running_orders + 1)
+
+    async def _submit(self, lane: str, pending: PendingOrder) -> JsonObject:
+        self._lanes[lane].append(pending)
+        self._wakeup.set()
+        return await pending.future
+
+    async def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+        new_client_order_id: Optional[str] = None,
+    ) -> JsonObject:
+        return await self._submit(
+            "cancel",
+            PendingOrder(
+                "cancel_order",
+                {
+                    "symbol": symbol,
+                    "order_id": order_id,
+                    "orig_client_order_id": orig_client_order_id,
+                    "new_client_order_id": new_client_order_id,
+                },
+            ),
+        )
+
+    async def replace_order(self, symbol: str, **params: Any) -> JsonObject:
+        return await self._submit(
+            "replace", PendingOrder("replace_order", {"symbol": symbol, **params})
+        )
+
+    async def create_order(
+        self, symbol: str, side: str, type: str, **params: Any
+    ) -> JsonObject:
+        order = PendingOrder(
+            "create_order", {"symbol": symbol, "side": side, "type": type, **params}
+        )
+        if self._merge and self._order_delay() <= 0:
+            # A waiting cancel of the same symbol is sent with the new order in its
+            # place, only when the order limits would not hold the cancel back
+            cancels = self._lanes["cancel"]
+            for i, cancel in enumerate(cancels):
+                if (
+                    cancel.merged is None
+                    and cancel.params["symbol"] == symbol
+                    and not cancel.future.done()
+                ):
+                    cancels[i] = self._merged(cancel, order)
+                    self._wakeup.set()
+                    return await order.future
+        return await self._submit("new", order)
+
+    def _merged(self, cancel: PendingOrder, order: PendingOrder) -> PendingOrder:
+        replace = PendingOrder(
+            "replace_order",
+            {
+                **order.params,
+                "cancel_replace_mode": "STOP_ON_FAILURE",
+                "cancel_order_id": cancel.params["order_id"],
+                "cancel_orig_client_order_id": cancel.params["orig_client_order_id"],
+                "cancel_new_client_order_id": cancel.params["new_client_order_id"],
+            },
+        )
+        replace.future = order.future
+        replace.merged = (cancel, order)
+        return replace
+
+    def _next(self) -> Any:
+        # Returns the next order to send or the seconds to wait for the order limits
+        for lane in LANES:
+            pending_orders = self._lanes[lane]
+            while pending_orders and pending_orders[0].future.done():
+                # Cancelled by the caller before it was sent
+                pending = pending_orders.popleft()
+                if pending.merged is not None:
+                    # Only the new order was given up, the cancel is still sent
+                    pending_orders.appendleft(pending.merged[0])
+            if not pending_orders:
+                continue
+
+            pending = pending_orders.popleft()
+            if lane == "cancel":
+                if pending.merged is not None and self._order_delay() > 0:
+                    # The order limits filled up since it was merged
+                    cancel, order = pending.merged
+                    self._lanes["new"].appendleft(order)
+                    return cancel
+                return pending
+
+            if self._running_orders >= self._concurrency:
+                pending_orders.appendleft(pending)
+                return None
+            delay = self._order_delay()
+            if delay > 0:
+                pending_orders.appendleft(pending)
+                return delay
+            return pending
+        return None
+
+    async def _send(self, pending: PendingOrder) -> None:
+        try:
+            response = await getattr(self._client.spot, pending.method)(
+                **pending.params
+            )
+        except Exception as exp:
+            if pending.merged is None:
+                if not pending.future.done():
+                    pending.future.set_exception(exp)
+            else:
+                cancel, order = pending.merged
+                code = getattr(exp, "code", None)
+                data = getattr(exp, "data", None)
+                if not cancel.future.done():
+                    if (
+                        code == NEW_ORDER_FAILED
+                        and isinstance(data, dict)
+                        and "cancelResponse" in data
+                    ):
+                        cancel.future.set_result(data["cancelResponse"])
+                    else:
+                        cancel.future.set_exception(exp)
+                if code == CANCEL_FAILED:
+                    # Sent on its own the new order would have been placed
+                    self._lanes["new"].appendleft(order)
+                elif not order.future.done():
+                    order.future.set_exception(exp)
+        else:
+            if pending.merged is not None:
+                cancel, order = pending.merged
+                if not cancel.future.done():
+                    cancel.future.set_result(response["cancelResponse"])
+                if not order.future.done():
+                    order.future.set_result(response["newOrderResponse"])
+            elif not pending.future.done():
+                pending.future.set_result(response)
+        finally:
+            self._running -= 1
+            if pending.method != "cancel_order":
+                self._running_orders -= 1
+            self._wakeup.set()
+
+    async def _scheduler(self) -> None:
+        while True:
+            pending = self._next()
+            if isinstance(pending, PendingOrder):
+                self._running += 1
+                if pending.method != "cancel_order":
+                    self._running_orders += 1
+                task = asyncio.ensure_future(self._send(pending))
+                self._tasks.append(task)
+                task.add_done_callback(self._tasks.remove)
+                continue
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), pending)
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._task = asyncio.ensure_future(self._scheduler())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
+        # Orders already sent are awaited, the waiting ones are cancelled
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for pending_orders in self._lanes.values():
+            for pending in pending_orders:
+                pending.future.cancel()
+                if pending.merged is not None:
+                    pending.merged[0].future.cancel()
+            pending_orders.clear()
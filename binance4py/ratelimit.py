@@ -0,0 +1,203 @@
+import asyncio
+import time
+from typing import Dict, List, Mapping, Optional
+
+from binance4py.typing import JsonObject
+
+INTERVAL_SECONDS = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+
+WEIGHT_HEADER = "X-MBX-USED-WEIGHT-"
+ORDER_COUNT_HEADER = "X-MBX-ORDER-COUNT-"
+
+
+def rate_limit_interval(rate_limit: JsonObject) -> str:
+    return f"{rate_limit['intervalNum']}{rate_limit['interval'][0]}"
+
+
+def parse_interval(interval: str) -> int:
+    return int(interval[:-1]) * INTERVAL_SECONDS[interval[-1].upper()]
+
+
+def order_book_weight(limit: Optional[int] = None) -> int:
+    if limit is None or limit <= 100:
+        return 1
+    elif limit <= 500:
+        return 5
+    elif limit <= 1000:
+        return 10
+    return 50
+
+
+def ticker_24hr_weight(symbols: Optional[List[str]] = None) -> int:
+    if symbols is None or len(symbols) > 100:
+        return 40
+    elif len(symbols) > 20:
+        return 20
+    return 1
+
+
+def ticker_weight(symbols: Optional[List[str]] = None) -> int:
+    if symbols is None or len(symbols) > 1:
+        return 2
+    return 1
+
+
+def rolling_window_ticker_weight(symbols: List[str]) -> int:
+    return min(2 * len(symbols), 100)
+
+
+class RateLimitWindow:
+    __slots__ = ["interval", "limit", "used", "_reset_at"]
+
+    def __init__(self, interval: int, limit: int) -> None:
+        self.interval = interval
+        self.limit = limit
+        self.used = 0
+        self._reset_at = 0.0
+
+    def _roll(self, now: float) -> None:
+        if now >= self._reset_at:
+            self.used = 0
+            # Binance windows are aligned to the wall clock, not to the first request
+            self._reset_at = (now // self.interval + 1) * self.interval
+
+    def delay(self, cost: int, now: float) -> float:
+        self._roll(now)
+        if cost <= 0 or self.used + cost <= self.limit:
+            return 0
+        return self._reset_at - now
+
+    def consume(self, cost: int, now: float) -> None:
+        self._roll(now)
+        self.used += cost
+
+    def sync(self, used: int, now: float) -> None:
+        self._roll(now)
+        # Keep local in-flight reservations that the server has not seen yet
+        self.used = max(self.used, used)
+
+
+class RateLimiter:
+    __slots__ = ["_weight_windows", "_order_windows", "_lock", "_banned_until"]
+
+    def __init__(
+        self,
+        request_weight: Optional[Mapping[str, int]] = None,
+        orders: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        if request_weight is None:
+            request_weight = {"1M": 1200}
+        if orders is None:
+            orders = {"10S": 50, "1D": 160000}
+
+        self._weight_windows: Dict[str, RateLimitWindow] = {}
+        self._order_windows: Dict[str, RateLimitWindow] = {}
+        for interval, limit in request_weight.items():
+            self._weight_windows[interval.upper()] = RateLimitWindow(
+                parse_interval(interval), limit
+            )
+        for interval, limit in orders.items():
+            self._order_windows[interval.upper()] = RateLimitWindow(
+                parse_interval(interval), limit
+            )
+
+        self._lock = asyncio.Lock()
+        self._banned_until = 0.0
+
+    @classmethod
+    def from_exchange_info(cls, exchange_info: JsonObject) -> "RateLimiter":
+        request_weight = {}
+        orders = {}
+        for rate_limit in exchange_info["rateLimits"]:
+            interval = rate_limit_interval(rate_limit)
+            if rate_limit["rateLimitType"] == "REQUEST_WEIGHT":
+                request_weight[interval] = rate_limit["limit"]
+            elif rate_limit["rateLimitType"] == "ORDERS":
+                orders[interval] = rate_limit["limit"]
+        return cls(request_weight, orders)
+
+    @property
+    def used_weight(self) -> Dict[str, int]:
+        return {k: w.used for k, w in self._weight_windows.items()}
+
+    @property
+    def order_count(self) -> Dict[str, int]:
+        return {k: w.used for k, w in self._order_windows.items()}
+
+    def _delay(self, weight: int, orders: int, now: float) -> float:
+        delay = self._banned_until - now
+        for window in self._weight_windows.values():
+            delay = max(delay, window.delay(weight, now))
+        if orders:
+            for window in self._order_windows.values():
+                delay = max(delay, window.delay(orders, now))
+        return delay
+
+    def order_delay(self, orders: int = 1) -> float:
+        # Seconds until the order count windows allow orders, without reserving them
+        now = time.time()
+        delay = self._banned_until - now
+        for window in self._order_windows.values():
+            delay = max(delay, window.delay(orders, now))
+        return delay
+
+    async def acquire(self, weight: int = 1, orders: int = 0) -> None:
+        # A cost above a limit would wait forever
+        for interval, window in self._weight_windows.items():
+            if weight > window.limit:
+                raise ValueError(
+                    f"Weight {weight} exceeds the {interval} limit of {window.limit}"
+                )
+        if orders:
+            for interval, window in self._order_windows.items():
+                if orders > window.limit:
+                    raise ValueError(
+                        f"Order count {orders} exceeds the {interval} limit "
+                        f"of {window.limit}"
+                    )
+
+        # The lock keeps waiting requests in FIFO order so heavy calls are not starved
+        async with self._lock:
+            while True:
+                now = time.time()
+                delay = self._delay(weight, orders, now)
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            for window in self._weight_windows.values():
+                window.consume(weight, now)
+            if orders:
+                for window in self._order_windows.values():
+                    window.consume(orders, now)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        now = time.time()
+        for name, value in headers.items():
+            name = name.upper()
+            if name.startswith(WEIGHT_HEADER):
+                window = self._weight_windows.get(name[len(WEIGHT_HEADER) :])
+            elif name.startswith(ORDER_COUNT_HEADER):
+                window = self._order_windows.get(name[len(ORDER_COUNT_HEADER) :])
+            else:
+                continue
+
+            if window is not None:
+                window.sync(int(value), now)
+
+    def update_rate_limits(self, rate_limits: List[JsonObject]) -> None:
+        # Usage reported in websocket api responses
+        now = time.time()
+        for rate_limit in rate_limits:
+            if rate_limit["rateLimitType"] == "REQUEST_WEIGHT":
+                window = self._weight_windows.get(rate_limit_interval(rate_limit))
+            elif rate_limit["rateLimitType"] == "ORDERS":
+                window = self._order_windows.get(rate_limit_interval(rate_limit))
+            else:
+                continue
+
+            if window is not None:
+                window.sync(rate_limit["count"], now)
+
+    def ban(self, retry_after: float) -> None:
+        self._banned_until = max(self._banned_until, time.time() + retry_after)
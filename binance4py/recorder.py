@@ -0,0 +1,383 @@
+import asyncio
+import importlib
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from binance4py.typing import JsonObject
+from binance4py.websocket import split_stream_frame
+
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+# Magic and compression name at the start of every segment
+SEGMENT_HEADER = struct.Struct("<4s8s")
+SEGMENT_MAGIC = b"B4PR"
+# Stored body length, record count, first and last receive time of a batch
+BLOCK_HEADER = struct.Struct("<IIqq")
+# Receive time in nanoseconds and frame length
+RECORD_HEADER = struct.Struct("<qI")
+
+# Standard library modules with compress and decompress functions
+COMPRESSIONS = ("zlib", "bz2", "lzma")
+
+Record = Tuple[int, Union[str, bytes]]
+
+
+def compression_codec(
+    compression: str,
+) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    # Imported when used, Python builds can lack the bz2 and lzma modules
+    if compression not in COMPRESSIONS:
+        raise Exception(f"Unknown compression: {compression}")
+    try:
+        module: Any = importlib.import_module(compression)
+    except ImportError:
+        raise Exception(f"Compression {compression} is not available")
+    return module.compress, module.decompress
+
+
+class SegmentWriter:
+    __slots__ = [
+        "_path",
+        "_file",
+        "_compress",
+        "_index",
+        "size",
+        "start_time",
+    ]
+
+    def __init__(
+        self, directory: str, compression: Optional[str], start_time: int
+    ) -> None:
+        self._path = os.path.join(directory, f"{start_time}{SEGMENT_SUFFIX}")
+        self._file = open(self._path, "wb")
+        self._compress = compression_codec(compression)[0] if compression else None
+        self._index: JsonObject = {
+            "segment": os.path.basename(self._path),
+            "compression": compression,
+            "start_time": start_time,
+            "end_time": start_time,
+            "count": 0,
+            "streams": {},
+            "blocks": [],
+        }
+        self._file.write(
+            SEGMENT_HEADER.pack(SEGMENT_MAGIC, (compression or "").encode())
+        )
+        self.size = SEGMENT_HEADER.size
+        self.start_time = start_time
+
+    def write(self, batch: List[Record]) -> None:
+        body = bytearray()
+        streams = self._index["streams"]
+        for receive_time, frame in batch:
+            if isinstance(frame, str):
+                frame = frame.encode()
+            body += RECORD_HEADER.pack(receive_time, len(frame))
+            body += frame
+
+            routed = split_stream_frame(frame)
+            if routed is not None:
+                # First and last receive time and message count of the stream
+                entry = streams.get(routed[0])
+                if entry is None:
+                    streams[routed[0]] = [receive_time, receive_time, 1]
+                else:
+                    entry[1] = receive_time
+                    entry[2] += 1
+
+        stored = self._compress(bytes(body)) if self._compress else body
+        first_time = batch[0][0]
+        last_time = batch[-1][0]
+        self._file.write(
+            BLOCK_HEADER.pack(len(stored), len(batch), first_time, last_time)
+        )
+        self._file.write(stored)
+
+        self._index["blocks"].append([self.size, len(batch), first_time, last_time])
+        self._index["end_time"] = last_time
+        self._index["count"] += len(batch)
+        self.size += BLOCK_HEADER.size + len(stored)
+
+    def close(self) -> None:
+        self._file.close()
+        with open(self._path[: -len(SEGMENT_SUFFIX)] + INDEX_SUFFIX, "w") as f:
+            json.dump(self._index, f)
+
+
+class Recorder:
+    __slots__ = [
+        "_ws",
+        "_directory",
+        "_compression",
+        "_segment_size",
+        "_segment_time",
+        "_batch_size",
+        "_flush_interval",
+        "_batch",
+        "_queue",
+        "_thread",
+        "_task",
+        "_exception",
+    ]
+
+    def __init__(
+        self,
+        ws: Any,
+        directory: str,
+        compression: Optional[str] = None,
+        segment_size: int = 256 * 1024 * 1024,
+        segment_time: float = 3600,
+        batch_size: int = 1000,
+        flush_interval: float = 1,
+    ) -> None:
+        if compression is not None:
+            compression_codec(compression)
+
+        # A Websocket or a WebsocketPool
+        self._ws = ws
+        self._directory = directory
+        self._compression = compression
+        self._segment_size = segment_size
+        self._segment_time = int(segment_time * 1e9)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        self._batch: List[Record] = []
+        self._queue: "queue.Queue[Optional[List[Record]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Future] = None
+        self._exception: Optional[BaseException] = None
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def exception(self) -> Optional[BaseException]:
+        # The error that stopped the writer, raised again from stop
+        return self._exception
+
+    def _on_frame(self, frame: Union[str, bytes]) -> None:
+        if self._exception is not None:
+            # Recording stopped, the live stream is not affected
+            return
+
+        self._batch.append((time.time_ns(), frame))
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._batch:
+            self._queue.put(self._batch)
+            self._batch = []
+
+    async def _flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            if self._exception is not None:
+                self._ws.remove_frame_callback(self._on_frame)
+                return
+            self._flush()
+
+    def _writer(self) -> None:
+        segment: Optional[SegmentWriter] = None
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    break
+
+                if segment is not None and (
+                    segment.size >= self._segment_size
+                    or batch[0][0] - segment.start_time >= self._segment_time
+                ):
+                    segment.close()
+                    segment = None
+                if segment is None:
+                    segment = SegmentWriter(
+                        self._directory, self._compression, batch[0][0]
+                    )
+                segment.write(batch)
+        except BaseException as exp:
+            self._exception = exp
+        finally:
+            if segment is not None:
+                segment.close()
+
+    async def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._exception = None
+        self._batch = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+        self._ws.add_frame_callback(self._on_frame)
+        self._task = asyncio.ensure_future(self._flusher())
+
+    async def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._ws.remove_frame_callback(self._on_frame)
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._flush()
+        self._queue.put(None)
+        await asyncio.get_event_loop().run_in_executor(None, self._thread.join)
+        self._thread = None
+        if self._exception is not None:
+            raise self._exception
+
+
+def scan_segment(path: str) -> JsonObject:
+    # Rebuilds the time part of the index of a segment that was not closed
+    with open(path, "rb") as f:
+        magic, compression = SEGMENT_HEADER.unpack(f.read(SEGMENT_HEADER.size))
+        if magic != SEGMENT_MAGIC:
+            raise Exception(f"Not a recording segment: {path}")
+
+        blocks = []
+        offset = SEGMENT_HEADER.size
+        size = os.fstat(f.fileno()).st_size
+        while offset + BLOCK_HEADER.size <= size:
+            f.seek(offset)
+            length, count, first_time, last_time = BLOCK_HEADER.unpack(
+                f.read(BLOCK_HEADER.size)
+            )
+            if offset + BLOCK_HEADER.size + length > size:
+                # The last block is still being written
+                break
+            blocks.append([offset, count, first_time, last_time])
+            offset += BLOCK_HEADER.size + length
+
+    return {
+        "segment": os.path.basename(path),
+        "compression": compression.rstrip(b"\0").decode() or None,
+        "start_time": blocks[0][2] if blocks else 0,
+        "end_time": blocks[-1][3] if blocks else 0,
+        "count": sum(block[1] for block in blocks),
+        "streams": None,
+        "blocks": blocks,
+    }
+
+
+class RecordingReader:
+    __slots__ = ["_directory", "_segments"]
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        self._segments: List[JsonObject] = []
+        self.refresh()
+
+    @property
+    def segments(self) -> List[JsonObject]:
+        return self._segments
+
+    def refresh(self) -> None:
+        segments = []
+        for name in os.listdir(self._directory):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            path = os.path.join(self._directory, name)
+            index_path = path[: -len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+            if os.path.exists(index_path):
+                with open(index_path) as f:
+                    segments.append(json.load(f))
+            else:
+                segments.append(scan_segment(path))
+        self._segments = sorted(segments, key=lambda s: s["start_time"])
+
+    @property
+    def streams(self) -> List[str]:
+        streams: Set[str] = set()
+        for segment in self._segments:
+            streams.update(segment["streams"] or ())
+        return sorted(streams)
+
+    def read(
+        self,
+        streams: Optional[Collection[str]] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> Iterator[Tuple[int, bytes]]:
+        # Receive times are nanoseconds since the epoch
+        wanted = set(streams) if streams is not None else None
+        for segment in self._segments:
+            if start_time is not None and segment["end_time"] < start_time:
+                continue
+            if end_time is not None and segment["start_time"] > end_time:
+                continue
+            if (
+                wanted is not None
+                and segment["streams"] is not None
+                and wanted.isdisjoint(segment["streams"])
+            ):
+                continue
+            yield from self._read_segment(segment, wanted, start_time, end_time)
+
+    def _read_segment(
+        self,
+        segment: JsonObject,
+        wanted: Optional[Collection[str]],
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> Iterator[Tuple[int, bytes]]:
+        decompress = (
+            compression_codec(segment["compression"])[1]
+            if segment["compression"]
+            else None
+        )
+        path = os.path.join(self._directory, segment["segment"])
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset, _, first_time, last_time in segment["blocks"]:
+                    if start_time is not None and last_time < start_time:
+                        continue
+                    if end_time is not None and first_time > end_time:
+                        break
+
+                    length = BLOCK_HEADER.unpack_from(mm, offset)[0]
+                    begin = offset + BLOCK_HEADER.size
+                    body: Any = mm[begin : begin + length]
+                    if decompress is not None:
+                        body = decompress(body)
+
+                    position = 0
+                    while position < len(body):
+                        receive_time, size = RECORD_HEADER.unpack_from(body, position)
+                        position += RECORD_HEADER.size
+                        frame = body[position : position + size]
+                        position += size
+
+                        if start_time is not None and receive_time < start_time:
+                            continue
+                        if end_time is not None and receive_time > end_time:
+                            return
+                        if wanted is not None:
+                            routed = split_stream_frame(frame)
+                            if routed is None or routed[0] not in wanted:
+                                continue
+                        yield receive_time, frame
@@ -0,0 +1,87 @@
+import asyncio
+import heapq
+import json
+import time
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from binance4py.typing import JsonObject
+
+Frame = Union[str, bytes]
+# Event time in nanoseconds and the raw combined stream frame
+ReplayRecord = Tuple[int, Frame]
+
+
+def stream_frames(
+    stream: str,
+    events: Iterable[JsonObject],
+    json_dumps: Callable[[Any], Frame] = json.dumps,
+    time_key: str = "E",
+) -> Iterator[ReplayRecord]:
+    # Wraps stream payloads into the frames the combined stream endpoint sends
+    prefix = f'{{"stream":"{stream}","data":'
+    prefix_bytes = prefix.encode()
+    for event in events:
+        payload = json_dumps(event)
+        if isinstance(payload, bytes):
+            frame: Frame = prefix_bytes + payload + b"}"
+        else:
+            frame = prefix + payload + "}"
+        yield event[time_key] * 1000000, frame
+
+
+class Replay:
+    __slots__ = ["_sources", "_speed", "_batch_size", "_count"]
+
+    def __init__(
+        self,
+        *sources: Iterable[ReplayRecord],
+        speed: Optional[float] = 1,
+        batch_size: int = 1000,
+    ) -> None:
+        # speed 1 is real time, None replays as fast as possible
+        if speed is not None and speed <= 0:
+            raise Exception("Replay speed must be positive")
+
+        self._sources = sources
+        self._speed = speed
+        self._batch_size = batch_size
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def records(self) -> Iterator[ReplayRecord]:
+        # Every source is already in time order, merging keeps it across them
+        if len(self._sources) == 1:
+            return iter(self._sources[0])
+        return heapq.merge(*self._sources, key=itemgetter(0))
+
+    async def run(self, on_frame: Callable[[Frame], Awaitable[None]]) -> None:
+        speed = self._speed
+        batch_size = self._batch_size
+        started_at = time.perf_counter()
+        first_time: Optional[int] = None
+        count = 0
+
+        for event_time, frame in self.records():
+            if speed is not None:
+                if first_time is None:
+                    first_time = event_time
+                delay = (
+                    started_at
+                    + (event_time - first_time) / 1e9 / speed
+                    - time.perf_counter()
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await on_frame(frame)
+            count += 1
+            if count % batch_size == 0:
+                # Lets the dispatched callbacks run between bursts
+                self._count = count
+                await asyncio.sleep(0)
+
+        self._count = count
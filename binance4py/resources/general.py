@@ -31,4 +31,5 @@ class General(Resource):
             method="GET",
             url=self._client._api_url + self._client._endpoints.exchange_info,
             params={"symbols": symbols, "permissions": permissions},
+            weight=10,
         )
@@ -1,16 +1,59 @@
-from typing import List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Union
 
+from binance4py.cache import RequestCache
+from binance4py.columnar import AggTradeColumns, KlineColumns, TradeColumns
+from binance4py.pagination import (
+    fetch_time_window,
+    id_windows,
+    iterate_windows,
+    throttle,
+    time_windows,
+)
+from binance4py.ratelimit import (
+    order_book_weight,
+    rolling_window_ticker_weight,
+    ticker_24hr_weight,
+    ticker_weight,
+)
 from binance4py.typing import JsonObject
+from binance4py.utils import (
+    create_query_string,
+    get_timestamp,
+    interval_to_milliseconds,
+)
 
 from .base import Resource
 
 
 class Market(Resource):
+    __slots__ = ["_cache"]
+
+    def __init__(self, client, cache: Optional[RequestCache] = None) -> None:
+        super().__init__(client)
+        self._cache = cache
+
+    async def _cached_request(
+        self, name: str, params: JsonObject, weight: int = 1
+    ) -> Any:
+        fetch = partial(
+            self._client.request,
+            method="GET",
+            url=self._client._api_url + getattr(self._client._endpoints, name),
+            params=params,
+            weight=weight,
+        )
+        if self._cache is None:
+            return await fetch()
+        # Callers of one merged request share the same response object
+        return await self._cache.get(name, create_query_string(params), fetch)
+
     async def order_book(self, symbol: str, limit: Optional[int] = None) -> JsonObject:
         return await self._client.request(
             method="GET",
             url=self._client._api_url + self._client._endpoints.order_book,
             params={"symbol": symbol, "limit": limit},
+            weight=order_book_weight(limit),
         )
 
     async def recent_trades(
@@ -22,6 +65,11 @@ class Market(Resource):
             params={"symbol": symbol, "limit": limit},
         )
 
+    async def recent_trades_columns(
+        self, symbol: str, limit: Optional[int] = None
+    ) -> TradeColumns:
+        return TradeColumns.from_rows(await self.recent_trades(symbol, limit))
+
     async def old_trades(
         self, symbol: str, limit: Optional[int] = None, from_id: Optional[int] = None
     ) -> List[JsonObject]:
@@ -29,8 +77,26 @@ class Market(Resource):
             method="GET",
             url=self._client._api_url + self._client._endpoints.old_trades,
             params={"symbol": symbol, "limit": limit, "fromId": from_id},
+            weight=5,
         )
 
+    async def iter_old_trades(
+        self,
+        symbol: str,
+        from_id: int,
+        to_id: Optional[int] = None,
+        limit: int = 1000,
+        concurrency: int = 5,
+        weight_limit: Optional[int] = None,
+    ) -> AsyncIterator[JsonObject]:
+        if to_id is None:
+            to_id = (await self.recent_trades(symbol, 1))[-1]["id"]
+
+        fetch = throttle(partial(self.old_trades, symbol), weight_limit, 5)
+        windows = (partial(fetch, n, i) for i, n in id_windows(from_id, to_id, limit))
+        async for trade in iterate_windows(windows, concurrency):
+            yield trade
+
     async def aggregate_trades(
         self,
         symbol: str,
@@ -51,6 +117,59 @@ class Market(Resource):
             },
         )
 
+    async def aggregate_trades_columns(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AggTradeColumns:
+        return AggTradeColumns.from_rows(
+            await self.aggregate_trades(symbol, from_id, start_time, end_time, limit)
+        )
+
+    async def iter_aggregate_trades(
+        self,
+        symbol: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        limit: int = 1000,
+        concurrency: int = 5,
+        weight_limit: Optional[int] = None,
+    ) -> AsyncIterator[JsonObject]:
+        if from_id is not None:
+            if to_id is None:
+                to_id = (await self.aggregate_trades(symbol, limit=1))[-1]["a"]
+
+            fetch = throttle(partial(self.aggregate_trades, symbol), weight_limit)
+            windows = (
+                partial(fetch, i, None, None, n)
+                for i, n in id_windows(from_id, to_id, limit)
+            )
+        elif start_time is not None:
+            if end_time is None:
+                end_time = get_timestamp()
+
+            async def fetch_page(
+                start: Optional[int], end: Optional[int], from_id: Optional[int] = None
+            ) -> List[JsonObject]:
+                return await self.aggregate_trades(symbol, from_id, start, end, limit)
+
+            fetch = throttle(fetch_page, weight_limit)
+            # The time between startTime and endTime must be less than 1 hour
+            windows = (
+                partial(fetch_time_window, fetch, start, end, limit, "T", "a")
+                for start, end in time_windows(start_time, end_time, 3600000)
+            )
+        else:
+            raise Exception("Either from_id or start_time must be specified")
+
+        async for trade in iterate_windows(windows, concurrency):
+            yield trade
+
     async def klines(
         self,
         symbol: str,
@@ -71,6 +190,43 @@ class Market(Resource):
             },
         )
 
+    async def klines_columns(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> KlineColumns:
+        return KlineColumns.from_rows(
+            await self.klines(symbol, interval, start_time, end_time, limit)
+        )
+
+    async def iter_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        limit: int = 1000,
+        concurrency: int = 5,
+        weight_limit: Optional[int] = None,
+    ) -> AsyncIterator[List[Any]]:
+        if end_time is None:
+            end_time = get_timestamp()
+
+        fetch = throttle(
+            partial(self.klines, symbol, interval, limit=limit), weight_limit
+        )
+        windows = (
+            partial(fetch_time_window, fetch, start, end, limit, 0)
+            for start, end in time_windows(
+                start_time, end_time, interval_to_milliseconds(interval) * limit
+            )
+        )
+        async for kline in iterate_windows(windows, concurrency):
+            yield kline
+
     async def ui_klines(
         self,
         symbol: str,
@@ -92,11 +248,7 @@ class Market(Resource):
         )
 
     async def average_price(self, symbol: str) -> JsonObject:
-        return await self._client.request(
-            method="GET",
-            url=self._client._api_url + self._client._endpoints.average_price,
-            params={"symbol": symbol},
-        )
+        return await self._cached_request("average_price", {"symbol": symbol})
 
     async def ticker_24hr(
         self,
@@ -106,10 +258,10 @@ class Market(Resource):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        return await self._client.request(
-            method="GET",
-            url=self._client._api_url + self._client._endpoints.ticker_24hr,
-            params={"symbols": symbols, "type": type},
+        return await self._cached_request(
+            "ticker_24hr",
+            {"symbols": symbols, "type": type},
+            ticker_24hr_weight(symbols),
         )
 
     async def price_ticker(
@@ -118,10 +270,8 @@ class Market(Resource):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        return await self._client.request(
-            method="GET",
-            url=self._client._api_url + self._client._endpoints.price_ticker,
-            params={"symbols": symbols},
+        return await self._cached_request(
+            "price_ticker", {"symbols": symbols}, ticker_weight(symbols)
         )
 
     async def order_book_ticker(
@@ -130,10 +280,8 @@ class Market(Resource):
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        return await self._client.request(
-            method="GET",
-            url=self._client._api_url + self._client._endpoints.order_book_ticker,
-            params={"symbols": symbols},
+        return await self._cached_request(
+            "order_book_ticker", {"symbols": symbols}, ticker_weight(symbols)
         )
 
     async def rolling_window_ticker(
@@ -149,4 +297,5 @@ class Market(Resource):
             method="GET",
             url=self._client._api_url + self._client._endpoints.rolling_window_ticker,
             params={"symbols": symbols, "windowSize": window_size, "type": type},
+            weight=rolling_window_ticker_weight(symbols),
         )
@@ -1,7 +1,15 @@
 from decimal import Decimal
-from typing import List, Optional, Union
+from functools import partial
+from typing import AsyncIterator, List, Optional, Union
 
+from binance4py.pagination import (
+    fetch_time_window,
+    iterate_windows,
+    throttle,
+    time_windows,
+)
 from binance4py.typing import JsonObject
+from binance4py.utils import get_timestamp
 
 from .base import Resource
 
@@ -83,6 +91,7 @@ class Spot(Resource):
                 "icebergQty": iceberg_qty,
                 "newOrderRespType": order_resp_type,
             },
+            orders=1,
         )
 
     async def cancel_order(
@@ -127,6 +136,7 @@ class Spot(Resource):
                 "orderId": order_id,
                 "origClientOrderId": orig_client_order_id,
             },
+            weight=2,
         )
 
     async def replace_order(
@@ -174,6 +184,7 @@ class Spot(Resource):
                 "icebergQty": iceberg_qty,
                 "newOrderRespType": order_resp_type,
             },
+            orders=1,
         )
 
     async def open_orders(self, symbol: Optional[str] = None) -> List[JsonObject]:
@@ -182,6 +193,7 @@ class Spot(Resource):
             url=self._client._api_url + self._client._endpoints.open_orders,
             signed=True,
             params={"symbol": symbol},
+            weight=3 if symbol is not None else 40,
         )
 
     async def all_orders(
@@ -203,8 +215,35 @@ class Spot(Resource):
                 "endTime": end_time,
                 "limit": limit,
             },
+            weight=10,
         )
 
+    async def iter_all_orders(
+        self,
+        symbol: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        limit: int = 1000,
+        concurrency: int = 5,
+        weight_limit: Optional[int] = None,
+    ) -> AsyncIterator[JsonObject]:
+        if end_time is None:
+            end_time = get_timestamp()
+
+        async def fetch_page(
+            start: Optional[int], end: Optional[int], order_id: Optional[int] = None
+        ) -> List[JsonObject]:
+            return await self.all_orders(symbol, order_id, start, end, limit)
+
+        fetch = throttle(fetch_page, weight_limit, 10)
+        # The time between startTime and endTime can't be longer than 24 hours
+        windows = (
+            partial(fetch_time_window, fetch, start, end, limit, "time", "orderId")
+            for start, end in time_windows(start_time, end_time, 86400000)
+        )
+        async for order in iterate_windows(windows, concurrency):
+            yield order
+
     async def create_oco_order(
         self,
         symbol: str,
@@ -250,6 +289,7 @@ class Spot(Resource):
                 "stopLimitTimeInForce": stop_limit_time_in_force,
                 "newOrderRespType": new_order_resp_type,
             },
+            orders=2,
         )
 
     async def cancel_oco_order(
@@ -284,6 +324,7 @@ class Spot(Resource):
                 "orderListId": order_list_id,
                 "origClientOrderId": orig_client_order_id,
             },
+            weight=2,
         )
 
     async def query_all_oco_order(
@@ -303,6 +344,7 @@ class Spot(Resource):
                 "endTime": end_time,
                 "limit": limit,
             },
+            weight=10,
         )
 
     async def query_open_oco_order(self) -> List[JsonObject]:
@@ -310,6 +352,7 @@ class Spot(Resource):
             method="GET",
             url=self._client._api_url + self._client._endpoints.query_open_oco_order,
             signed=True,
+            weight=3,
         )
 
     async def account_info(self) -> JsonObject:
@@ -317,6 +360,7 @@ class Spot(Resource):
             method="GET",
             url=self._client._api_url + self._client._endpoints.account_info,
             signed=True,
+            weight=10,
         )
 
     async def account_trade_list(
@@ -340,11 +384,41 @@ class Spot(Resource):
                 "fromId": from_id,
                 "limit": limit,
             },
+            weight=10,
+        )
+
+    async def iter_account_trade_list(
+        self,
+        symbol: str,
+        start_time: int,
+        end_time: Optional[int] = None,
+        limit: int = 1000,
+        concurrency: int = 5,
+        weight_limit: Optional[int] = None,
+    ) -> AsyncIterator[JsonObject]:
+        if end_time is None:
+            end_time = get_timestamp()
+
+        async def fetch_page(
+            start: Optional[int], end: Optional[int], from_id: Optional[int] = None
+        ) -> List[JsonObject]:
+            return await self.account_trade_list(
+                symbol, None, start, end, from_id, limit
+            )
+
+        fetch = throttle(fetch_page, weight_limit, 10)
+        # The time between startTime and endTime can't be longer than 24 hours
+        windows = (
+            partial(fetch_time_window, fetch, start, end, limit, "time", "id")
+            for start, end in time_windows(start_time, end_time, 86400000)
         )
+        async for trade in iterate_windows(windows, concurrency):
+            yield trade
 
     async def order_rate_limit(self) -> List[JsonObject]:
         return await self._client.request(
             method="GET",
             url=self._client._api_url + self._client._endpoints.order_rate_limit,
             signed=True,
+            weight=20,
         )
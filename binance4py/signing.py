@@ -0,0 +1,58 @@
+import base64
+import hashlib
+import hmac
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+
+
+class Signer(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def sign(self, payload: bytes) -> str:
+        pass
+
+
+class HmacSigner(Signer):
+    __slots__ = ["_hmac"]
+
+    def __init__(self, api_secret: str) -> None:
+        # Keyed once, every signature works on a copy of this object
+        self._hmac = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign(self, payload: bytes) -> str:
+        h = self._hmac.copy()
+        h.update(payload)
+        return h.hexdigest()
+
+
+class _PemSigner(Signer):
+    __slots__ = ["_private_key"]
+
+    def __init__(
+        self, private_key: Union[str, bytes], password: Optional[bytes] = None
+    ) -> None:
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+        if isinstance(private_key, str):
+            private_key = private_key.encode("utf-8")
+        self._private_key: Any = load_pem_private_key(private_key, password)
+
+
+class Ed25519Signer(_PemSigner):
+    __slots__ = ()
+
+    def sign(self, payload: bytes) -> str:
+        return base64.b64encode(self._private_key.sign(payload)).decode("ascii")
+
+
+class RsaSigner(_PemSigner):
+    __slots__ = ()
+
+    def sign(self, payload: bytes) -> str:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        return base64.b64encode(
+            self._private_key.sign(payload, padding.PKCS1v15(), hashes.SHA256())
+        ).decode("ascii")
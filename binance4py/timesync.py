@@ -0,0 +1,69 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+class TimeSync:
+    __slots__ = ["_client", "_interval", "_samples", "_offset", "_rtt", "_task"]
+
+    def __init__(self, client, interval: float = 60, samples: int = 8) -> None:
+        self._client = client
+        self._interval = interval
+        # (rtt, offset) pairs, the one with the lowest rtt has the smallest error
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=samples)
+        self._offset = 0.0
+        self._rtt: Optional[float] = None
+        self._task: Optional[asyncio.Future] = None
+
+    @property
+    def offset(self) -> float:
+        return self._offset
+
+    @property
+    def rtt(self) -> Optional[float]:
+        return self._rtt
+
+    def timestamp(self) -> int:
+        return int(time.time() * 1000 + self._offset)
+
+    async def sample(self) -> None:
+        started_at = time.time() * 1000
+        start = time.perf_counter()
+        server_time = (
+            await self._client.request(
+                method="GET",
+                url=self._client._api_url + self._client._endpoints.server_time,
+            )
+        )["serverTime"]
+        rtt = (time.perf_counter() - start) * 1000
+
+        self._samples.append((rtt, server_time - (started_at + rtt / 2)))
+        self._rtt, self._offset = min(self._samples)
+
+    async def sync(self, samples: int = 3) -> None:
+        for _ in range(samples):
+            await self.sample()
+
+    async def _syncer(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.sample()
+            except Exception:
+                # The last known offset stays in use until the next sample
+                pass
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.sync()
+        self._task = asyncio.ensure_future(self._syncer())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
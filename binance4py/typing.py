@@ -1,5 +1,6 @@
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Union
 
 JsonObject = Dict[str, Any]
 JsonDumper = Callable[[JsonObject], str]
-JsonLoader = Callable[[str], JsonObject]
+# Loaders get websocket frames and response bodies as bytes where possible
+JsonLoader = Callable[[Union[str, bytes]], JsonObject]
@@ -1,7 +1,20 @@
+import json
 import time
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional, Union
+from urllib.parse import urlencode
+
+from binance4py.fixedpoint import Fixed
+
+KLINE_INTERVALS = {
+    "s": 1000,
+    "m": 60000,
+    "h": 3600000,
+    "d": 86400000,
+    "w": 604800000,
+    "M": 2592000000,
+}
 
 
 def create_query_dict(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -10,7 +23,9 @@ def create_query_dict(params: Dict[str, Any]) -> Dict[str, Any]:
         if v is None:
             continue
         elif isinstance(v, list):
-            query_dict[k] = str(v).replace("'", '"').replace(" ", "")
+            query_dict[k] = json.dumps(v, separators=(",", ":"))
+        elif isinstance(v, Fixed):
+            query_dict[k] = str(v)
         elif isinstance(v, (int, float, Decimal)):
             query_dict[k] = number_to_string(v)
         else:
@@ -18,6 +33,10 @@ def create_query_dict(params: Dict[str, Any]) -> Dict[str, Any]:
     return query_dict
 
 
+def create_query_string(params: Dict[str, Any]) -> str:
+    return urlencode(create_query_dict(params))
+
+
 def millisecond_to_datetime(ms: int) -> datetime:
     return datetime.fromtimestamp(ms / 1000)
 
@@ -26,20 +45,43 @@ def get_timestamp() -> int:
     return int(time.time() * 1000)
 
 
+def interval_to_milliseconds(interval: str) -> int:
+    return int(interval[:-1]) * KLINE_INTERVALS[interval[-1]]
+
+
+def to_decimal(num: Union[str, int, float, Decimal]) -> Decimal:
+    if isinstance(num, (int, float)):
+        return Decimal(str(num))
+    elif isinstance(num, str):
+        return Decimal(num)
+    return num
+
+
+class Quantizer:
+    __slots__ = ["tick_size"]
+
+    def __init__(self, tick_size: Union[str, Decimal]) -> None:
+        # Normalized once instead of on every quantize_tick_size call
+        self.tick_size = to_decimal(tick_size).normalize()
+
+    def __call__(
+        self, num: Union[str, int, float, Decimal], rounding: Optional[str] = None
+    ) -> Decimal:
+        return to_decimal(num).quantize(self.tick_size, rounding).normalize()
+
+
 def quantize_tick_size(
     num: Union[str, int, float, Decimal],
-    tick_size: Union[str, Decimal],
+    tick_size: Union[str, Decimal, Quantizer],
     rounding: Optional[str] = None,
 ) -> Decimal:
-    if isinstance(num, (int, float)):
-        num = Decimal(str(num))
-    elif isinstance(num, str):
-        num = Decimal(num)
+    if isinstance(tick_size, Quantizer):
+        return tick_size(num, rounding)
 
     if isinstance(tick_size, str):
         tick_size = Decimal(tick_size)
 
-    return num.quantize(tick_size.normalize(), rounding).normalize()
+    return to_decimal(num).quantize(tick_size.normalize(), rounding).normalize()
 
 
 def number_to_string(num: Union[int, float, Decimal]) -> str:
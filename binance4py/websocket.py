@@ -1,52 +1,85 @@
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, cast
-
-from aiohttp import ClientWebSocketResponse, WSMsgType
-
+import inspect
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union, cast
+
+from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+
+from binance4py.client import CONNECTION_ERRORS
+from binance4py.dispatch import Dispatcher, TaskDispatcher
+from binance4py.exception import BinanceWebsocketException
+from binance4py.metrics import TimedCallback
+from binance4py.models import (
+    AggTrade,
+    BookTicker,
+    DepthUpdate,
+    Kline,
+    ModelCallback,
+    Numeric,
+    Trade,
+    user_data_model,
+)
+from binance4py.replay import Replay
 from binance4py.resources import Resource
 from binance4py.typing import JsonObject
+from binance4py.utils import get_timestamp
 
 WEBSOCKET_URL = "wss://stream.binance.{}:443/stream"
 WEBSOCKET_TEST_URL = "wss://testnet.binance.vision/stream"
 
+MAX_URL_STREAMS_LENGTH = 4096
+MAX_SUBSCRIBE_STREAMS = 200
+MAX_CONTROL_MESSAGES = 5  # per second
 
-class Websocket(Resource):
-    __slots__ = [
-        "_websocket_url",
-        "_conn",
-        "_exception",
-        "_open_event",
-        "_close_event",
-        "_rate_limit",
-        "_listeners",
-        "_stream_callbacks",
-        "_last_id",
-        "_listen_key",
-    ]
+# Newer aiohttp versions can pass text frames as bytes without decoding them
+WS_CONNECT_OPTIONS: Dict[str, Any] = (
+    {"decode_text": False}
+    if "decode_text" in inspect.signature(ClientSession.ws_connect).parameters
+    else {}
+)
 
-    def __init__(self, client) -> None:
-        super().__init__(client)
-        self._websocket_url = (
-            WEBSOCKET_URL.format(self._client._tld)
-            if not self._client._testnet
-            else WEBSOCKET_TEST_URL
-        )
+# Combined stream frame markers for text frames and for undecoded ones
+STREAM_FRAME_MARKERS: Dict[type, Tuple[Any, Any]] = {
+    str: ('{"stream":"', '","data":'),
+    bytes: (b'{"stream":"', b'","data":'),
+}
 
-        self._conn: Optional[ClientWebSocketResponse] = None
-        self._exception: Optional[BaseException] = None
-        self._open_event = asyncio.Event()
-        self._close_event = asyncio.Event()
+StreamDecoder = Callable[[Union[str, bytes]], Any]
 
-        self._rate_limit = asyncio.Semaphore(5)  # rps
-        self._listeners: Dict[int, asyncio.Future] = {}
-        self._stream_callbacks: Dict[str, List[Callable]] = {}
-        self._last_id = 1
 
+def split_stream_frame(
+    frame: Union[str, bytes],
+) -> Optional[Tuple[str, Union[str, bytes]]]:
+    # Frames are {"stream":"<name>","data":<payload>}, the name is read without
+    # parsing so the payload can go to the decoder of its stream
+    prefix, separator = STREAM_FRAME_MARKERS[type(frame)]
+    if not frame.startswith(prefix):
+        return None
+    end = frame.find(separator, len(prefix))
+    if end == -1:
+        return None
+
+    name = frame[len(prefix) : end]
+    stream = name.decode() if isinstance(name, bytes) else name
+    return stream, frame[end + len(separator) : -1]
+
+
+class Streams(Resource, ABC):
+    __slots__ = ["_listen_key", "_stream_decoders"]
+
+    def __init__(self, client) -> None:
+        super().__init__(client)
         self._listen_key: Optional[str] = None
+        self._stream_decoders: Dict[str, StreamDecoder] = {}
 
-    @property
-    def closed(self) -> bool:
-        return self._conn is None
+    def set_stream_decoder(self, stream: str, decoder: StreamDecoder) -> None:
+        self._stream_decoders[stream] = decoder
+
+    def remove_stream_decoder(self, stream: str) -> None:
+        self._stream_decoders.pop(stream, None)
 
     async def create_listen_key(self) -> str:
         return (
@@ -70,75 +103,55 @@ class Websocket(Resource):
             params={"listenKey": listen_key},
         )
 
-    async def _send(
-        self, method: str, params: Optional[List[Any]] = None
-    ) -> JsonObject:
-        if self.closed:
-            raise Exception("Websocket connection is closed")
-
-        async with self._rate_limit:
-            if self._rate_limit.locked():
-                await asyncio.sleep(1)
-
-            d = {"method": method, "id": self._last_id}
-            self._last_id += 1
-
-            if params is not None:
-                d["params"] = params
-
-            future = asyncio.get_running_loop().create_future()
-            self._listeners[cast(int, d["id"])] = future
-
-            await self._conn.send_json(  # type:ignore
-                data=d, dumps=self._client._json_dumps
-            )
-
-            return await asyncio.wait_for(future, 10)
-
-    async def subscribe(self, stream: str) -> JsonObject:
-        return await self._send("SUBSCRIBE", [stream])
-
-    async def subscribe_callback(self, stream: str, callback: Callable) -> None:
-        if stream not in self._stream_callbacks:
-            await self.subscribe(stream)
-
-            self._stream_callbacks[stream] = [callback]
-        else:
-            self._stream_callbacks[stream].append(callback)
-
-    async def unsubscribe(self, stream: str) -> JsonObject:
-        return await self._send("UNSUBSCRIBE", [stream])
-
-    async def unsubscribe_callback(self, stream: str, callback: Callable) -> None:
-        if stream in self._stream_callbacks:
-            if len(self._stream_callbacks[stream]) <= 1:
-                await self.unsubscribe_all_callbacks(stream)
-            else:
-                try:
-                    self._stream_callbacks[stream].remove(callback)
-                except ValueError:
-                    pass
-
-    async def unsubscribe_all_callbacks(self, stream: str) -> None:
-        await self.unsubscribe(stream)
-        if stream in self._stream_callbacks:
-            self._stream_callbacks.pop(stream)
-
-    async def subscriptions(self) -> List[str]:
-        return (await self._send("LIST_SUBSCRIPTIONS"))["result"]
+    @abstractmethod
+    async def subscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        pass
 
-    async def aggregate_trade(self, callback: Callable, symbol: str) -> str:
+    @abstractmethod
+    async def unsubscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        pass
+
+    async def aggregate_trade(
+        self,
+        callback: Callable,
+        symbol: str,
+        model: bool = False,
+        numeric: Numeric = float,
+    ) -> str:
         stream = f"{symbol.lower()}@aggTrade"
+        if model:
+            callback = ModelCallback(callback, AggTrade, numeric)
         await self.subscribe_callback(stream, callback)
         return stream
 
-    async def trade(self, callback: Callable, symbol: str) -> str:
+    async def trade(
+        self,
+        callback: Callable,
+        symbol: str,
+        model: bool = False,
+        numeric: Numeric = float,
+    ) -> str:
         stream = f"{symbol.lower()}@trade"
+        if model:
+            callback = ModelCallback(callback, Trade, numeric)
         await self.subscribe_callback(stream, callback)
         return stream
 
-    async def kline(self, callback: Callable, symbol: str, interval: str) -> str:
+    async def kline(
+        self,
+        callback: Callable,
+        symbol: str,
+        interval: str,
+        model: bool = False,
+        numeric: Numeric = float,
+    ) -> str:
         stream = f"{symbol.lower()}@kline_{interval}"
+        if model:
+            callback = ModelCallback(callback, Kline, numeric)
         await self.subscribe_callback(stream, callback)
         return stream
 
@@ -174,8 +187,16 @@ class Websocket(Resource):
         await self.subscribe_callback(stream, callback)
         return stream
 
-    async def book_ticker(self, callback: Callable, symbol: str) -> str:
+    async def book_ticker(
+        self,
+        callback: Callable,
+        symbol: str,
+        model: bool = False,
+        numeric: Numeric = float,
+    ) -> str:
         stream = f"{symbol.lower()}@bookTicker"
+        if model:
+            callback = ModelCallback(callback, BookTicker, numeric)
         await self.subscribe_callback(stream, callback)
         return stream
 
@@ -187,9 +208,16 @@ class Websocket(Resource):
         return stream
 
     async def depth(
-        self, callback: Callable, symbol: str, update_speed: int = 1000
+        self,
+        callback: Callable,
+        symbol: str,
+        update_speed: int = 1000,
+        model: bool = False,
+        numeric: Numeric = float,
     ) -> str:
         stream = f"{symbol.lower()}@depth@{update_speed}ms"
+        if model:
+            callback = ModelCallback(callback, DepthUpdate, numeric)
         await self.subscribe_callback(stream, callback)
         return stream
 
@@ -200,68 +228,462 @@ class Websocket(Resource):
             await asyncio.sleep(interval)
             await self.keep_alive_listen_key(listen_key)
 
-    async def user_data(self, callback: Callable) -> str:
+    async def user_data(
+        self, callback: Callable, model: bool = False, numeric: Numeric = float
+    ) -> str:
+        if model:
+            callback = ModelCallback(callback, user_data_model, numeric)
         if self._listen_key is None:
             self._listen_key = await self.create_listen_key()
             asyncio.ensure_future(self._keep_alive_user_stream(self._listen_key))
         await self.subscribe_callback(self._listen_key, callback)
         return self._listen_key
 
-    def _handle_task_exception(self, f: asyncio.Task) -> None:
-        if not f.cancelled():
-            exp = f.exception()
-            if exp is not None:
-                self._exception = exp
-                asyncio.create_task(self.stop())
 
-    async def _starter(self) -> None:
+class Websocket(Streams):
+    __slots__ = [
+        "_websocket_url",
+        "_conn",
+        "_connecting",
+        "_exception",
+        "_open_event",
+        "_close_event",
+        "_send_lock",
+        "_sent_at",
+        "_listeners",
+        "_stream_callbacks",
+        "_last_id",
+        "_message_count",
+        "_dispatcher",
+        "_reconnect",
+        "_reconnect_delay",
+        "_max_reconnect_delay",
+        "_runner_task",
+        "_stopping",
+        "_connected_at",
+        "_disconnected_at",
+        "_gap_callbacks",
+        "_frame_callbacks",
+        "_source",
+        "_metrics",
+    ]
+
+    def __init__(
+        self,
+        client,
+        dispatcher: Optional[Dispatcher] = None,
+        reconnect: bool = False,
+        reconnect_delay: float = 1,
+        max_reconnect_delay: float = 60,
+    ) -> None:
+        super().__init__(client)
+        self._websocket_url = (
+            WEBSOCKET_URL.format(self._client._tld)
+            if not self._client._testnet
+            else WEBSOCKET_TEST_URL
+        )
+
+        self._conn: Optional[ClientWebSocketResponse] = None
+        # The url of the connection being opened has the streams registered so far
+        self._connecting = False
+        self._exception: Optional[BaseException] = None
+        self._open_event = asyncio.Event()
+        self._close_event = asyncio.Event()
+
+        self._send_lock = asyncio.Lock()
+        self._sent_at: Deque[float] = deque(maxlen=MAX_CONTROL_MESSAGES)
+        self._listeners: Dict[int, asyncio.Future] = {}
+        self._stream_callbacks: Dict[str, List[Callable]] = {}
+        self._last_id = 1
+        self._message_count = 0
+
+        self._dispatcher = dispatcher or TaskDispatcher()
+        self._dispatcher.bind(self._handle_exception)
+
+        self._reconnect = reconnect
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._runner_task: Optional[asyncio.Future] = None
+        self._stopping = False
+        self._connected_at: Optional[int] = None
+        self._disconnected_at: Optional[int] = None
+        self._gap_callbacks: List[Callable] = []
+        self._frame_callbacks: List[Callable] = []
+        self._source: Optional[Replay] = None
+
+        self._metrics = self._client._metrics
+
+    @property
+    def closed(self) -> bool:
+        return self._conn is None
+
+    @property
+    def connecting(self) -> bool:
+        return self._connecting
+
+    @property
+    def message_count(self) -> int:
+        return self._message_count
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        return self._dispatcher.queue_sizes
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._stream_callbacks)
+
+    async def _request(
+        self, method: str, params: Optional[Union[List[Any], JsonObject]] = None
+    ) -> JsonObject:
+        if self.closed:
+            raise Exception("Websocket connection is closed")
+
+        d = {"method": method, "id": self._last_id}
+        self._last_id += 1
+
+        if params is not None:
+            d["params"] = params
+
+        future = asyncio.get_running_loop().create_future()
+        self._listeners[cast(int, d["id"])] = future
+
+        await self._conn.send_json(  # type:ignore
+            data=d, dumps=self._client._json_dumps
+        )
+
+        return await asyncio.wait_for(future, 10)
+
+    async def _send(
+        self, method: str, params: Optional[List[Any]] = None
+    ) -> JsonObject:
+        async with self._send_lock:
+            if len(self._sent_at) == MAX_CONTROL_MESSAGES:
+                delay = self._sent_at[0] + 1 - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self._sent_at.append(time.monotonic())
+
+        data = await self._request(method, params)
+        if "error" in data:
+            raise BinanceWebsocketException(data["error"])
+        return data
+
+    async def _send_streams(self, method: str, streams: List[str]) -> JsonObject:
+        data: JsonObject = {}
+        for i in range(0, len(streams), MAX_SUBSCRIBE_STREAMS):
+            data = await self._send(method, streams[i : i + MAX_SUBSCRIBE_STREAMS])
+        return data
+
+    async def subscribe(self, streams: Union[str, List[str]]) -> JsonObject:
+        if isinstance(streams, str):
+            streams = [streams]
+        return await self._send_streams("SUBSCRIBE", streams)
+
+    async def subscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        new_streams = []
+        for stream in dict.fromkeys(streams):
+            if stream in self._stream_callbacks:
+                self._stream_callbacks[stream].append(callback)
+            else:
+                # Messages of the stream can arrive before the subscribe response
+                self._stream_callbacks[stream] = [callback]
+                new_streams.append(stream)
+
+        if not new_streams or self.closed:
+            # Streams declared before start go into the connection url, the ones
+            # declared while connecting are subscribed once the connection is open
+            return
+        try:
+            await self.subscribe(new_streams)
+        except BaseException:
+            for stream in new_streams:
+                self._stream_callbacks.pop(stream, None)
+            raise
+
+    async def unsubscribe(self, streams: Union[str, List[str]]) -> JsonObject:
+        if isinstance(streams, str):
+            streams = [streams]
+        return await self._send_streams("UNSUBSCRIBE", streams)
+
+    async def unsubscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        last_streams = []
+        for stream in streams:
+            callbacks = self._stream_callbacks.get(stream)
+            if callbacks is None:
+                continue
+            if len(callbacks) <= 1:
+                last_streams.append(stream)
+            else:
+                try:
+                    callbacks.remove(callback)
+                except ValueError:
+                    pass
+
+        if last_streams:
+            await self.unsubscribe_all_callbacks(last_streams)
+
+    async def unsubscribe_all_callbacks(self, streams: Union[str, List[str]]) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        if not self.closed:
+            await self.unsubscribe(streams)
+        for stream in streams:
+            self._stream_callbacks.pop(stream, None)
+
+    async def subscriptions(self) -> List[str]:
+        return (await self._send("LIST_SUBSCRIPTIONS"))["result"]
+
+    def add_gap_callback(self, callback: Callable) -> None:
+        self._gap_callbacks.append(callback)
+
+    def remove_gap_callback(self, callback: Callable) -> None:
+        try:
+            self._gap_callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def set_source(self, source: Optional[Replay]) -> None:
+        # Frames are fed by the replay on start instead of the network connection
+        self._source = source
+
+    def add_frame_callback(self, callback: Callable) -> None:
+        # Called synchronously with every raw frame before it is decoded
+        self._frame_callbacks.append(callback)
+
+    def remove_frame_callback(self, callback: Callable) -> None:
+        try:
+            self._frame_callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def _handle_exception(self, exp: BaseException) -> None:
+        self._exception = exp
+        asyncio.create_task(self.stop())
+
+    def _connection_url(self) -> Tuple[str, List[str]]:
+        # Restore as many streams as possible through the combined stream url,
+        # the rest is subscribed with control messages after connecting
+        streams = list(self._stream_callbacks)
+        length = 0
+        for i, stream in enumerate(streams):
+            length += len(stream) + 1
+            if length > MAX_URL_STREAMS_LENGTH:
+                break
+        else:
+            i = len(streams)
+
+        if i == 0:
+            return self._websocket_url, []
+        return (
+            self._websocket_url + "?streams=" + "/".join(streams[:i]),
+            streams[:i],
+        )
+
+    async def _restore(self, streams: List[str], removed: List[str]) -> None:
+        try:
+            if removed:
+                await self._send_streams("UNSUBSCRIBE", removed)
+            if streams:
+                await self._send_streams("SUBSCRIBE", streams)
+        except Exception:
+            if self.closed:
+                # The next connection restores the streams again
+                return
+            raise
+
+        disconnected_at = self._disconnected_at
+        if disconnected_at is None:
+            return
+
+        self._disconnected_at = None
+        reconnected_at = get_timestamp()
+        for callback in self._gap_callbacks:
+            await callback(disconnected_at, reconnected_at)
+
+    async def _dispatch(self, stream: str, data: Any) -> None:
+        self._message_count += 1
+        callbacks = self._stream_callbacks.get(stream)
+        if callbacks is None:
+            # Subscribed without callbacks or unsubscribed while in flight
+            return
+
+        metrics = self._metrics
+        if metrics is not None:
+            tags = {"stream": stream}
+            metrics.increment("stream_messages", tags=tags)
+            if isinstance(data, dict) and "E" in data:
+                # Server clock based when time sync is enabled
+                metrics.timing(
+                    "stream_lag_seconds",
+                    (self._client._timestamp() - data["E"]) / 1000,
+                    tags,
+                )
+            enqueued_at = time.perf_counter()
+            callbacks = [
+                TimedCallback(metrics, tags, callback, enqueued_at)
+                for callback in callbacks
+            ]
+
+        await self._dispatcher.dispatch(stream, callbacks, data)
+
+    async def _on_frame(self, frame: Union[str, bytes]) -> None:
+        for callback in self._frame_callbacks:
+            callback(frame)
+
+        routed = split_stream_frame(frame)
+        if routed is not None:
+            stream, payload = routed
+            decoder = self._stream_decoders.get(stream, self._client._json_loads)
+            await self._dispatch(stream, decoder(payload))
+            return
+
+        data = self._client._json_loads(frame)
+        if "id" in data and data["id"] in self._listeners:
+            future = self._listeners[data["id"]]
+            if not future.cancelled():
+                future.set_result(data)
+            self._listeners.pop(data["id"])
+        elif "error" in data:
+            raise BinanceWebsocketException(data["error"])
+        elif "stream" in data:
+            await self._dispatch(data["stream"], data["data"])
+
+    async def _replay(self, source: Replay) -> None:
+        self._connected_at = get_timestamp()
+        self._open_event.set()
+        try:
+            await source.run(self._on_frame)
+            await self._dispatcher.join()
+        finally:
+            self._open_event.clear()
+
+    async def _starter(self, url: str, url_streams: List[str]) -> None:
+        if self._source is not None:
+            await self._replay(self._source)
+            return
+
+        self._connecting = True
         try:
             async with self._client._session.ws_connect(
-                url=self._websocket_url, heartbeat=180
+                url=url, heartbeat=180, **WS_CONNECT_OPTIONS
             ) as ws:
                 self._conn = ws
-
+                self._connecting = False
+                self._connected_at = get_timestamp()
                 self._open_event.set()
-                self._close_event.clear()
+
+                # Streams beyond the url and the ones changed during the handshake
+                in_url = set(url_streams)
+                streams = [s for s in self._stream_callbacks if s not in in_url]
+                removed = [s for s in url_streams if s not in self._stream_callbacks]
+                if streams or removed or self._disconnected_at is not None:
+                    task = asyncio.ensure_future(self._restore(streams, removed))
+                    task.add_done_callback(self._handle_task_exception)
 
                 async for msg in ws:
                     if msg.type == WSMsgType.TEXT:
-                        data = msg.json(loads=self._client._json_loads)
-
-                        if "error" in data:
-                            raise Exception(
-                                f"Websocket error code {data['error']['code']}. {data['error']['msg']}"
-                            )
-                        elif "id" in data and data["id"] in self._listeners:
-                            future = self._listeners[data["id"]]
-                            if not future.cancelled():
-                                future.set_result(data)
-                            self._listeners.pop(data["id"])
-                        elif "stream" in data:
-                            for callback in self._stream_callbacks[data["stream"]]:
-                                task = asyncio.create_task(callback(data["data"]))
-                                task.add_done_callback(self._handle_task_exception)
+                        await self._on_frame(msg.data)
         finally:
+            self._conn = None
+            self._connecting = False
             self._last_id = 1
+            for future in self._listeners.values():
+                if not future.done():
+                    future.set_exception(Exception("Websocket connection is closed"))
             self._listeners.clear()
-            self._stream_callbacks.clear()
 
-            self._close_event.set()
             self._open_event.clear()
 
+    def _handle_task_exception(self, f: asyncio.Future) -> None:
+        if not f.cancelled():
+            exp = f.exception()
+            if exp is not None:
+                self._handle_exception(exp)
+
+    async def _runner(self) -> None:
+        attempt = 0
+        # The dispatcher outlives reconnects, so callbacks and queued messages survive
+        await self._dispatcher.start()
+        try:
+            while True:
+                connected_at = self._connected_at
+                try:
+                    await self._starter(*self._connection_url())
+                except Exception as e:
+                    if self._connected_at is None:
+                        # The first connection error is raised from start
+                        raise
+                    self._exception = e
+
+                if self._connected_at != connected_at:
+                    attempt = 0
+
+                if not self._reconnect or self._stopping or self._source is not None:
+                    return
+                if self._exception is not None and not isinstance(
+                    self._exception, CONNECTION_ERRORS
+                ):
+                    # Errors sent by the exchange or raised by callbacks are final
+                    return
+
+                self._exception = None
+                if self._disconnected_at is None:
+                    self._disconnected_at = get_timestamp()
+
+                delay = min(
+                    self._reconnect_delay * 2**attempt, self._max_reconnect_delay
+                )
+                attempt += 1
+                await asyncio.sleep(delay * random.uniform(0.5, 1))
+                if self._metrics is not None:
+                    self._metrics.increment("websocket_reconnects")
+        finally:
+            await self._dispatcher.stop()
+            self._connected_at = None
+            self._disconnected_at = None
+            self._stream_callbacks.clear()
+            self._close_event.set()
+
     async def start(self) -> None:
-        if not self.closed:
+        if self._runner_task is not None and not self._runner_task.done():
             return
 
-        asyncio.ensure_future(self._starter())
+        self._exception = None
+        self._stopping = False
+        self._close_event.clear()
+        self._runner_task = asyncio.ensure_future(self._runner())
+        opened = asyncio.ensure_future(self._open_event.wait())
 
-        await self._open_event.wait()
+        await asyncio.wait(
+            [self._runner_task, opened], return_when=asyncio.FIRST_COMPLETED
+        )
+        if not opened.done():
+            # The connection could not be established
+            opened.cancel()
+            self._runner_task.result()
 
     async def stop(self) -> None:
-        if self.closed:
+        if self._runner_task is None or self._runner_task.done():
             return
 
-        await self._conn.close()  # type:ignore
+        self._stopping = True
+        if self.closed:
+            # Waiting before the next reconnect attempt
+            self._runner_task.cancel()
+        else:
+            await self._conn.close()  # type:ignore
 
     async def wait_stop(self) -> None:
         if not self._close_event.is_set():
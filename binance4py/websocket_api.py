@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+from binance4py.exception import BinanceWebsocketException
+from binance4py.utils import create_query_dict
+from binance4py.websocket import Websocket
+
+WEBSOCKET_API_URL = "wss://ws-api.binance.{}:443/ws-api/v3"
+WEBSOCKET_API_TEST_URL = "wss://testnet.binance.vision/ws-api/v3"
+
+# (http method, endpoint name) to websocket api method
+WEBSOCKET_API_METHODS = {
+    ("POST", "create_test_order"): "order.test",
+    ("POST", "create_order"): "order.place",
+    ("DELETE", "cancel_order"): "order.cancel",
+    ("DELETE", "cancel_all_open_orders"): "openOrders.cancelAll",
+    ("GET", "query_order"): "order.status",
+    ("POST", "replace_order"): "order.cancelReplace",
+    ("GET", "open_orders"): "openOrders.status",
+    ("GET", "all_orders"): "allOrders",
+    ("POST", "create_oco_order"): "orderList.place",
+    ("DELETE", "cancel_oco_order"): "orderList.cancel",
+    ("GET", "query_oco_order"): "orderList.status",
+    ("GET", "query_all_oco_order"): "allOrderLists",
+    ("GET", "query_open_oco_order"): "openOrderLists.status",
+    ("GET", "account_info"): "account.status",
+    ("GET", "account_trade_list"): "myTrades",
+    ("GET", "order_rate_limit"): "account.rateLimits.orders",
+}
+
+
+class WebsocketApi(Websocket):
+    __slots__ = ["_methods", "_start_lock"]
+
+    def __init__(self, client) -> None:
+        super().__init__(client, reconnect=True)
+        self._websocket_url = (
+            WEBSOCKET_API_URL.format(self._client._tld)
+            if not self._client._testnet
+            else WEBSOCKET_API_TEST_URL
+        )
+
+        self._methods: Dict[Tuple[str, str], str] = {
+            (http_method, getattr(self._client._endpoints, name)): method
+            for (http_method, name), method in WEBSOCKET_API_METHODS.items()
+        }
+        self._start_lock = asyncio.Lock()
+
+    def method_for(self, http_method: str, endpoint: str) -> Optional[str]:
+        return self._methods.get((http_method, endpoint))
+
+    def _sign(self, params: Dict[str, Any], endpoint: str) -> None:
+        if self._client._api_key is None:
+            raise Exception("Api key cannot be None")
+        if self._client._signer is None:
+            raise Exception("Api secret cannot be None")
+
+        params["apiKey"] = self._client._api_key
+        recv_window = self._client._recv_windows.get(
+            endpoint, self._client._recv_window
+        )
+        if recv_window is not None:
+            params["recvWindow"] = recv_window
+        params["timestamp"] = self._client._timestamp()
+
+        # The payload is the query string of the parameters sorted by name
+        params["signature"] = self._client._signer.sign(
+            "&".join(f"{k}={v}" for k, v in sorted(params.items())).encode("utf-8")
+        )
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str = "",
+        signed: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        if self.closed:
+            async with self._start_lock:
+                await self.start()
+            # The connection may be reconnecting
+            await asyncio.wait_for(self._open_event.wait(), 10)
+
+        params = create_query_dict(params) if params is not None else {}
+        if signed:
+            self._sign(params, endpoint)
+
+        data = await self._request(method, params or None)
+
+        if self._client._rate_limiter is not None and "rateLimits" in data:
+            self._client._rate_limiter.update_rate_limits(data["rateLimits"])
+        if "error" in data:
+            raise BinanceWebsocketException(data["error"])
+        return data["result"]
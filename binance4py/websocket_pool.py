@@ -0,0 +1,237 @@
+import asyncio
+import zlib
+from typing import Callable, Dict, List, Optional, Union
+
+from binance4py.dispatch import Dispatcher
+from binance4py.websocket import Streams, Websocket
+
+MAX_STREAMS_PER_CONNECTION = 1024
+
+
+class WebsocketPool(Streams):
+    __slots__ = [
+        "_shards",
+        "_balance",
+        "_max_streams",
+        "_stream_shards",
+        "_shard_loads",
+        "_stream_callbacks",
+        "_supervisors",
+        "_closing",
+        "_close_event",
+        "_exception",
+    ]
+
+    def __init__(
+        self,
+        client,
+        shards: int = 4,
+        balance: str = "hash",
+        max_streams: int = MAX_STREAMS_PER_CONNECTION,
+        reconnect_delay: float = 1,
+        dispatcher: Optional[Callable[[], Dispatcher]] = None,
+    ) -> None:
+        super().__init__(client)
+        if balance not in ("hash", "load"):
+            raise Exception(f"Unknown balance mode: {balance}")
+
+        # Every shard reconnects and restores its own streams
+        self._shards = [
+            Websocket(
+                client,
+                dispatcher() if dispatcher is not None else None,
+                reconnect=True,
+                reconnect_delay=reconnect_delay,
+            )
+            for _ in range(shards)
+        ]
+        for shard in self._shards:
+            shard._stream_decoders = self._stream_decoders
+        self._balance = balance
+        self._max_streams = max_streams
+
+        self._stream_shards: Dict[str, Websocket] = {}
+        # Streams per shard, kept with _stream_shards so choosing a shard is cheap
+        self._shard_loads: Dict[Websocket, int] = {shard: 0 for shard in self._shards}
+        self._stream_callbacks: Dict[str, List[Callable]] = {}
+        self._supervisors: List[asyncio.Future] = []
+        self._closing = False
+        self._close_event = asyncio.Event()
+        self._exception: Optional[BaseException] = None
+
+    @property
+    def closed(self) -> bool:
+        return not self._supervisors
+
+    @property
+    def shards(self) -> List[Websocket]:
+        return self._shards
+
+    def _add_stream(self, stream: str, shard: Websocket) -> None:
+        self._stream_shards[stream] = shard
+        self._shard_loads[shard] += 1
+
+    def _remove_stream(self, stream: str) -> Optional[Websocket]:
+        shard = self._stream_shards.pop(stream, None)
+        if shard is not None:
+            self._shard_loads[shard] -= 1
+        return shard
+
+    def _choose_shard(self, stream: str) -> Websocket:
+        loads = [self._shard_loads[shard] for shard in self._shards]
+
+        if self._balance == "hash":
+            # Streams of one symbol share a shard so their relative order is kept
+            start = zlib.crc32(stream.split("@", 1)[0].encode()) % len(self._shards)
+            for i in range(len(self._shards)):
+                index = (start + i) % len(self._shards)
+                if loads[index] < self._max_streams:
+                    return self._shards[index]
+        else:
+            candidates = [i for i, load in enumerate(loads) if load < self._max_streams]
+            if candidates:
+                index = min(
+                    candidates,
+                    key=lambda i: (self._shards[i].message_count, loads[i]),
+                )
+                return self._shards[index]
+
+        raise Exception("All websocket connections reached the stream limit")
+
+    def shard_of(self, stream: str) -> Optional[Websocket]:
+        return self._stream_shards.get(stream)
+
+    async def subscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        shard_streams: Dict[Websocket, List[str]] = {}
+        for stream in dict.fromkeys(streams):
+            shard = self._stream_shards.get(stream)
+            if shard is None:
+                shard = self._choose_shard(stream)
+                self._add_stream(stream, shard)
+            shard_streams.setdefault(shard, []).append(stream)
+
+        # Every shard gets one batch
+        results = await asyncio.gather(
+            *(
+                shard.subscribe_callback(batch, callback)
+                for shard, batch in shard_streams.items()
+            ),
+            return_exceptions=True,
+        )
+        exception = None
+        for batch, result in zip(shard_streams.values(), results):
+            for stream in batch:
+                if isinstance(result, BaseException):
+                    if stream not in self._stream_callbacks:
+                        self._remove_stream(stream)
+                else:
+                    self._stream_callbacks.setdefault(stream, []).append(callback)
+            if isinstance(result, BaseException):
+                exception = result
+        if exception is not None:
+            raise exception
+
+    async def unsubscribe_callback(
+        self, streams: Union[str, List[str]], callback: Callable
+    ) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        last_streams = []
+        for stream in streams:
+            callbacks = self._stream_callbacks.get(stream)
+            if callbacks is None:
+                continue
+            if len(callbacks) <= 1:
+                last_streams.append(stream)
+            else:
+                await self._stream_shards[stream].unsubscribe_callback(stream, callback)
+                try:
+                    callbacks.remove(callback)
+                except ValueError:
+                    pass
+
+        if last_streams:
+            await self.unsubscribe_all_callbacks(last_streams)
+
+    async def unsubscribe_all_callbacks(self, streams: Union[str, List[str]]) -> None:
+        if isinstance(streams, str):
+            streams = [streams]
+
+        shard_streams: Dict[Websocket, List[str]] = {}
+        for stream in streams:
+            shard = self._remove_stream(stream)
+            self._stream_callbacks.pop(stream, None)
+            if shard is not None:
+                shard_streams.setdefault(shard, []).append(stream)
+
+        await asyncio.gather(
+            *(
+                shard.unsubscribe_all_callbacks(batch)
+                for shard, batch in shard_streams.items()
+            )
+        )
+
+    async def subscriptions(self) -> List[str]:
+        results = await asyncio.gather(
+            *(shard.subscriptions() for shard in self._shards if not shard.closed)
+        )
+        return [stream for result in results for stream in result]
+
+    def add_gap_callback(self, callback: Callable) -> None:
+        for shard in self._shards:
+            shard.add_gap_callback(callback)
+
+    def remove_gap_callback(self, callback: Callable) -> None:
+        for shard in self._shards:
+            shard.remove_gap_callback(callback)
+
+    def add_frame_callback(self, callback: Callable) -> None:
+        for shard in self._shards:
+            shard.add_frame_callback(callback)
+
+    def remove_frame_callback(self, callback: Callable) -> None:
+        for shard in self._shards:
+            shard.remove_frame_callback(callback)
+
+    async def _supervise(self, shard: Websocket) -> None:
+        try:
+            await shard.wait_stop()
+        except Exception as e:
+            self._exception = e
+
+        # A shard only stops for good on errors, which stop the whole pool
+        if not self._closing:
+            asyncio.ensure_future(self.stop())
+
+    async def start(self) -> None:
+        if not self.closed:
+            return
+
+        self._closing = False
+        self._exception = None
+        self._close_event.clear()
+        await asyncio.gather(*(shard.start() for shard in self._shards))
+        self._supervisors = [
+            asyncio.ensure_future(self._supervise(shard)) for shard in self._shards
+        ]
+
+    async def stop(self) -> None:
+        self._closing = True
+        await asyncio.gather(*(shard.stop() for shard in self._shards))
+        await asyncio.gather(*self._supervisors)
+        self._supervisors = []
+        self._stream_shards.clear()
+        self._shard_loads = {shard: 0 for shard in self._shards}
+        self._stream_callbacks.clear()
+        self._close_event.set()
+
+    async def wait_stop(self) -> None:
+        await self._close_event.wait()
+        if self._exception is not None:
+            raise self._exception
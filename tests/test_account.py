@@ -0,0 +1,157 @@
+import asyncio
+
+from binance4py.account import AccountState
+
+
+def execution_report(order_id, status, update_time, client_order_id="a"):
+    return {
+        "e": "executionReport",
+        "s": "BTCUSDT",
+        "i": order_id,
+        "g": -1,
+        "c": client_order_id,
+        "C": "",
+        "p": "100.00",
+        "q": "1.00",
+        "z": "0.00",
+        "Z": "0.00",
+        "X": status,
+        "x": "NEW",
+        "f": "GTC",
+        "o": "LIMIT",
+        "S": "BUY",
+        "P": "0.00",
+        "F": "0.00",
+        "O": update_time,
+        "T": update_time,
+        "w": True,
+        "Q": "0.00",
+    }
+
+
+def rest_order(order_id, status, update_time):
+    return {
+        "symbol": "BTCUSDT",
+        "orderId": order_id,
+        "clientOrderId": str(order_id),
+        "status": status,
+        "updateTime": update_time,
+    }
+
+
+class FakeSpot:
+    def __init__(self):
+        self.balances = [{"asset": "BTC", "free": "1", "locked": "0"}]
+        self.open = []
+        self.queried = {}
+        self.error = None
+
+    async def account_info(self):
+        if self.error is not None:
+            raise self.error
+        return {"balances": self.balances, "updateTime": 100}
+
+    async def open_orders(self):
+        return self.open
+
+    async def query_order(self, symbol, order_id):
+        return self.queried[order_id]
+
+
+class FakeWebsocket:
+    def __init__(self):
+        self.gap_callbacks = []
+
+    def add_gap_callback(self, callback):
+        self.gap_callbacks.append(callback)
+
+    def remove_gap_callback(self, callback):
+        self.gap_callbacks.remove(callback)
+
+    async def user_data(self, callback):
+        return "listen-key"
+
+    async def unsubscribe_callback(self, stream, callback):
+        pass
+
+
+class FakeClient:
+    def __init__(self):
+        self.spot = FakeSpot()
+        self.ws = FakeWebsocket()
+
+    def _timestamp(self):
+        return 1000
+
+
+def test_events_update_orders_and_balances():
+    account = AccountState(FakeClient())
+    account._apply(execution_report(1, "NEW", 10))
+    assert [o["orderId"] for o in account.open_orders("BTCUSDT")] == [1]
+    assert account.order_by_client_id("a")["status"] == "NEW"
+
+    account._apply(execution_report(1, "FILLED", 20))
+    # An older event must not reopen the order
+    account._apply(execution_report(1, "PARTIALLY_FILLED", 15))
+    assert account.open_orders() == []
+    assert account.order(1)["status"] == "FILLED"
+
+    account._apply(
+        {
+            "e": "outboundAccountPosition",
+            "u": 50,
+            "B": [{"a": "BTC", "f": "2", "l": "1"}],
+        }
+    )
+    account._apply({"e": "balanceUpdate", "a": "BTC", "d": "0.5", "T": 40})
+    assert account.balance("BTC") == {"asset": "BTC", "free": "2", "locked": "1"}
+    account._apply({"e": "balanceUpdate", "a": "BTC", "d": "0.5", "T": 60})
+    assert account.balance("BTC")["free"] == "2.5"
+
+
+def test_closed_history_is_bounded():
+    account = AccountState(FakeClient(), history=2)
+    for i in range(3):
+        account._apply(execution_report(i, "CANCELED", 10, str(i)))
+    assert account.order(0) is None
+    assert account.order_by_client_id("0") is None
+    assert account.order(2)["status"] == "CANCELED"
+
+
+def test_resync_closes_orders_missing_from_the_snapshot():
+    async def main():
+        client = FakeClient()
+        account = AccountState(client)
+        account._update_order(rest_order(1, "NEW", 10))
+        account._update_order(rest_order(2, "NEW", 10))
+        client.spot.open = [rest_order(2, "NEW", 10)]
+        client.spot.queried[1] = rest_order(1, "FILLED", 500)
+        await account.resync()
+        return account
+
+    account = asyncio.run(main())
+    assert account.synced
+    assert [o["orderId"] for o in account.open_orders()] == [2]
+    assert account.order(1)["status"] == "FILLED"
+    assert account.balance("BTC")["free"] == "1"
+
+
+def test_failed_gap_resync_leaves_the_account_unsynced():
+    async def main():
+        client = FakeClient()
+        account = AccountState(client, reconcile_interval=0.01)
+        await account.start()
+        assert account.synced
+
+        client.spot.error = Exception("Service unavailable")
+        # Must not raise into the websocket that called it
+        await client.ws.gap_callbacks[0](1, 2)
+        synced_after_gap = account.synced
+
+        client.spot.error = None
+        await asyncio.sleep(0.05)
+        synced_after_reconcile = account.synced
+        await account.stop()
+        return synced_after_gap, synced_after_reconcile
+
+    assert asyncio.run(main()) == (False, True)
@@ -0,0 +1,201 @@
+import asyncio
+
+import pytest
+
+from binance4py.candles import CandleBuilder, CandleSeries, seed_interval
+
+
+def kline(open_time, o, h, l, c, volume=1.0, trades=1):
+    return [open_time, str(o), str(h), str(l), str(c), str(volume), 0, "0", trades]
+
+
+class FakeMarket:
+    def __init__(self, fail=0):
+        self.fail = fail
+        self.requests = []
+        self.trades = []
+        # Stream trades received while the aggregate trades are downloaded
+        self.stream = []
+        self.builder = None
+
+    async def iter_klines(self, symbol, interval, start_time, end_time):
+        self.requests.append((interval, start_time, end_time))
+        if self.fail:
+            self.fail -= 1
+            raise OSError()
+        step = {"1s": 1000, "1m": 60000}[interval]
+        for t in range(start_time - start_time % step, end_time + 1, step):
+            yield kline(t, 1, 2, 0.5, 1.5)
+
+    async def iter_aggregate_trades(self, symbol, start_time, end_time):
+        for event in self.stream:
+            await self.builder._on_trade(event)
+        for row in self.trades:
+            if start_time <= row["T"] <= end_time:
+                yield row
+
+
+class FakeClient:
+    def __init__(self, now, fail=0):
+        self.market = FakeMarket(fail)
+        self.now = now
+
+    def _timestamp(self):
+        return self.now
+
+
+def trade(price, quantity, time):
+    return {"p": str(price), "q": str(quantity), "T": time}
+
+
+def agg_trade(trade_id, price, quantity, time):
+    return {
+        "a": trade_id,
+        "p": str(price),
+        "q": str(quantity),
+        "f": trade_id,
+        "l": trade_id,
+        "T": time,
+    }
+
+
+def make_builder(intervals, now, capacity=3, fail=0, callback=None):
+    builder = CandleBuilder(
+        FakeClient(now), "btcusdt", intervals, capacity, callback, resync_delay=0
+    )
+    builder._client.market.fail = fail
+    # Started without a websocket
+    builder._stream = "btcusdt@aggTrade"
+    return builder
+
+
+def test_seed_interval():
+    assert seed_interval("1m") == "1m"
+    assert seed_interval("90m") == "30m"
+    assert seed_interval("7s") == "1s"
+    assert seed_interval("2w") == "1w"
+
+
+def test_update_builds_bars():
+    series = CandleSeries("1s", capacity=3)
+    assert series.update(10, 1, 0) == 0
+    series.update(12, 2, 500)
+    series.update(9, 1, 900)
+    assert series.current == (0, 10, 12, 9, 9, 4, 43, 3)
+
+    assert series.update(11, 1, 1000) == 1
+    assert len(series) == 1
+    assert series[-1] == (0, 10, 12, 9, 9, 4, 43, 3)
+    assert series.update(5, 1, 999) == 0
+
+
+def test_update_fills_empty_bars():
+    series = CandleSeries("1s", capacity=5)
+    series.update(10, 1, 0)
+    assert series.update(11, 1, 3000) == 3
+    assert [c.open_time for c in series] == [0, 1000, 2000]
+    assert [c.close for c in series] == [10, 10, 10]
+    assert series[-1].volume == 0
+
+
+def test_gap_longer_than_capacity_reports_what_fits():
+    series = CandleSeries("1s", capacity=3)
+    series.update(10, 1, 0)
+    closed = series.update(11, 1, 10000)
+    assert closed == len(series) == 3
+    assert [c.open_time for c in series] == [7000, 8000, 9000]
+    for i in range(closed, 0, -1):
+        series[-i]
+
+
+def test_ring_buffer_keeps_the_newest_bars():
+    series = CandleSeries("1s", capacity=3)
+    for t in range(6):
+        series.update(t, 1, t * 1000)
+    assert [c.open_time for c in series] == [2000, 3000, 4000]
+    assert list(series.to_dict()["open_time"]) == [2000, 3000, 4000]
+
+
+def test_seed_aggregates_smaller_klines():
+    series = CandleSeries("2s", capacity=3)
+    series.seed(
+        [kline(0, 1, 2, 0.5, 1.5), kline(1000, 1.5, 3, 1, 2), kline(2000, 2, 2, 2, 2)]
+    )
+    assert len(series) == 1
+    assert series[0] == (0, 1, 3, 0.5, 2, 2, 0, 2)
+    assert series.current.open_time == 2000
+
+
+def test_callback_after_a_long_gap():
+    closed = []
+
+    async def callback(builder, series, candle):
+        closed.append(candle.open_time)
+
+    async def main():
+        builder = make_builder(["1s"], 0, callback=callback)
+        await builder.resync()
+        await builder._on_trade(trade(1, 1, 500))
+        await builder._on_trade(trade(1, 1, 10000))
+
+    asyncio.run(main())
+    assert closed == [7000, 8000, 9000]
+
+
+def test_resync_downloads_a_seed_interval_once():
+    async def main():
+        builder = make_builder(["1s", "5s", "7s", "1m", "2m"], 630500)
+        await builder.resync()
+        return builder
+
+    builder = asyncio.run(main())
+    # The seconds of the open minute come last
+    assert builder._client.market.requests[2:] == [("1s", 600000, 629999)]
+    assert [r[0] for r in builder._client.market.requests[:2]] == ["1s", "1m"]
+    assert builder.synced
+    assert len(builder["7s"]) == 3
+    assert builder["2m"][-1].open_time == 480000
+    assert builder["2m"].current.open_time == 600000
+
+
+def test_resync_is_retried_after_a_failure():
+    async def main():
+        builder = make_builder(["1s"], 10000, fail=1)
+        with pytest.raises(OSError):
+            await builder.resync()
+        assert not builder.synced
+        assert not builder._buffer
+
+        builder._client.now = 20000
+        await builder._on_trade(trade(1, 1, 20500))
+        return builder
+
+    builder = asyncio.run(main())
+    assert builder.synced
+    assert len(builder._client.market.requests) == 2
+    assert builder["1s"][-1].open_time == 19000
+
+
+def test_resync_counts_every_trade_once():
+    async def main():
+        builder = make_builder(["1s", "1m"], 70500)
+        market = builder._client.market
+        market.builder = builder
+        market.trades = [agg_trade(1, 2, 1, 70100), agg_trade(2, 3, 1, 70400)]
+        market.stream = [
+            agg_trade(0, 9, 1, 69900),
+            agg_trade(2, 3, 1, 70400),
+            agg_trade(3, 4, 1, 70600),
+        ]
+        await builder.resync()
+        return builder
+
+    builder = asyncio.run(main())
+    # The kline of the open second is not used, its trades come from the
+    # download and the stream without the ones that are in both
+    assert builder["1s"][-1].open_time == 69000
+    assert builder["1s"].current == (70000, 2, 4, 2, 4, 3, 9, 3)
+    current = builder["1m"].current
+    assert current.open_time == 60000
+    # Ten second klines of one trade each and the three trades
+    assert (current.volume, current.trades) == (13, 13)
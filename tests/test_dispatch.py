@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from binance4py.dispatch import Dispatcher, QueueDispatcher
+
+
+def test_dispatcher_must_implement_dispatch():
+    class Incomplete(Dispatcher):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_queue_dispatcher_keeps_stream_order():
+    async def main():
+        received = []
+
+        async def callback(data):
+            await asyncio.sleep(0)
+            received.append(data)
+
+        dispatcher = QueueDispatcher(workers=2)
+        await dispatcher.start()
+        for i in range(10):
+            await dispatcher.dispatch("a@trade", [callback], ("a", i))
+            await dispatcher.dispatch("b@trade", [callback], ("b", i))
+        await dispatcher.join()
+        await dispatcher.stop()
+        return received
+
+    received = asyncio.run(main())
+    for stream in "ab":
+        assert [i for s, i in received if s == stream] == list(range(10))
@@ -0,0 +1,26 @@
+import asyncio
+import os
+
+import pytest
+
+from binance4py.fanout import FanoutPublisher, FanoutSubscriber
+
+
+class FailingWebsocket:
+    async def subscribe_callback(self, stream, callback):
+        raise Exception("Websocket is closed")
+
+
+def test_failed_publish_releases_the_ring():
+    prefix = f"b4p-test-{os.getpid()}"
+
+    async def main():
+        publisher = FanoutPublisher(FailingWebsocket(), prefix, capacity=16)
+        with pytest.raises(Exception, match="closed"):
+            await publisher.publish("btcusdt@trade")
+        return publisher
+
+    publisher = asyncio.run(main())
+    assert publisher.streams == []
+    with pytest.raises(FileNotFoundError):
+        FanoutSubscriber(["btcusdt@trade"], prefix)
@@ -0,0 +1,172 @@
+import json
+import math
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
+
+import pytest
+
+from binance4py.fixedpoint import ExchangeFixed, fixed_decimals, fixed_type
+from binance4py.orderbook import OrderBookSide
+
+F = fixed_decimals(2)
+
+
+def test_parse():
+    assert F("12").units == 1200
+    assert F("1.5").units == 150
+    assert F("1.25").units == 125
+    assert F("1.50000000").units == 150
+    assert F("-0.05").units == -5
+    assert F(1.1).units == 110
+    assert F(3).units == 300
+    assert F(Decimal("2.5")).units == 250
+    assert F("1.125").units == 112
+    assert F("1.135").units == 114
+    assert F("1.121", ROUND_UP).units == 113
+
+
+def test_str():
+    assert str(F("1.50")) == "1.5"
+    assert str(F("-0.05")) == "-0.05"
+    assert str(F("12")) == "12"
+    assert repr(F("0.1")) == "Fixed2('0.1')"
+    assert f"{F('1.5'):.3f}" == "1.500"
+
+
+def test_round_to_tick():
+    Price = fixed_type(Decimal("0.05"))
+    assert Price("1.12").round() == Price("1.1")
+    assert Price("1.13").round() == Price("1.15")
+    assert Price("1.14").round(ROUND_DOWN) == Price("1.1")
+
+
+def test_add_sub():
+    a = F("1.5")
+    assert type(a + a) is F
+    assert a + a == F("3")
+    assert F("1") + 1 == F("2")
+    assert 1 + F("1") == F("2")
+    assert F("1.5") - 1 == F("0.5")
+    assert 1 - F("1.5") == F("-0.5")
+    assert sum([a, a]) == 2 * a
+    assert type(sum([a, a])) is F
+
+
+def test_mul():
+    assert F("1.5") * 2 == F("3")
+    assert 2 * F("1.5") == F("3")
+    product = F("1.5") * F("0.5")
+    assert product.decimals == 4
+    assert product == F("0.75")
+
+
+def test_div():
+    assert F("3") / 2 == F("1.5")
+    assert F("3") / F("2") == F("1.5")
+    assert type(F("3") / 2) is F
+    assert F("1") / 3 == F("0.33")
+    assert F("2") / 3 == F("0.67")
+    assert 3 / F("2") == F("1.5")
+    assert F("3") // 2 == F("1")
+    assert F("3.5") // F("1.5") == F("2")
+    assert F("3") % 2 == F("1")
+    assert F("3.5") % F("1.5") == F("0.5")
+    assert divmod(F("3.5"), F("1.5")) == (F("2"), F("0.5"))
+    with pytest.raises(ZeroDivisionError):
+        F("1") / 0
+
+
+def test_round():
+    assert round(F("3")) == 3
+    assert type(round(F("3"))) is int
+    assert round(F("2.5")) == 2
+    assert round(F("3.5")) == 4
+    assert round(F("1.26"), 1) == F("1.3")
+    assert round(F("1.26"), 2) == F("1.26")
+    assert math.trunc(F("-1.5")) == -1
+    assert math.floor(F("-1.5")) == -2
+    assert math.ceil(F("1.01")) == 2
+    assert float(F("1.5")) == 1.5
+
+
+def test_pow():
+    assert F("1.5") ** 2 == F("2.25")
+    with pytest.raises(TypeError):
+        F("1.5") ** -1
+
+
+def test_floats_are_refused():
+    with pytest.raises(TypeError):
+        F("1.5") * 0.5
+    with pytest.raises(TypeError):
+        F("1.5") + 0.5
+    with pytest.raises(TypeError):
+        F("1.5") - 0.5
+    with pytest.raises(TypeError):
+        F("1.5") / 0.5
+    with pytest.raises(TypeError):
+        F("1.5") + Decimal("0.5")
+
+
+def test_units_never_leak_into_other_numbers():
+    x = ExchangeFixed("1.5")
+    assert not isinstance(x, int)
+    with pytest.raises(TypeError):
+        0.5 + x
+    with pytest.raises(TypeError):
+        Decimal("1") + x
+    with pytest.raises(TypeError):
+        json.dumps(x)
+    assert int(x) == 1
+    assert int(-x) == -1
+    assert "%d" % x == "1"
+    assert float(x) == 1.5
+    assert 1 + x == ExchangeFixed("2.5")
+
+
+def test_compare():
+    assert F("1.5") == 1.5
+    assert F("1.5") != 150
+    assert F("3") == 3
+    assert F("1.5") < 2
+    assert F("1.5") > 1
+    assert F("1.5") <= 1.5
+    assert F("1.5") >= Decimal("1.5")
+    assert F("0.1") == Decimal("0.1")
+    # Exact like the comparison of a Decimal with a float
+    assert F("0.1") != 0.1
+    assert F("1.5") != "1.5"
+    assert not F("0")
+    with pytest.raises(TypeError):
+        F("1.5") < "2"
+
+
+def test_mixed_scales():
+    G = fixed_decimals(4)
+    assert F("1.5") == G("1.5")
+    assert F("1.5") < G("1.5001")
+    total = F("1.5") + G("0.0001")
+    assert total.decimals == 4
+    assert total == G("1.5001")
+    assert G("1.5001") - F("1.5") == G("0.0001")
+
+
+def test_hash():
+    assert hash(F("3")) == hash(3) == hash(3.0)
+    assert hash(F("1.5")) == hash(1.5) == hash(Decimal("1.5"))
+    assert hash(F("1.5")) == hash(fixed_decimals(4)("1.5"))
+    assert len({F("1.5"), fixed_decimals(4)("1.5"), 1.5}) == 1
+
+
+def test_order_book_side():
+    side = OrderBookSide(descending=True, numeric=ExchangeFixed)
+    side.load([["101.00000000", "1.00000000"], ["100.00000000", "2.00000000"]])
+    side.update(ExchangeFixed("100.5"), ExchangeFixed("3"))
+    side.update(ExchangeFixed("101"), ExchangeFixed("0"))
+    assert side.best() == (ExchangeFixed("100.5"), ExchangeFixed("3"))
+    assert type(side.best()[0]) is ExchangeFixed
+    assert side.top(2) == [
+        (ExchangeFixed("100.5"), ExchangeFixed("3")),
+        (ExchangeFixed("100"), ExchangeFixed("2")),
+    ]
+    assert side.quantity(ExchangeFixed("100")) == ExchangeFixed("2")
+    assert side.volume(ExchangeFixed("100")) == ExchangeFixed("5")
@@ -0,0 +1,136 @@
+import asyncio
+
+from binance4py.orderbook import OrderBook
+
+
+class FakeMarket:
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    async def order_book(self, symbol, limit):
+        self.calls += 1
+        snapshot = self.snapshots.pop(0)
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+
+class FakeClient:
+    def __init__(self, snapshots):
+        self.market = FakeMarket(snapshots)
+
+
+def snapshot(last_update_id, bids=(), asks=()):
+    return {
+        "lastUpdateId": last_update_id,
+        "bids": [list(level) for level in bids],
+        "asks": [list(level) for level in asks],
+    }
+
+
+def depth(first, last, bids=(), asks=()):
+    return {
+        "U": first,
+        "u": last,
+        "b": [list(level) for level in bids],
+        "a": [list(level) for level in asks],
+    }
+
+
+def make_book(snapshots, **kwargs):
+    book = OrderBook(FakeClient(snapshots), "btcusdt", resync_delay=0, **kwargs)
+    # Started without a websocket
+    book._stream = "btcusdt@depth@100ms"
+    return book
+
+
+def test_apply_updates_and_removes_levels():
+    book = make_book([snapshot(10, [("100", "1"), ("99", "2")], [("101", "3")])])
+    asyncio.run(book.resync())
+
+    assert book.synced
+    assert book._apply(depth(11, 12, [("100", "0"), ("98", "5")], [("102", "1")]))
+    assert book.best_bid() == (99.0, 2.0)
+    assert book.bids.top(2) == [(99.0, 2.0), (98.0, 5.0)]
+    assert book.asks.top(2) == [(101.0, 3.0), (102.0, 1.0)]
+    assert book.last_update_id == 12
+
+
+def test_apply_skips_old_and_rejects_gaps():
+    book = make_book([snapshot(10, [("100", "1")])])
+    asyncio.run(book.resync())
+
+    assert book._apply(depth(5, 10, [("100", "7")]))
+    assert book.best_bid() == (100.0, 1.0)
+    assert not book._apply(depth(12, 13))
+    assert book.last_update_id == 10
+
+
+def test_resync_applies_buffered_events():
+    book = make_book([snapshot(10, [("100", "1")])])
+    book._buffer.extend(
+        [depth(5, 9, [("90", "1")]), depth(10, 11, [("100", "2")]), depth(12, 12)]
+    )
+    asyncio.run(book.resync())
+
+    assert book.synced
+    assert book.last_update_id == 12
+    assert book.best_bid() == (100.0, 2.0)
+    assert not book._buffer
+
+
+def test_resync_refetches_an_old_snapshot():
+    book = make_book([snapshot(5), snapshot(10, [("100", "1")])])
+    book._buffer.append(depth(8, 11, [("100", "3")]))
+    asyncio.run(book.resync())
+
+    assert book._client.market.calls == 2
+    assert book.synced
+    assert book.best_bid() == (100.0, 3.0)
+
+
+def test_resync_recovers_after_a_failed_snapshot():
+    async def main():
+        book = make_book([OSError(), snapshot(10, [("100", "1")])])
+        try:
+            await book.resync()
+        except OSError:
+            pass
+        assert not book.synced
+
+        book._retry_at = 0
+        await book._on_depth(depth(11, 11, [("100", "2")]))
+        return book
+
+    book = asyncio.run(main())
+    assert book._client.market.calls == 2
+    assert book.synced
+    assert book.best_bid() == (100.0, 2.0)
+
+
+def test_failed_snapshot_backs_off_and_buffer_is_bounded():
+    async def main():
+        book = make_book([OSError()], buffer_size=3)
+        book._resync_delay = 60
+        await book._retry()
+        for i in range(10):
+            await book._on_depth(depth(i, i))
+        return book
+
+    book = asyncio.run(main())
+    assert book._client.market.calls == 1
+    assert not book.synced
+    assert [event["u"] for event in book._buffer] == [7, 8, 9]
+
+
+def test_gap_in_stream_resyncs():
+    async def main():
+        book = make_book([snapshot(10), snapshot(20, [("100", "1")])])
+        await book.resync()
+        await book._on_depth(depth(15, 21))
+        return book
+
+    book = asyncio.run(main())
+    assert book.synced
+    assert book.last_update_id == 21
@@ -0,0 +1,79 @@
+import asyncio
+
+from binance4py.pagination import fetch_time_window, id_windows, time_windows
+
+
+class FakeKlines:
+    # One row per millisecond, endTime can be ignored like the mock server does
+    def __init__(self, limit, respect_end=True):
+        self.limit = limit
+        self.respect_end = respect_end
+        self.requests = []
+
+    async def __call__(self, start, end):
+        self.requests.append((start, end))
+        stop = end + 1 if self.respect_end else start + self.limit
+        return [[t] for t in range(start, min(stop, start + self.limit))]
+
+
+class FakeTrades:
+    # Rows of (time, id) ordered by id, paged by time or by a from id
+    def __init__(self, rows, limit):
+        self.rows = rows
+        self.limit = limit
+        self.requests = []
+
+    async def __call__(self, start, end, from_id=None):
+        self.requests.append((start, end, from_id))
+        if from_id is not None:
+            rows = [row for row in self.rows if row["id"] >= from_id]
+        else:
+            rows = [row for row in self.rows if start <= row["time"] <= end]
+        return rows[: self.limit]
+
+
+def test_time_windows():
+    assert list(time_windows(0, 25, 10)) == [(0, 9), (10, 19), (20, 25)]
+    assert list(id_windows(5, 12, 5)) == [(5, 5), (10, 3)]
+
+
+def test_full_windows_take_one_request():
+    async def main():
+        fetch = FakeKlines(10)
+        rows = []
+        for start, end in time_windows(0, 29, 10):
+            rows += await fetch_time_window(fetch, start, end, 10, 0)
+        return fetch, rows
+
+    fetch, rows = asyncio.run(main())
+    assert [row[0] for row in rows] == list(range(30))
+    assert len(fetch.requests) == 3
+
+
+def test_window_larger_than_limit_is_paged():
+    fetch = FakeKlines(10)
+    rows = asyncio.run(fetch_time_window(fetch, 0, 24, 10, 0))
+    assert [row[0] for row in rows] == list(range(25))
+    assert fetch.requests == [(0, 24), (10, 24), (20, 24)]
+
+
+def test_server_ignoring_end_time_stops_at_the_window():
+    fetch = FakeKlines(10, respect_end=False)
+    rows = asyncio.run(fetch_time_window(fetch, 0, 14, 10, 0))
+    assert [row[0] for row in rows] == list(range(15))
+    assert len(fetch.requests) == 2
+
+
+def test_rows_sharing_a_timestamp_are_not_repeated():
+    rows = [{"time": t, "id": i} for i, t in enumerate([0, 1, 1, 1, 2, 3, 3, 4])]
+    fetch = FakeTrades(rows, 3)
+    result = asyncio.run(fetch_time_window(fetch, 0, 4, 3, "time", "id"))
+    assert result == rows
+
+
+def test_full_page_of_one_timestamp_continues_by_id():
+    rows = [{"time": t, "id": i} for i, t in enumerate([5, 5, 5, 5, 5, 5, 5, 6, 9])]
+    fetch = FakeTrades(rows, 3)
+    result = asyncio.run(fetch_time_window(fetch, 5, 8, 3, "time", "id"))
+    assert result == rows[:8]
+    assert (None, None, 3) in fetch.requests
@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+from binance4py.exception import BinanceApiException, BinanceWebsocketException
+from binance4py.pipeline import OrderPipeline
+
+
+class FakeRateLimiter:
+    def __init__(self):
+        self.delay = 0.0
+
+    def order_delay(self, orders=1):
+        return self.delay
+
+
+class FakeSpot:
+    def __init__(self):
+        self.sent = []
+        self.order_latency = 0.0
+        self.replace_error = None
+
+    async def cancel_order(self, symbol, order_id, **params):
+        self.sent.append(("cancel", order_id))
+        return {"orderId": order_id, "status": "CANCELED"}
+
+    async def create_order(self, symbol, side, type, **params):
+        self.sent.append(("new", params.get("price")))
+        await asyncio.sleep(self.order_latency)
+        return {"price": params.get("price")}
+
+    async def replace_order(self, symbol, side, type, cancel_replace_mode, **params):
+        self.sent.append(("replace", params["cancel_order_id"], params.get("price")))
+        if self.replace_error is not None:
+            raise self.replace_error
+        return {
+            "cancelResponse": {"orderId": params["cancel_order_id"]},
+            "newOrderResponse": {"price": params.get("price")},
+        }
+
+
+class FakeClient:
+    def __init__(self):
+        self.spot = FakeSpot()
+        self._rate_limiter = FakeRateLimiter()
+
+
+def make_pipeline(**kwargs):
+    return OrderPipeline(FakeClient(), **kwargs)
+
+
+def test_cancels_are_not_blocked_by_slow_orders():
+    async def main():
+        pipeline = make_pipeline(concurrency=2)
+        pipeline._client.spot.order_latency = 0.5
+        await pipeline.start()
+        orders = [
+            asyncio.ensure_future(pipeline.create_order("BTCUSDT", "BUY", "LIMIT"))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(pipeline.cancel_order("BTCUSDT", order_id=1), 0.1)
+        sent = list(pipeline._client.spot.sent)
+        await asyncio.gather(*orders)
+        await pipeline.stop()
+        return sent
+
+    assert asyncio.run(main()) == [("new", None), ("new", None), ("cancel", 1)]
+
+
+def test_orders_wait_for_the_order_limits():
+    async def main():
+        pipeline = make_pipeline()
+        pipeline._client._rate_limiter.delay = 0.05
+        await pipeline.start()
+        order = asyncio.ensure_future(pipeline.create_order("BTCUSDT", "BUY", "LIMIT"))
+        await pipeline.cancel_order("BTCUSDT", order_id=1)
+        sent = list(pipeline._client.spot.sent)
+        pipeline._client._rate_limiter.delay = 0
+        await asyncio.wait_for(order, 1)
+        await pipeline.stop()
+        return sent
+
+    assert asyncio.run(main()) == [("cancel", 1)]
+
+
+def test_merge_sends_one_replace():
+    async def main():
+        pipeline = make_pipeline(merge=True)
+        cancel = asyncio.ensure_future(pipeline.cancel_order("BTCUSDT", order_id=1))
+        await asyncio.sleep(0)
+        order = asyncio.ensure_future(
+            pipeline.create_order("BTCUSDT", "BUY", "LIMIT", price=10)
+        )
+        await asyncio.sleep(0)
+        await pipeline.start()
+        result = await asyncio.gather(cancel, order)
+        await pipeline.stop()
+        return pipeline._client.spot.sent, result
+
+    sent, (cancel, order) = asyncio.run(main())
+    assert sent == [("replace", 1, 10)]
+    assert cancel == {"orderId": 1}
+    assert order == {"price": 10}
+
+
+def test_merge_is_skipped_when_the_order_limits_are_used_up():
+    async def main():
+        pipeline = make_pipeline(merge=True)
+        pipeline._client._rate_limiter.delay = 10
+        cancel = asyncio.ensure_future(pipeline.cancel_order("BTCUSDT", order_id=1))
+        await asyncio.sleep(0)
+        order = asyncio.ensure_future(
+            pipeline.create_order("BTCUSDT", "BUY", "LIMIT", price=10)
+        )
+        await asyncio.sleep(0)
+        await pipeline.start()
+        await asyncio.wait_for(cancel, 0.1)
+        await pipeline.stop()
+        return pipeline._client.spot.sent, order
+
+    sent, order = asyncio.run(main())
+    assert sent == [("cancel", 1)]
+    assert order.cancelled()
+
+
+def test_failed_merged_cancel_still_places_the_order():
+    async def main():
+        pipeline = make_pipeline(merge=True)
+        pipeline._client.spot.replace_error = BinanceWebsocketException(
+            {"code": -2022, "msg": "Order cancel-replace failed."}
+        )
+        cancel = asyncio.ensure_future(pipeline.cancel_order("BTCUSDT", order_id=1))
+        await asyncio.sleep(0)
+        order = asyncio.ensure_future(
+            pipeline.create_order("BTCUSDT", "BUY", "LIMIT", price=10)
+        )
+        await asyncio.sleep(0)
+        await pipeline.start()
+        result = await asyncio.gather(cancel, order, return_exceptions=True)
+        await pipeline.stop()
+        return pipeline._client.spot.sent, result
+
+    sent, (cancel, order) = asyncio.run(main())
+    assert sent == [("replace", 1, 10), ("new", 10)]
+    assert isinstance(cancel, BinanceWebsocketException)
+    assert order == {"price": 10}
+
+
+class FakeResponse:
+    status = 400
+    method = "POST"
+    url = "https://api.binance.com/api/v3/order/cancelReplace"
+
+
+def run_failed_replace(error):
+    async def main():
+        pipeline = make_pipeline(merge=True)
+        pipeline._client.spot.replace_error = error
+        cancel = asyncio.ensure_future(pipeline.cancel_order("BTCUSDT", order_id=1))
+        await asyncio.sleep(0)
+        order = asyncio.ensure_future(
+            pipeline.create_order("BTCUSDT", "BUY", "LIMIT", price=10)
+        )
+        await asyncio.sleep(0)
+        await pipeline.start()
+        result = await asyncio.gather(cancel, order, return_exceptions=True)
+        await pipeline.stop()
+        return pipeline._client.spot.sent, result
+
+    return asyncio.run(main())
+
+
+def test_failed_merged_cancel_over_rest_still_places_the_order():
+    error = BinanceApiException(
+        FakeResponse(),
+        json.dumps({"code": -2022, "msg": "Order cancel-replace failed."}),
+    )
+    sent, (cancel, order) = run_failed_replace(error)
+    assert sent == [("replace", 1, 10), ("new", 10)]
+    assert cancel is error
+    assert order == {"price": 10}
+
+
+def test_failed_merged_order_still_resolves_the_cancel():
+    body = {
+        "code": -2021,
+        "msg": "Order cancel-replace partially failed.",
+        "data": {
+            "cancelResult": "SUCCESS",
+            "newOrderResult": "FAILURE",
+            "cancelResponse": {"orderId": 1, "status": "CANCELED"},
+            "newOrderResponse": {"code": -2010, "msg": "Insufficient balance."},
+        },
+    }
+    for error in (
+        BinanceApiException(FakeResponse(), json.dumps(body)),
+        BinanceWebsocketException(body),
+    ):
+        sent, (cancel, order) = run_failed_replace(error)
+        assert sent == [("replace", 1, 10)]
+        assert cancel == {"orderId": 1, "status": "CANCELED"}
+        assert order is error
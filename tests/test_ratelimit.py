@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from binance4py.client import Client
+from binance4py.pagination import throttle
+from binance4py.ratelimit import RateLimiter, RateLimitWindow
+
+
+def test_window_delays_until_the_reset():
+    window = RateLimitWindow(60, 10)
+    assert window.delay(10, 120.0) == 0
+    window.consume(8, 120.0)
+    assert window.delay(2, 130.0) == 0
+    assert window.delay(3, 130.0) == 50.0
+    # The next wall clock minute starts a new window
+    assert window.delay(10, 180.0) == 0
+    assert window.used == 0
+
+
+def test_acquire_consumes_weight_and_orders():
+    async def main():
+        limiter = RateLimiter({"1M": 100}, {"10S": 5})
+        await limiter.acquire(10)
+        await limiter.acquire(1, 2)
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert limiter.used_weight == {"1M": 11}
+    assert limiter.order_count == {"10S": 2}
+
+
+def test_cost_over_the_limit_is_refused():
+    async def main():
+        limiter = RateLimiter({"1M": 5}, {"10S": 2})
+        with pytest.raises(ValueError):
+            await limiter.acquire(6)
+        with pytest.raises(ValueError):
+            await limiter.acquire(1, 3)
+
+        async def fetch():
+            return []
+
+        with pytest.raises(ValueError):
+            await throttle(fetch, 2, weight=5)()
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert limiter.used_weight == {"1M": 0}
+
+
+def test_update_syncs_the_used_weight():
+    limiter = RateLimiter({"1M": 1200}, {"10S": 50, "1D": 160000})
+    limiter.update({"x-mbx-used-weight-1m": "300", "X-MBX-ORDER-COUNT-10S": "4"})
+    assert limiter.used_weight == {"1M": 300}
+    assert limiter.order_count == {"10S": 4, "1D": 0}
+    # Local reservations the server has not seen yet are kept
+    limiter.update({"X-MBX-USED-WEIGHT-1M": "100"})
+    assert limiter.used_weight == {"1M": 300}
+
+
+def test_from_exchange_info():
+    limiter = RateLimiter.from_exchange_info(
+        {
+            "rateLimits": [
+                {
+                    "rateLimitType": "REQUEST_WEIGHT",
+                    "interval": "MINUTE",
+                    "intervalNum": 1,
+                    "limit": 6000,
+                },
+                {
+                    "rateLimitType": "ORDERS",
+                    "interval": "SECOND",
+                    "intervalNum": 10,
+                    "limit": 100,
+                },
+                {
+                    "rateLimitType": "RAW_REQUESTS",
+                    "interval": "MINUTE",
+                    "intervalNum": 5,
+                    "limit": 61000,
+                },
+            ]
+        }
+    )
+    assert limiter.used_weight == {"1M": 0}
+    assert limiter.order_count == {"10S": 0}
+    assert limiter._weight_windows["1M"].limit == 6000
+
+
+class FailingOnceClient(Client):
+    __slots__ = ["sent"]
+
+    async def _send_request(self, method, url, signed, params, send_url=None):
+        self.sent.append(send_url)
+        if len(self.sent) == 1:
+            raise OSError("Connection refused")
+        return {}
+
+
+def test_every_failover_attempt_is_counted():
+    async def main():
+        limiter = RateLimiter({"1M": 100})
+        client = FailingOnceClient(
+            rate_limiter=limiter,
+            latency_routing=["http://a/api/", "http://b/api/"],
+        )
+        client.sent = []
+        try:
+            await client.request("GET", client._api_url + "v3/time", weight=3)
+        finally:
+            await client.close()
+        return limiter, client.sent
+
+    limiter, sent = asyncio.run(main())
+    assert sent == ["http://a/api/v3/time", "http://b/api/v3/time"]
+    assert limiter.used_weight == {"1M": 6}
@@ -0,0 +1,78 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from binance4py.recorder import Recorder, RecordingReader, SegmentWriter
+
+
+class FakeWebsocket:
+    def __init__(self):
+        self.frame_callbacks = []
+
+    def add_frame_callback(self, callback):
+        self.frame_callbacks.append(callback)
+
+    def remove_frame_callback(self, callback):
+        if callback in self.frame_callbacks:
+            self.frame_callbacks.remove(callback)
+
+    def feed(self, frame):
+        for callback in list(self.frame_callbacks):
+            callback(frame)
+
+
+def frame(stream, i):
+    return f'{{"stream":"{stream}","data":{{"i":{i}}}}}'
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "bz2", "lzma"])
+def test_recording_is_read_back(tmp_path, compression):
+    async def main():
+        ws = FakeWebsocket()
+        recorder = Recorder(ws, str(tmp_path), compression, batch_size=3)
+        await recorder.start()
+        for i in range(10):
+            ws.feed(frame("a@trade", i))
+            ws.feed(frame("b@trade", i))
+        await recorder.stop()
+
+    asyncio.run(main())
+    reader = RecordingReader(str(tmp_path))
+    assert reader.streams == ["a@trade", "b@trade"]
+    frames = [f for _, f in reader.read(streams=["b@trade"])]
+    assert frames == [frame("b@trade", i).encode() for i in range(10)]
+
+
+def test_write_error_stops_only_the_recording(tmp_path, monkeypatch):
+    def fail(self, batch):
+        raise OSError(28, "No space left on device")
+
+    async def main():
+        ws = FakeWebsocket()
+        recorder = Recorder(ws, str(tmp_path), batch_size=1, flush_interval=0.01)
+        await recorder.start()
+        monkeypatch.setattr(SegmentWriter, "write", fail)
+        for i in range(5):
+            ws.feed(frame("a@trade", i))
+            await asyncio.sleep(0.02)
+        assert isinstance(recorder.exception, OSError)
+        assert not ws.frame_callbacks
+
+        with pytest.raises(OSError):
+            await recorder.stop()
+
+    asyncio.run(main())
+
+
+def test_package_imports_without_bz2_and_lzma():
+    code = (
+        "import sys\n"
+        "sys.modules['bz2'] = sys.modules['lzma'] = None\n"
+        "import binance4py\n"
+        "binance4py.Recorder(None, '.', 'zlib')\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
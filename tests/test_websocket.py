@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+from aiohttp import WSMsgType, web
+
+from binance4py import Binance
+
+
+class SlowHandshakeServer:
+    # Keeps the handshake open until released and tracks the subscribed streams
+    def __init__(self):
+        self.requested = asyncio.Event()
+        self.release = asyncio.Event()
+        self.streams = set()
+        self._runner = None
+
+    async def _stream(self, request):
+        self.requested.set()
+        await self.release.wait()
+        self.streams = set(s for s in request.query.get("streams", "").split("/") if s)
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            data = json.loads(msg.data)
+            if data["method"] == "SUBSCRIBE":
+                self.streams.update(data["params"])
+            elif data["method"] == "UNSUBSCRIBE":
+                self.streams.difference_update(data["params"])
+            await ws.send_str(json.dumps({"result": None, "id": data["id"]}))
+        return ws
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/stream", self._stream)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{self._runner.addresses[0][1]}/stream"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+async def callback(data):
+    pass
+
+
+def test_streams_changed_while_connecting_are_subscribed():
+    async def main():
+        server = SlowHandshakeServer()
+        url = await server.start()
+        client = Binance()
+        ws = client.ws
+        ws._websocket_url = url
+        try:
+            await ws.subscribe_callback(["btcusdt@trade", "xrpusdt@trade"], callback)
+            start = asyncio.ensure_future(ws.start())
+            await server.requested.wait()
+            assert ws.closed and ws.connecting
+
+            await ws.subscribe_callback("ethusdt@trade", callback)
+            await ws.unsubscribe_all_callbacks("xrpusdt@trade")
+            server.release.set()
+            await start
+            assert not ws.connecting
+
+            for _ in range(100):
+                if server.streams == {"btcusdt@trade", "ethusdt@trade"}:
+                    break
+                await asyncio.sleep(0.01)
+            assert server.streams == {"btcusdt@trade", "ethusdt@trade"}
+            assert sorted(ws.streams) == ["btcusdt@trade", "ethusdt@trade"]
+        finally:
+            server.release.set()
+            await ws.stop()
+            await ws.wait_stop()
+            await client.close()
+            await server.stop()
+
+    asyncio.run(main())
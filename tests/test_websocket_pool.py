@@ -0,0 +1,41 @@
+import asyncio
+
+from binance4py import Binance
+from binance4py.websocket_pool import WebsocketPool
+
+
+async def callback(data):
+    pass
+
+
+def shard_loads(pool):
+    # What _shard_loads must match, counted the slow way
+    return {
+        shard: list(pool._stream_shards.values()).count(shard) for shard in pool.shards
+    }
+
+
+def test_shard_loads_follow_subscriptions():
+    async def main():
+        client = Binance()
+        pool = WebsocketPool(client, shards=2, balance="load")
+        loads = []
+        try:
+            await pool.subscribe_callback(
+                ["btcusdt@trade", "ethusdt@trade", "xrpusdt@trade"], callback
+            )
+            loads.append(pool._shard_loads == shard_loads(pool))
+            # A stream already in the pool does not count twice
+            await pool.subscribe_callback("btcusdt@trade", callback)
+            loads.append(pool._shard_loads == shard_loads(pool))
+            await pool.unsubscribe_callback("btcusdt@trade", callback)
+            await pool.unsubscribe_all_callbacks(["btcusdt@trade", "ethusdt@trade"])
+            loads.append(pool._shard_loads == shard_loads(pool))
+            loads.append(sum(pool._shard_loads.values()))
+        finally:
+            await pool.stop()
+            await client.close()
+        loads.append(sum(pool._shard_loads.values()))
+        return loads
+
+    assert asyncio.run(main()) == [True, True, True, 1, 0]